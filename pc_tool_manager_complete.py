@@ -15,39 +15,328 @@ import tempfile
 import threading
 import time
 import logging
+import logging.handlers
+import queue
+import atexit
+import functools
+import importlib
 import platform
 from tkinter import filedialog
 import subprocess
-import webbrowser
-import zipfile
-import hashlib
-import requests
-import configparser
-import ollama
-import pythoncom
-from win32com.client import Dispatch
-import win32api
-import win32con
 import random
-from typing import Dict, Optional
+import re
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Dict, NamedTuple, Optional
 
 if platform.system() == "Windows":
-    import winreg
     import ctypes
 
+
+class _LazyModule:
+    """Modulo importato solo al primo accesso a un suo attributo."""
+    __slots__ = ('_name', '_module')
+    
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+    
+    def __getattr__(self, attr):
+        module = self._module
+        if module is None:
+            module = self._module = sys.modules.get(self._name) or importlib.import_module(self._name)
+        return getattr(module, attr)
+
+
+# Moduli usati solo da funzioni specifiche (Ollama, download, COM, impostazioni):
+# non rallentano l'avvio e vengono caricati al primo utilizzo
+webbrowser = _LazyModule('webbrowser')
+zipfile = _LazyModule('zipfile')
+hashlib = _LazyModule('hashlib')
+urllib_request = _LazyModule('urllib.request')
+json = _LazyModule('json')
+configparser = _LazyModule('configparser')
+ollama = _LazyModule('ollama')
+pythoncom = _LazyModule('pythoncom')
+win32com_client = _LazyModule('win32com.client')
+win32api = _LazyModule('win32api')
+win32con = _LazyModule('win32con')
+
+# Dipendenze opzionali del monitor hardware, importate una sola volta
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# psutil non espone sensors_temperatures() su Windows
+_HAS_SENSORS_TEMPS = psutil is not None and hasattr(psutil, 'sensors_temperatures')
+
+try:
+    import wmi
+except ImportError:
+    wmi = None
+
+try:
+    import cpuinfo
+except ImportError:
+    cpuinfo = None
+
+# Parole chiave per classificare i sensori, per categoria in ordine di priorità
+_SENSOR_TYPE_KEYWORDS = {
+    'CPU': ('cpu', 'processor', 'core', 'package'),
+    'GPU': ('gpu', 'graphics', 'video', 'radeon', 'nvidia', 'geforce'),
+    'Memory': ('memory', 'ram', 'dimm'),
+    'Storage': ('storage', 'disk', 'ssd', 'hdd', 'nvme'),
+    'System': ('system', 'motherboard', 'board', 'ambient'),
+}
+
+# Un'unica regex per categoria: una scansione in C invece di un test per parola chiave
+_SENSOR_TYPE_PATTERNS = tuple(
+    (kind, re.compile('|'.join(map(re.escape, keywords))))
+    for kind, keywords in _SENSOR_TYPE_KEYWORDS.items()
+)
+
+# I nomi dei sensori si ripetono a ogni rescan: la classificazione viene memorizzata
+_SENSOR_TYPE_CACHE: Dict[str, str] = {}
+
+# Livello di stato della ventola per percentuale di velocità 0-100: oltre 80 'High', oltre 60 'Medium'
+_FAN_STATUS_NAMES = ('Normal', 'Medium', 'High')
+_FAN_STATUS_LEVEL_BY_PCT = tuple(0 if pct <= 60 else 1 if pct <= 80 else 2 for pct in range(101))
+
+# Ventole simulate restituite da detect_fans, in sola lettura
+_SIMULATED_FANS = MappingProxyType({
+    'cpu_fan': MappingProxyType({
+        'name': 'CPU Fan',
+        'current_rpm': 1200,
+        'current_speed': 60,
+        'max_rpm': 2000,
+        'status': 'Normal',
+        'type': 'CPU',
+        'controllable': True
+    }),
+    'case_fan': MappingProxyType({
+        'name': 'Case Fan',
+        'current_rpm': 800,
+        'current_speed': 40,
+        'max_rpm': 1500,
+        'status': 'Normal',
+        'type': 'Case',
+        'controllable': True
+    }),
+    'gpu_fan': MappingProxyType({
+        'name': 'GPU Fan',
+        'current_rpm': 1000,
+        'current_speed': 50,
+        'max_rpm': 3000,
+        'status': 'Normal',
+        'type': 'GPU',
+        'controllable': True
+    }),
+})
+
+# Riga "Nome : valore" dell'output dei sensori termici, con il primo numero del valore
+_THERMAL_LINE_RE = re.compile(r'^([^:\n]+):[^\d\n]*(\d+(?:\.\d+)?)', re.MULTILINE)
+
+
+def _jitter(low: float, high: float, count: int) -> list:
+    """Estrae in un'unica passata `count` variazioni uniformi in [low, high)."""
+    span = high - low
+    rand = random.random
+    return [low + span * rand() for _ in range(count)]
+
+
+def _make_sensor(name: str, sensor_type: str, current: float, method: str,
+                 max_temp: Optional[float] = None, unit: str = '°C', **extra) -> Dict:
+    """Crea la voce di un sensore; 'max' è incluso solo se noto."""
+    sensor = {'name': name, 'type': sensor_type, 'current': current, 'method': method, 'unit': unit}
+    if max_temp is not None:
+        sensor['max'] = max_temp
+    if extra:
+        sensor.update(extra)
+    return sensor
+
+
+def _clamp_offsets(base: float, offsets: list, lo: float, hi: float) -> list:
+    """Somma `base` a ogni offset e limita i risultati a [lo, hi] in un'unica passata."""
+    return [lo if t < lo else hi if t > hi else t for t in (base + o for o in offsets)]
+
+
+def _synth_core_temps(base: float, freq_current: float, jitter: list, lo: float, hi: float) -> list:
+    """Calcola le temperature dei core: base + fattore frequenza + jitter, limitate a [lo, hi]."""
+    return _clamp_offsets(base + (freq_current / 3000.0) * 5.0, jitter, lo, hi)
+
+
+def _probe_gpu_name_dxgi() -> Optional[str]:
+    """Legge il nome della prima GPU hardware via DXGI, senza avviare PowerShell.
+    
+    Restituisce None se DXGI non è disponibile o non trova adattatori hardware.
+    """
+    if platform.system() != "Windows":
+        return None
+    
+    class _GUID(ctypes.Structure):
+        _fields_ = [('Data1', ctypes.c_ulong), ('Data2', ctypes.c_ushort),
+                    ('Data3', ctypes.c_ushort), ('Data4', ctypes.c_ubyte * 8)]
+    
+    class _DXGI_ADAPTER_DESC1(ctypes.Structure):
+        _fields_ = [('Description', ctypes.c_wchar * 128),
+                    ('VendorId', ctypes.c_uint), ('DeviceId', ctypes.c_uint),
+                    ('SubSysId', ctypes.c_uint), ('Revision', ctypes.c_uint),
+                    ('DedicatedVideoMemory', ctypes.c_size_t),
+                    ('DedicatedSystemMemory', ctypes.c_size_t),
+                    ('SharedSystemMemory', ctypes.c_size_t),
+                    ('AdapterLuidLow', ctypes.c_ulong), ('AdapterLuidHigh', ctypes.c_long),
+                    ('Flags', ctypes.c_uint)]
+    
+    def com_method(obj, index, *argtypes):
+        # Metodo `index` della vtable dell'oggetto COM
+        vtable = ctypes.cast(obj, ctypes.POINTER(ctypes.POINTER(ctypes.c_void_p))).contents
+        return ctypes.WINFUNCTYPE(ctypes.c_long, ctypes.c_void_p, *argtypes)(vtable[index])
+    
+    # IID_IDXGIFactory1 {770aae78-f26f-4dba-a829-253c83d1b387}
+    iid = _GUID(0x770aae78, 0xf26f, 0x4dba,
+                (ctypes.c_ubyte * 8)(0xa8, 0x29, 0x25, 0x3c, 0x83, 0xd1, 0xb3, 0x87))
+    factory = ctypes.c_void_p()
+    try:
+        create_factory = ctypes.windll.dxgi.CreateDXGIFactory1
+        create_factory.restype = ctypes.c_long
+        create_factory.argtypes = [ctypes.POINTER(_GUID), ctypes.POINTER(ctypes.c_void_p)]
+        if create_factory(ctypes.byref(iid), ctypes.byref(factory)) != 0 or not factory:
+            return None
+    except (OSError, AttributeError) as e:
+        logging.debug("DXGI unavailable: %s", e)
+        return None
+    
+    try:
+        enum_adapters1 = com_method(factory, 12, ctypes.c_uint, ctypes.POINTER(ctypes.c_void_p))
+        index = 0
+        # EnumAdapters1 restituisce DXGI_ERROR_NOT_FOUND dopo l'ultimo adattatore
+        while True:
+            adapter = ctypes.c_void_p()
+            if enum_adapters1(factory, index, ctypes.byref(adapter)) != 0:
+                return None
+            try:
+                desc = _DXGI_ADAPTER_DESC1()
+                get_desc1 = com_method(adapter, 10, ctypes.POINTER(_DXGI_ADAPTER_DESC1))
+                # Salta il Microsoft Basic Render Driver e gli adattatori software
+                if (get_desc1(adapter, ctypes.byref(desc)) == 0
+                        and desc.VendorId != 0x1414 and not desc.Flags & 0x2):
+                    name = desc.Description.strip()
+                    if name:
+                        return name
+            finally:
+                com_method(adapter, 2)(adapter)  # Release
+            index += 1
+    except OSError as e:
+        logging.debug("DXGI adapter enumeration failed: %s", e)
+        return None
+    finally:
+        com_method(factory, 2)(factory)  # Release
+
+
+def _probe_gpu_name_powershell() -> Optional[str]:
+    """Legge il nome della prima GPU non Microsoft tramite PowerShell/CIM."""
+    if platform.system() != "Windows":
+        return None
+    try:
+        result = subprocess.run(
+            ["powershell", "-NoProfile", "-Command", 
+             "Get-CimInstance -ClassName Win32_VideoController | Where-Object {$_.Name -notlike '*Microsoft*'} | Select-Object -First 1 -ExpandProperty Name"],
+            capture_output=True, text=True, timeout=3,
+            creationflags=subprocess.CREATE_NO_WINDOW
+        )
+    except (subprocess.SubprocessError, OSError) as e:
+        logging.debug("PowerShell GPU probe failed: %s", e)
+        return None
+    name = result.stdout.strip()
+    if result.returncode != 0 or not name:
+        return None
+    return name
+
+class _SystemSnapshot(NamedTuple):
+    """Metriche di sistema lette una sola volta per ciclo di aggiornamento dei sensori."""
+    cpu_percent: float
+    memory_percent: float
+    memory: Optional[object]
+    cpu_freq: Optional[object]
+    disk_io: Optional[object]
+    time_factor: float
+    timestamp: float
+    freq_ratio: float  # Frequenza CPU normalizzata a 3GHz, 0 se non disponibile
+    gpu_activity: float  # Attività GPU stimata da CPU e memoria, comune a tutti i sensori GPU
+
 # ============================================================================
 # UNIVERSAL HARDWARE MONITOR CLASS
 # ============================================================================
 
 class UniversalHardwareMonitor:
-    def __init__(self):
+    # Informazioni CPU invariabili durante l'esecuzione, condivise tra le istanze
+    _CPU_INFO = None
+    _PROCESSOR_NAME = None
+    
+    # Variazioni per sorgente hardware delle ventole:
+    # (carico min, ampiezza carico, scarto RPM min, ampiezza scarto)
+    _FAN_VARIATION = {
+        'cpu': (0.3, 0.5, -100.0, 300.0),  # CPU fan varies more based on load simulation
+        'gpu': (0.2, 0.7, -50.0, 200.0),   # GPU fan varies based on GPU load simulation
+        'case': (0.8, 0.4, -30.0, 80.0),   # Case fans have smaller variations
+    }
+    
+    # Intervallo minimo tra due letture della stessa sorgente, in secondi
+    _FAN_SOURCE_INTERVALS = {'cpu': 1.0, 'gpu': 1.0, 'case': 3.0}
+    
+    # Polling adattivo delle ventole: l'intervallo raddoppia finché le velocità
+    # restano entro l'isteresi (in punti percentuali) e torna al minimo a ogni cambio
+    _FAN_POLL_DEFAULTS = {
+        'poll_interval': 1.0,
+        'min_interval': 1.0,
+        'max_interval': 8.0,
+        'hysteresis': 2,
+    }
+    
+    def __init__(self, min_refresh_interval: float = 0.25, fan_config: Optional[Dict] = None):
         self.sensors = {}
         self.fan_status = {}
         self.last_cpu_check = 0
         self.last_memory_check = 0
         self.cached_cpu_percent = 0
         self.cached_memory_percent = 0
+        self.last_freq_check = float('-inf')
+        self.cached_cpu_freq = None
+        self._cpu_count_phys = 1
+        self._cpu_count_log = 1
+        self._gpu_name = "Graphics Card"  # Segnaposto finché il probe in background non termina
+        self._storage_profile = None
+        self._snapshot = None
+        self.snapshot_max_age = 0.5  # Riutilizza lo snapshot psutil se più recente di 500ms
         self.cache_duration = 2.0  # Cache for 2 seconds
+        self.sample_interval = 1.0  # Cadenza del campionamento CPU/memoria in background
+        self._sampler_stop = threading.Event()
+        self._last_full_detect = 0.0
+        self._detect_ttl = 10.0  # Rescan completo al massimo ogni 10 secondi
+        self._last_update_ts = float('-inf')
+        self._min_refresh_interval = min_refresh_interval  # Refresh dei sensori al massimo ogni 250ms
+        
+        fan_config = {**self._FAN_POLL_DEFAULTS, **(fan_config or {})}
+        self.poll_interval = fan_config['poll_interval']
+        self.min_interval = fan_config['min_interval']
+        self.max_interval = fan_config['max_interval']
+        self.fan_hysteresis = fan_config['hysteresis']
+        self._last_fan_poll = float('-inf')
+        
+        # Primo campionamento bloccante: le letture successive usano
+        # cpu_percent(interval=None), che misura il delta dall'ultima chiamata
+        try:
+            self.cached_cpu_percent = psutil.cpu_percent(interval=0.1)
+            self.cached_memory_percent = psutil.virtual_memory().percent
+            self.last_cpu_check = self.last_memory_check = time.monotonic()
+            
+            # Il numero di core non cambia durante l'esecuzione
+            self._cpu_count_phys = psutil.cpu_count(logical=False) or 1
+            self._cpu_count_log = psutil.cpu_count(logical=True) or self._cpu_count_phys
+        except Exception as e:
+            logging.debug("Initial psutil sample failed: %s", e)
         
         # Metodi di rilevamento ottimizzati per Windows
         self.detection_methods = [
@@ -58,99 +347,220 @@ class UniversalHardwareMonitor:
             self._detect_cpu_specific,
         ]
         
+        # Worker persistenti con COM inizializzato una volta per thread, così
+        # ogni worker può riusare la propria connessione WMI tra un rescan e l'altro
+        self._wmi_local = threading.local()
+        self._detection_executor = ThreadPoolExecutor(
+            max_workers=len(self.detection_methods),
+            thread_name_prefix="sensor-detect",
+            initializer=pythoncom.CoInitialize
+        )
+        
+        # Handler di aggiornamento dei sensori simulati con i limiti (min, max): chiavi esatte e prefissi
+        self._sensor_dispatch = {
+            'cpu_package': (self._update_cpu_package, 30.0, 85.0),
+            'ram_controller': (self._update_ram_controller, 25.0, 55.0),
+            'gpu_core': (self._make_gpu_handler(30.0, 25.0, -0.8, 2.3), 25.0, 80.0),
+            'gpu_memory': (self._make_gpu_handler(28.0, 20.0, -1.2, 3.2), 22.0, 75.0),
+            'gpu_vrm': (self._make_gpu_handler(32.0, 25.0, -1.0, 3.5), 25.0, 80.0),
+            'gpu_hotspot': (self._make_gpu_handler(35.0, 30.0, -0.8, 3.8), 30.0, 85.0),
+            'gpu_fan': (self._make_gpu_handler(25.0, 10.0, -1.5, 3.5), 20.0, 60.0),
+            'motherboard': (self._update_motherboard, 25.0, 40.0),
+            'chipset': (self._update_chipset, 30.0, 45.0),
+            'southbridge': (self._update_southbridge, 28.0, 42.0),
+            'vrm': (self._update_vrm, 35.0, 95.0),
+            'psu': (self._update_psu, 30.0, 65.0),
+        }
+        self._sensor_prefix_dispatch = (
+            ('cpu_core_', self._update_cpu_core, 28.0, 90.0),
+            ('cpu_thread_', self._update_cpu_thread, 27.0, 88.0),
+            ('ram_module_', self._update_ram_module, 20.0, 60.0),
+            ('ram_dimm_', self._update_ram_dimm, 22.0, 50.0),
+            ('pcie_slot_', self._update_pcie_slot, 25.0, 40.0),
+        )
+        self._sensor_keys = []
+        self._sensor_update_fns = []
+        self._sensor_indices = []
+        self._sensor_mins = array('d')
+        self._sensor_maxs = array('d')
+        self._sensor_base = array('d')
+        self._sensor_current = array('d')
+        self._sensor_output = {}
+        self._sensor_output_rows = []
+        self._layout_source = None
+        self._detected_fans = None
+        self._fan_ids = ()
+        self._fan_index = {}
+        self._fan_rows = []
+        self._fan_rpm = []
+        self._fan_speed = []
+        self._fan_status_level = []
+        self._fan_max_rpm = []
+        self._fan_base_rpm = []
+        self._fan_sources = {}
+        self._fan_source_last_poll = {}
+        self._fan_layout_source = None
+        
+        # Il nome della GPU non cambia durante l'esecuzione: lo rileviamo una volta,
+        # fuori dal percorso critico della prima costruzione dei sensori
+        threading.Thread(
+            target=self._probe_gpu_name, name="gpu-name-probe", daemon=True
+        ).start()
+        
+        # Campionamento periodico di CPU e memoria fuori dal thread della UI
+        if psutil is not None:
+            threading.Thread(
+                target=self._sample_system_load, name="hw-load-sampler", daemon=True
+            ).start()
+        
+        # Tipi di storage: le partizioni non cambiano tra un refresh e l'altro
+        self._detect_storage_profile()
+        
         # Initialize sensors
         self.detect_all_sensors()
         
         # Initialize fan status
         self._initialize_fan_status()
         
-    def detect_all_sensors(self) -> Dict[str, Dict]:
-        """Rileva tutti i sensori di temperatura disponibili."""
+    def detect_all_sensors(self, force: bool = False) -> Dict[str, Dict]:
+        """Rileva tutti i sensori di temperatura disponibili.
+        
+        Se l'ultima rilevazione è più recente di `_detect_ttl` restituisce i
+        sensori già noti; usa force=True per un rescan manuale.
+        """
+        if not force and self.sensors and time.monotonic() - self._last_full_detect < self._detect_ttl:
+            return self.sensors
+        if force:
+            self._storage_profile = None
+        
         all_sensors = {}
         
-        for method in self.detection_methods:
-            try:
-                sensors = method()
-                if sensors:
-                    all_sensors.update(sensors)
-                    logging.info(f"Found {len(sensors)} sensors using {method.__name__}")
-            except Exception as e:
-                logging.debug(f"Detection method {method.__name__} failed: {e}")
-                continue
+        # I metodi sono indipendenti e passano il tempo in attesa di WMI,
+        # PowerShell e psutil: li eseguiamo in parallelo e uniamo i risultati
+        # nell'ordine originale, così le precedenze tra chiavi non cambiano
+        futures = [self._detection_executor.submit(self._run_detection_method, method)
+                   for method in self.detection_methods]
+        for future in futures:
+            sensors = future.result()
+            if sensors:
+                all_sensors.update(sensors)
         
         # Se non trova abbastanza sensori reali, aggiungi quelli simulati
         if len(all_sensors) < 5:
-            logging.info(f"Only {len(all_sensors)} real sensors detected, adding simulated sensors")
+            logging.info("Only %s real sensors detected, adding simulated sensors", len(all_sensors))
             simulated_sensors = self._create_simulated_sensors()
             all_sensors.update(simulated_sensors)
         
         # Log dei sensori rilevati
         real_count = sum(1 for sensor in all_sensors.values() if 'Real' in sensor.get('method', ''))
         simulated_count = len(all_sensors) - real_count
-        logging.info(f"Total sensors: {len(all_sensors)} (Real: {real_count}, Simulated: {simulated_count})")
+        logging.info("Total sensors: %s (Real: %s, Simulated: %s)", len(all_sensors), real_count, simulated_count)
         
         self.sensors = all_sensors
-        logging.info(f"Total sensors detected: {len(all_sensors)}")
+        self._last_full_detect = time.monotonic()
+        logging.info("Total sensors detected: %s", len(all_sensors))
         return all_sensors
     
-    def _get_cached_cpu_percent(self):
-        """Get cached CPU percentage to avoid frequent calls."""
-        import time
-        current_time = time.time()
-        
-        if current_time - self.last_cpu_check > self.cache_duration:
+    def _run_detection_method(self, method) -> Dict[str, Dict]:
+        """Esegue un metodo di rilevamento in un thread worker."""
+        try:
+            sensors = method()
+            if sensors:
+                logging.info("Found %s sensors using %s", len(sensors), method.__name__)
+            return sensors
+        except Exception as e:
+            logging.debug("Detection method %s failed: %s", method.__name__, e)
+            return {}
+    
+    def _get_wmi(self):
+        """Restituisce la connessione WMI del thread corrente, creandola al primo uso."""
+        connection = getattr(self._wmi_local, 'connection', None)
+        if connection is None:
+            connection = wmi.WMI()
+            self._wmi_local.connection = connection
+        return connection
+    
+    def _sample_system_load(self):
+        """Aggiorna CPU e memoria a cadenza fissa sul clock monotono, senza deriva."""
+        # Riferimenti locali: evitano le lookup di attributo a ogni giro
+        cpu_percent = psutil.cpu_percent
+        virtual_memory = psutil.virtual_memory
+        monotonic = time.monotonic
+        stop = self._sampler_stop
+        
+        next_tick = monotonic()
+        while not stop.is_set():
             try:
-                import psutil
-                self.cached_cpu_percent = psutil.cpu_percent(interval=0.1)
-                self.last_cpu_check = current_time
-            except:
-                pass
-        
+                self.cached_cpu_percent = cpu_percent(interval=None)
+                self.cached_memory_percent = virtual_memory().percent
+                self.last_cpu_check = self.last_memory_check = monotonic()
+            except Exception as e:
+                logging.debug("System load sample failed: %s", e)
+            
+            next_tick += self.sample_interval
+            stop.wait(max(0.0, next_tick - monotonic()))
+    
+    def _probe_gpu_name(self):
+        """Rileva il nome reale della GPU e lo pubblica in `_gpu_name`."""
+        # PowerShell è il fallback lento, usato solo se DXGI non trova la GPU
+        probed_name = _probe_gpu_name_dxgi() or _probe_gpu_name_powershell()
+        if probed_name:
+            self._gpu_name = probed_name
+    
+    def shutdown(self):
+        """Ferma il campionatore e i worker di rilevamento."""
+        self._sampler_stop.set()
+        self._detection_executor.shutdown(wait=False)
+    
+    def _get_cached_cpu_percent(self):
+        """Get the latest CPU percentage from the background sampler."""
         return self.cached_cpu_percent
     
     def _get_cached_memory_percent(self):
-        """Get cached memory percentage to avoid frequent calls."""
-        import time
-        current_time = time.time()
+        """Get the latest memory percentage from the background sampler."""
+        return self.cached_memory_percent
+    
+    def _get_cached_cpu_freq(self, max_age: Optional[float] = None):
+        """Get cached CPU frequency to avoid frequent calls (default max age: cache_duration)."""
+        current_time = time.monotonic()
+        if max_age is None:
+            max_age = self.cache_duration
         
-        if current_time - self.last_memory_check > self.cache_duration:
+        if current_time - self.last_freq_check > max_age:
             try:
-                import psutil
-                self.cached_memory_percent = psutil.virtual_memory().percent
-                self.last_memory_check = current_time
+                self.cached_cpu_freq = psutil.cpu_freq()
+                self.last_freq_check = current_time
             except:
                 pass
         
-        return self.cached_memory_percent
+        return self.cached_cpu_freq
     
     def _detect_psutil_sensors(self) -> Dict[str, Dict]:
         """Rileva sensori usando psutil con stime avanzate."""
         sensors = {}
         
+        if psutil is None:
+            return sensors
+        
         try:
-            import psutil
-            
             # Prova psutil.sensors_temperatures() se disponibile
-            if hasattr(psutil, 'sensors_temperatures'):
-                temps = psutil.sensors_temperatures()
-                if temps:
-                    for name, entries in temps.items():
-                        for i, entry in enumerate(entries):
-                            if entry.current > 0:  # Solo temperature valide
-                                sensor_key = f"psutil_{name}_{i}"
-                                sensors[sensor_key] = {
-                                    'name': f"{name} {entry.label or f'Sensor {i+1}'}",
-                                    'type': self._classify_sensor_type(name, entry.label or ''),
-                                    'current': entry.current,
-                                    'max': entry.high or 80.0,
-                                    'method': 'psutil.sensors_temperatures',
-                                    'unit': '°C'
-                                }
+            temps = psutil.sensors_temperatures() if _HAS_SENSORS_TEMPS else None
+            for name, entries in (temps or {}).items():
+                for i, entry in enumerate(entries):
+                    if entry.current > 0:  # Solo temperature valide
+                        sensor_key = f"psutil_{name}_{i}"
+                        sensors[sensor_key] = _make_sensor(
+                            f"{name} {entry.label or f'Sensor {i+1}'}",
+                            self._classify_sensor_type(name, entry.label or ''),
+                            entry.current,
+                            'psutil.sensors_temperatures',
+                            max_temp=entry.high or 80.0
+                        )
             
             # Ottieni informazioni CPU reali
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            cpu_freq = psutil.cpu_freq()
-            cpu_count = psutil.cpu_count(logical=False)
+            cpu_percent = self._get_cached_cpu_percent()
+            cpu_freq = self._get_cached_cpu_freq()
+            cpu_count = self._cpu_count_phys
             
             # CPU Package (stima basata su carico e frequenza)
             if cpu_freq:
@@ -161,44 +571,37 @@ class UniversalHardwareMonitor:
                 cpu_temp = base_temp + freq_factor + load_factor
                 cpu_temp = max(30.0, min(85.0, cpu_temp))
                 
-                sensors['cpu_package_real'] = {
-                    'name': 'CPU Package (Real)',
-                    'type': 'CPU',
-                    'current': cpu_temp,
-                    'max': 85.0,
-                    'method': 'psutil (Load+Freq-based)',
-                    'unit': '°C'
-                }
+                sensors['cpu_package_real'] = _make_sensor(
+                    'CPU Package (Real)',
+                    'CPU',
+                    cpu_temp,
+                    'psutil (Load+Freq-based)',
+                    max_temp=85.0
+                )
             
-            # CPU Cores reali
-            for i in range(cpu_count):
-                core_load = psutil.cpu_percent(interval=0.1, percpu=True)[i] if i < len(psutil.cpu_percent(interval=0.1, percpu=True)) else cpu_percent
-                core_temp = cpu_temp + random.uniform(-2, 4) if 'cpu_package_real' in sensors else 40.0 + (core_load / 100.0) * 20.0
-                core_temp = max(28.0, min(90.0, core_temp))
-                
-                sensors[f'cpu_core_{i}_real'] = {
-                    'name': f'CPU Core {i+1} (Real)',
-                    'type': 'CPU',
-                    'current': core_temp,
-                    'max': 90.0,
-                    'method': 'psutil (Core-specific)',
-                    'unit': '°C'
-                }
+            # CPU Cores reali (il carico per core serve solo senza stima del package)
+            if 'cpu_package_real' in sensors:
+                core_temps = _clamp_offsets(cpu_temp, _jitter(-2, 4, cpu_count), 28.0, 90.0)
+            else:
+                per_core = psutil.cpu_percent(interval=0.1, percpu=True)
+                core_loads = [per_core[i] if i < len(per_core) else cpu_percent for i in range(cpu_count)]
+                core_temps = _clamp_offsets(40.0, [load / 100.0 * 20.0 for load in core_loads], 28.0, 90.0)
+            
+            for i, core_temp in enumerate(core_temps):
+                sensors[f'cpu_core_{i}_real'] = _make_sensor(
+                    f'CPU Core {i+1} (Real)',
+                    'CPU',
+                    core_temp,
+                    'psutil (Core-specific)',
+                    max_temp=90.0
+                )
             
             # Memoria RAM reale
-            memory = psutil.virtual_memory()
-            ram_usage_percent = memory.percent
+            ram_usage_percent = self._get_cached_memory_percent()
             ram_temp = 25.0 + (ram_usage_percent / 100.0) * 15.0
             ram_temp = max(20.0, min(60.0, ram_temp))
             
-            sensors['ram_real'] = {
-                'name': 'RAM (Real)',
-                'type': 'Memory',
-                'current': ram_temp,
-                'max': 60.0,
-                'method': 'psutil (Usage-based)',
-                'unit': '°C'
-            }
+            sensors['ram_real'] = _make_sensor('RAM (Real)', 'Memory', ram_temp, 'psutil (Usage-based)', max_temp=60.0)
             
             # Disco reale
             try:
@@ -214,21 +617,20 @@ class UniversalHardwareMonitor:
                     disk_temp = base_disk_temp + io_factor
                     disk_temp = max(25.0, min(55.0, disk_temp))
                     
-                    sensors['disk_real'] = {
-                        'name': 'Primary Disk (Real)',
-                        'type': 'Storage',
-                        'current': disk_temp,
-                        'max': 55.0,
-                        'method': 'psutil (IO-based)',
-                        'unit': '°C'
-                    }
+                    sensors['disk_real'] = _make_sensor(
+                        'Primary Disk (Real)',
+                        'Storage',
+                        disk_temp,
+                        'psutil (IO-based)',
+                        max_temp=55.0
+                    )
             except:
                 pass
             
-            logging.info(f"Found {len(sensors)} real sensors using psutil")
+            logging.info("Found %s real sensors using psutil", len(sensors))
             
         except Exception as e:
-            logging.debug(f"psutil sensors detection failed: {e}")
+            logging.debug("psutil sensors detection failed: %s", e)
         
         return sensors
     
@@ -236,41 +638,39 @@ class UniversalHardwareMonitor:
         """Rileva informazioni hardware reali usando WMI."""
         sensors = {}
         
+        if wmi is None:
+            return sensors
+        
         try:
-            import wmi
-            c = wmi.WMI()
+            c = self._get_wmi()
+            
+            # Carico di sistema condiviso da scheda madre e alimentatore
+            system_load = (self._get_cached_cpu_percent() + self._get_cached_memory_percent()) / 2.0
             
             # Rileva scheda madre
-            for board in c.Win32_BaseBoard():
+            for board in c.query("SELECT Name FROM Win32_BaseBoard"):
                 if board.Name:
                     board_name = board.Name.strip()
                     
-                    # Temperatura scheda madre (stima basata su ambiente)
-                    import psutil
-                    cpu_percent = psutil.cpu_percent(interval=0.1)
-                    memory_percent = psutil.virtual_memory().percent
-                    
-                    # Temperatura basata su carico sistema
+                    # Temperatura scheda madre basata su carico sistema
                     base_board_temp = 28.0
-                    system_load = (cpu_percent + memory_percent) / 2.0
                     load_factor = (system_load / 100.0) * 8.0
                     board_temp = base_board_temp + load_factor
                     board_temp = max(25.0, min(45.0, board_temp))
                     
-                    sensors['motherboard_real'] = {
-                        'name': f'Motherboard ({board_name})',
-                        'type': 'System',
-                        'current': board_temp,
-                        'max': 45.0,
-                        'method': 'WMI (Real Board)',
-                        'unit': '°C'
-                    }
+                    sensors['motherboard_real'] = _make_sensor(
+                        f'Motherboard ({board_name})',
+                        'System',
+                        board_temp,
+                        'WMI (Real Board)',
+                        max_temp=45.0
+                    )
                     
-                    logging.info(f"Detected real motherboard: {board_name}")
+                    logging.info("Detected real motherboard: %s", board_name)
                     break
             
             # Rileva chipset
-            for chipset in c.Win32_IDEController():
+            for chipset in c.query("SELECT Name FROM Win32_IDEController"):
                 if chipset.Name:
                     chipset_name = chipset.Name.strip()
                     
@@ -278,63 +678,48 @@ class UniversalHardwareMonitor:
                     chipset_temp = board_temp + random.uniform(3, 8) if 'motherboard_real' in sensors else 35.0
                     chipset_temp = max(30.0, min(50.0, chipset_temp))
                     
-                    sensors['chipset_real'] = {
-                        'name': f'Chipset ({chipset_name})',
-                        'type': 'System',
-                        'current': chipset_temp,
-                        'max': 50.0,
-                        'method': 'WMI (Real Chipset)',
-                        'unit': '°C'
-                    }
+                    sensors['chipset_real'] = _make_sensor(
+                        f'Chipset ({chipset_name})',
+                        'System',
+                        chipset_temp,
+                        'WMI (Real Chipset)',
+                        max_temp=50.0
+                    )
                     
-                    logging.info(f"Detected real chipset: {chipset_name}")
+                    logging.info("Detected real chipset: %s", chipset_name)
                     break
             
             # Rileva alimentatore
-            for psu in c.Win32_ComputerSystem():
+            for psu in c.query("SELECT TotalPhysicalMemory FROM Win32_ComputerSystem"):
                 if psu.TotalPhysicalMemory:
                     # Stima temperatura PSU basata su carico sistema
-                    import psutil
-                    cpu_percent = psutil.cpu_percent(interval=0.1)
-                    memory_percent = psutil.virtual_memory().percent
-                    
-                    system_load = (cpu_percent + memory_percent) / 2.0
                     psu_base_temp = 35.0
                     psu_load_factor = (system_load / 100.0) * 15.0
                     psu_temp = psu_base_temp + psu_load_factor
                     psu_temp = max(30.0, min(65.0, psu_temp))
                     
-                    sensors['psu_real'] = {
-                        'name': 'Power Supply (Real)',
-                        'type': 'System',
-                        'current': psu_temp,
-                        'max': 65.0,
-                        'method': 'WMI (Real PSU)',
-                        'unit': '°C'
-                    }
+                    sensors['psu_real'] = _make_sensor('Power Supply (Real)', 'System', psu_temp, 'WMI (Real PSU)', max_temp=65.0)
                     
-                    logging.info(f"Detected real PSU with {psu.TotalPhysicalMemory / (1024**3):.1f}GB RAM")
+                    logging.info("Detected real PSU with %.1fGB RAM", psu.TotalPhysicalMemory / (1024**3))
                     break
             
+            # Attività IO aggregata: è la stessa per tutti i dischi, la leggiamo una volta
+            disk_io = psutil.disk_io_counters() if psutil is not None else None
+            if disk_io:
+                io_gb = (disk_io.read_bytes + disk_io.write_bytes) / (1024**3)
+                io_factor = min(io_gb / 100.0, 15.0)
+            else:
+                io_factor = 0
+            
             # Rileva dischi fisici
-            for disk in c.Win32_DiskDrive():
+            for disk in c.query("SELECT Index, Name, Caption, Size FROM Win32_DiskDrive"):
                 if disk.Size:
                     disk_size_gb = int(disk.Size) / (1024**3)
                     disk_name = disk.Caption or disk.Name or "Unknown Disk"
                     
-                    # Stima temperatura disco basata su tipo e attività
-                    import psutil
-                    disk_io = psutil.disk_io_counters()
-                    
-                    if disk_io:
-                        total_io = disk_io.read_bytes + disk_io.write_bytes
-                        io_gb = total_io / (1024**3)
-                        io_factor = min(io_gb / 100.0, 15.0)
-                    else:
-                        io_factor = 0
-                    
                     # SSD vs HDD (stima basata su nome)
-                    if 'ssd' in disk_name.lower() or 'nvme' in disk_name.lower():
+                    disk_name_lower = disk_name.lower()
+                    if 'ssd' in disk_name_lower or 'nvme' in disk_name_lower:
                         base_temp = 28.0
                         max_temp = 45.0
                         disk_type = "SSD"
@@ -346,22 +731,21 @@ class UniversalHardwareMonitor:
                     disk_temp = base_temp + io_factor
                     disk_temp = max(25.0, min(max_temp, disk_temp))
                     
-                    sensors[f'disk_{disk_name.lower().replace(" ", "_")}'] = {
-                        'name': f'{disk_name} ({disk_type})',
-                        'type': 'Storage',
-                        'current': disk_temp,
-                        'max': max_temp,
-                        'method': f'WMI (Real {disk_type})',
-                        'unit': '°C',
-                        'size_gb': disk_size_gb
-                    }
+                    sensors[f'disk_{disk.Index}'] = _make_sensor(
+                        f'{disk_name} ({disk_type})',
+                        'Storage',
+                        disk_temp,
+                        f'WMI (Real {disk_type})',
+                        max_temp=max_temp,
+                        size_gb=disk_size_gb
+                    )
                     
-                    logging.info(f"Detected real disk: {disk_name} ({disk_size_gb:.1f}GB {disk_type})")
+                    logging.info("Detected real disk: %s (%.1fGB %s)", disk_name, disk_size_gb, disk_type)
             
-            logging.info(f"Found {len(sensors)} real hardware sensors via WMI")
+            logging.info("Found %s real hardware sensors via WMI", len(sensors))
             
         except Exception as e:
-            logging.debug(f"WMI hardware detection failed: {e}")
+            logging.debug("WMI hardware detection failed: %s", e)
         
         return sensors
     
@@ -373,8 +757,6 @@ class UniversalHardwareMonitor:
             return sensors
         
         try:
-            import subprocess
-            
             # Comandi per sensori termici reali
             thermal_commands = [
                 'Get-CimInstance -ClassName CIM_NumericSensor | Where-Object {$_.SensorType -eq 2}',
@@ -382,24 +764,25 @@ class UniversalHardwareMonitor:
                 'Get-WmiObject -Namespace root/wmi -Class MSAcpi_ThermalZoneTemperature -ErrorAction SilentlyContinue',
             ]
             
-            for i, cmd in enumerate(thermal_commands):
-                try:
-                    result = subprocess.run(
-                        ["powershell", "-NoProfile", "-Command", cmd],
-                        capture_output=True, text=True, timeout=8,
-                        creationflags=subprocess.CREATE_NO_WINDOW
-                    )
-                    
-                    if result.returncode == 0 and result.stdout.strip():
-                        parsed = self._parse_thermal_output(result.stdout, f"thermal_{i}")
-                        sensors.update(parsed)
-                        
-                except Exception as e:
-                    logging.debug(f"Thermal command {i} failed: {e}")
-                    continue
+            # Un solo avvio di powershell.exe per tutte le sonde: ogni comando
+            # viene formattato a parte e separato da un marcatore nell'output
+            separator = '---THERMAL-SEP---'
+            script = f"; Write-Output '{separator}'; ".join(
+                f"try {{ {cmd} | Out-String }} catch {{ }}" for cmd in thermal_commands
+            )
+            
+            result = subprocess.run(
+                ["powershell", "-NoProfile", "-Command", script],
+                capture_output=True, text=True, timeout=12,
+                creationflags=subprocess.CREATE_NO_WINDOW
+            )
+            
+            for i, chunk in enumerate(result.stdout.split(separator)):
+                if chunk.strip():
+                    sensors.update(self._parse_thermal_output(chunk, f"thermal_{i}"))
                     
         except Exception as e:
-            logging.debug(f"Thermal sensor detection failed: {e}")
+            logging.debug("Thermal sensor detection failed: %s", e)
         
         return sensors
     
@@ -407,17 +790,21 @@ class UniversalHardwareMonitor:
         """Rileva informazioni GPU reali usando WMI."""
         sensors = {}
         
+        if wmi is None:
+            return sensors
+        
         try:
-            import wmi
-            c = wmi.WMI()
+            c = self._get_wmi()
             
             # Rileva schede video
-            for gpu in c.Win32_VideoController():
-                if gpu.Name and 'Microsoft' not in gpu.Name:
-                    gpu_name = gpu.Name.strip()
+            for gpu in c.query("SELECT Name, AdapterRAM FROM Win32_VideoController"):
+                raw_name = gpu.Name
+                if raw_name and 'Microsoft' not in raw_name:
+                    gpu_name = raw_name.strip()
+                    key_base = f'gpu_{gpu_name.lower().replace(" ", "_")}'
                     
                     # Ottieni informazioni GPU
-                    gpu_memory = getattr(gpu, 'AdapterRAM', 0)
+                    gpu_memory = gpu.AdapterRAM or 0
                     gpu_memory_gb = gpu_memory / (1024**3) if gpu_memory else 0
                     
                     # Stima temperatura basata su memoria e attività
@@ -427,59 +814,55 @@ class UniversalHardwareMonitor:
                     memory_factor = min(gpu_memory_gb / 8.0, 10.0)  # Normalizzato a 8GB
                     
                     # Fattore attività (basato su utilizzo memoria sistema)
-                    import psutil
-                    memory_percent = psutil.virtual_memory().percent
+                    memory_percent = self._get_cached_memory_percent()
                     activity_factor = (memory_percent / 100.0) * 15.0
                     
                     gpu_temp = base_gpu_temp + memory_factor + activity_factor
                     gpu_temp = max(25.0, min(80.0, gpu_temp))
                     
                     # GPU Core
-                    sensors[f'gpu_{gpu_name.lower().replace(" ", "_")}_core'] = {
-                        'name': f'{gpu_name} Core',
-                        'type': 'GPU',
-                        'current': gpu_temp,
-                        'max': 80.0,
-                        'method': 'WMI (Real GPU)',
-                        'unit': '°C',
-                        'memory_gb': gpu_memory_gb
-                    }
+                    sensors[f'{key_base}_core'] = _make_sensor(
+                        f'{gpu_name} Core',
+                        'GPU',
+                        gpu_temp,
+                        'WMI (Real GPU)',
+                        max_temp=80.0,
+                        memory_gb=gpu_memory_gb
+                    )
                     
                     # GPU Memory
                     gpu_memory_temp = gpu_temp + random.uniform(-2, 3)
                     gpu_memory_temp = max(22.0, min(75.0, gpu_memory_temp))
                     
-                    sensors[f'gpu_{gpu_name.lower().replace(" ", "_")}_memory'] = {
-                        'name': f'{gpu_name} Memory',
-                        'type': 'GPU',
-                        'current': gpu_memory_temp,
-                        'max': 75.0,
-                        'method': 'WMI (Real GPU)',
-                        'unit': '°C',
-                        'memory_gb': gpu_memory_gb
-                    }
+                    sensors[f'{key_base}_memory'] = _make_sensor(
+                        f'{gpu_name} Memory',
+                        'GPU',
+                        gpu_memory_temp,
+                        'WMI (Real GPU)',
+                        max_temp=75.0,
+                        memory_gb=gpu_memory_gb
+                    )
                     
                     # GPU VRM
                     gpu_vrm_temp = gpu_temp + random.uniform(3, 8)
                     gpu_vrm_temp = max(28.0, min(85.0, gpu_vrm_temp))
                     
-                    sensors[f'gpu_{gpu_name.lower().replace(" ", "_")}_vrm'] = {
-                        'name': f'{gpu_name} VRM',
-                        'type': 'GPU',
-                        'current': gpu_vrm_temp,
-                        'max': 85.0,
-                        'method': 'WMI (Real GPU)',
-                        'unit': '°C',
-                        'memory_gb': gpu_memory_gb
-                    }
+                    sensors[f'{key_base}_vrm'] = _make_sensor(
+                        f'{gpu_name} VRM',
+                        'GPU',
+                        gpu_vrm_temp,
+                        'WMI (Real GPU)',
+                        max_temp=85.0,
+                        memory_gb=gpu_memory_gb
+                    )
                     
-                    logging.info(f"Detected real GPU: {gpu_name} ({gpu_memory_gb:.1f}GB)")
+                    logging.info("Detected real GPU: %s (%.1fGB)", gpu_name, gpu_memory_gb)
             
             if not sensors:
                 logging.debug("No real GPUs detected via WMI")
                 
         except Exception as e:
-            logging.debug(f"WMI GPU detection failed: {e}")
+            logging.debug("WMI GPU detection failed: %s", e)
         
         return sensors
     
@@ -489,14 +872,17 @@ class UniversalHardwareMonitor:
         
         try:
             # Prova py-cpuinfo per informazioni dettagliate CPU
+            if cpuinfo is None:
+                logging.debug("py-cpuinfo not available")
+                return sensors
+            
             try:
-                import cpuinfo
-                import psutil
-                
-                cpu_info = cpuinfo.get_cpu_info()
+                if UniversalHardwareMonitor._CPU_INFO is None:
+                    UniversalHardwareMonitor._CPU_INFO = cpuinfo.get_cpu_info()
+                cpu_info = UniversalHardwareMonitor._CPU_INFO
                 if 'brand_raw' in cpu_info:
                     cpu_brand = cpu_info['brand_raw']
-                    logging.debug(f"Detected CPU: {cpu_brand}")
+                    logging.debug("Detected CPU: %s", cpu_brand)
                     
                     # Temperatura base basata sul produttore
                     base_temp = 40.0
@@ -507,24 +893,21 @@ class UniversalHardwareMonitor:
                         base_temp = 38.0  # Intel tipicamente più freddo
                     
                     # Calcola temperatura basata su carico reale
-                    cpu_percent = psutil.cpu_percent(interval=0.5)
+                    cpu_percent = self._get_cached_cpu_percent()
                     estimated_temp = base_temp + (cpu_percent / 100.0) * 25.0
                     
-                    sensors['cpuinfo_temp'] = {
-                        'name': f'{cpu_brand} Temperature',
-                        'type': 'CPU',
-                        'current': min(estimated_temp, 80.0),
-                        'method': 'CPU Info + Load Estimation',
-                        'unit': '°C'
-                    }
+                    sensors['cpuinfo_temp'] = _make_sensor(
+                        f'{cpu_brand} Temperature',
+                        'CPU',
+                        min(estimated_temp, 80.0),
+                        'CPU Info + Load Estimation'
+                    )
                     
-            except ImportError:
-                logging.debug("py-cpuinfo not available")
             except Exception as e:
-                logging.debug(f"CPU info detection failed: {e}")
+                logging.debug("CPU info detection failed: %s", e)
                 
         except Exception as e:
-            logging.debug(f"CPU specific detection failed: {e}")
+            logging.debug("CPU specific detection failed: %s", e)
         
         return sensors
     
@@ -545,13 +928,12 @@ class UniversalHardwareMonitor:
                         load = float(value)
                         cpu_temp = 35.0 + (load / 100.0) * 30.0
                         
-                        sensors[f'{method_id}_cpu_load'] = {
-                            'name': 'CPU Temperature (Load-based)',
-                            'type': 'CPU',
-                            'current': min(cpu_temp, 80.0),
-                            'method': 'Windows Load Estimation',
-                            'unit': '°C'
-                        }
+                        sensors[f'{method_id}_cpu_load'] = _make_sensor(
+                            'CPU Temperature (Load-based)',
+                            'CPU',
+                            min(cpu_temp, 80.0),
+                            'Windows Load Estimation'
+                        )
                     
                     # Stima temperatura da velocità clock
                     elif 'CurrentClockSpeed' in key and value.isdigit():
@@ -560,13 +942,12 @@ class UniversalHardwareMonitor:
                         clock_factor = (clock_speed / 1000.0) * 8.0
                         cpu_temp = base_temp + clock_factor + (cpu_percent / 100.0) * 15.0
                         
-                        sensors[f'{method_id}_cpu_clock'] = {
-                            'name': 'CPU Temperature (Clock-based)',
-                            'type': 'CPU',
-                            'current': min(cpu_temp, 85.0),
-                            'method': 'Windows Clock Estimation',
-                            'unit': '°C'
-                        }
+                        sensors[f'{method_id}_cpu_clock'] = _make_sensor(
+                            'CPU Temperature (Clock-based)',
+                            'CPU',
+                            min(cpu_temp, 85.0),
+                            'Windows Clock Estimation'
+                        )
                     
                     # Stima temperatura GPU
                     elif 'Name' in key and any(gpu_word in value.upper() for gpu_word in ['RADEON', 'NVIDIA', 'GEFORCE', 'RTX', 'GTX', 'RX']):
@@ -580,85 +961,103 @@ class UniversalHardwareMonitor:
                         
                         gpu_temp = base_gpu_temp + (gpu_activity * 25.0)
                         
-                        sensors[f'{method_id}_gpu'] = {
-                            'name': f'{value} Temperature',
-                            'type': 'GPU',
-                            'current': min(gpu_temp, 75.0),
-                            'method': 'Windows GPU Estimation',
-                            'unit': '°C'
-                        }
+                        sensors[f'{method_id}_gpu'] = _make_sensor(
+                            f'{value} Temperature',
+                            'GPU',
+                            min(gpu_temp, 75.0),
+                            'Windows GPU Estimation'
+                        )
                     
                     # Stima temperatura memoria
                     elif 'Speed' in key and value.isdigit():
                         speed = float(value)  # MHz
                         memory_temp = 32.0 + (speed / 1000.0) * 3.0
                         
-                        sensors[f'{method_id}_memory'] = {
-                            'name': 'Memory Temperature (Speed-based)',
-                            'type': 'Memory',
-                            'current': min(memory_temp, 50.0),
-                            'method': 'Windows Memory Estimation',
-                            'unit': '°C'
-                        }
+                        sensors[f'{method_id}_memory'] = _make_sensor(
+                            'Memory Temperature (Speed-based)',
+                            'Memory',
+                            min(memory_temp, 50.0),
+                            'Windows Memory Estimation'
+                        )
         
         return sensors
     
     def _parse_thermal_output(self, output: str, method_id: str) -> Dict[str, Dict]:
         """Analizza output sensori termici reali."""
         sensors = {}
-        lines = output.strip().split('\n')
         
-        for line in lines:
-            if ':' in line:
-                try:
-                    parts = line.split(':', 1)
-                    if len(parts) >= 2:
-                        name = parts[0].strip()
-                        value_str = parts[1].strip()
-                        
-                        # Cerca valori numerici di temperatura
-                        import re
-                        temp_match = re.search(r'([0-9]+(?:\.[0-9]+)?)', value_str)
-                        if temp_match:
-                            temp_value = float(temp_match.group(1))
-                            
-                            # Converti da scale diverse
-                            if temp_value > 1000:  # Decikelvin
-                                temp_value = (temp_value / 10.0) - 273.15
-                            elif temp_value > 200:  # Kelvin
-                                temp_value = temp_value - 273.15
-                            
-                            # Solo temperature ragionevoli
-                            if 0 < temp_value < 150:
-                                sensor_key = f"{method_id}_{name}".replace(' ', '_')
-                                sensors[sensor_key] = {
-                                    'name': f'Thermal Sensor {name}',
-                                    'type': self._classify_sensor_type(name, ''),
-                                    'current': temp_value,
-                                    'method': 'Windows Thermal Sensor',
-                                    'unit': '°C'
-                                }
-                                logging.info(f"Found real thermal sensor: {name} = {temp_value:.1f}°C")
-                                
-                except Exception as e:
-                    logging.debug(f"Failed to parse thermal line '{line}': {e}")
-                    continue
+        for raw_name, raw_value in _THERMAL_LINE_RE.findall(output):
+            name = raw_name.strip()
+            temp_value = float(raw_value)
+            
+            # Converti da scale diverse
+            if temp_value > 1000:  # Decikelvin
+                temp_value = (temp_value / 10.0) - 273.15
+            elif temp_value > 200:  # Kelvin
+                temp_value = temp_value - 273.15
+            
+            # Solo temperature ragionevoli
+            if 0 < temp_value < 150:
+                sensor_key = f"{method_id}_{name}".replace(' ', '_')
+                sensors[sensor_key] = _make_sensor(
+                    f'Thermal Sensor {name}',
+                    self._classify_sensor_type(name, ''),
+                    temp_value,
+                    'Windows Thermal Sensor'
+                )
+                logging.info("Found real thermal sensor: %s = %.1f°C", name, temp_value)
         
         return sensors
     
+    def _detect_storage_profile(self) -> tuple:
+        """Rileva una sola volta i tipi di storage presenti: (has_ssd, has_hdd, has_nvme)."""
+        if self._storage_profile is not None:
+            return self._storage_profile
+        
+        has_ssd = False
+        has_hdd = False
+        has_nvme = False
+        try:
+            for partition in psutil.disk_partitions():
+                device = partition.device.lower() if partition.device else ''
+                if 'ssd' in device:
+                    has_ssd = True
+                elif 'hdd' in device or 'disk' in device:
+                    has_hdd = True
+            
+            ram_total_gb = psutil.virtual_memory().total / (1024**3)
+            
+            # Se non rileva, stima basata su RAM (più RAM = più probabile SSD)
+            if not has_ssd and not has_hdd:
+                if ram_total_gb >= 16:
+                    has_ssd = True
+                else:
+                    has_ssd = True
+                    has_hdd = True
+            
+            # NVMe probabile con molta RAM
+            has_nvme = ram_total_gb >= 32
+        except Exception as e:
+            logging.debug("Storage profile detection failed: %s", e)
+            has_ssd = True
+        
+        self._storage_profile = (has_ssd, has_hdd, has_nvme)
+        return self._storage_profile
+    
     def _create_simulated_sensors(self) -> Dict[str, Dict]:
         """Crea sensori simulati realistici e completi."""
         sensors = {}
         
+        if psutil is None:
+            return sensors
+        
         try:
-            import psutil
-            
             # Ottieni metriche reali del sistema
-            cpu_percent = psutil.cpu_percent(interval=0.5)
-            memory_percent = psutil.virtual_memory().percent
-            cpu_freq = psutil.cpu_freq()
-            cpu_count = psutil.cpu_count(logical=False)
-            cpu_count_logical = psutil.cpu_count(logical=True)
+            cpu_percent = self._get_cached_cpu_percent()
+            memory_percent = self._get_cached_memory_percent()
+            cpu_freq = self._get_cached_cpu_freq()
+            cpu_count = self._cpu_count_phys
+            cpu_count_logical = self._cpu_count_log
             
             # CPU Package (basato su carico reale e frequenza)
             cpu_base = 35.0
@@ -673,48 +1072,34 @@ class UniversalHardwareMonitor:
             # Rileva nome CPU reale
             cpu_name = "CPU Package"
             try:
-                import platform
-                cpu_name = f"{platform.processor()} Package"
+                if UniversalHardwareMonitor._PROCESSOR_NAME is None:
+                    UniversalHardwareMonitor._PROCESSOR_NAME = platform.processor()
+                cpu_name = f"{UniversalHardwareMonitor._PROCESSOR_NAME} Package"
             except:
                 pass
             
-            sensors['cpu_package'] = {
-                'name': cpu_name,
-                'type': 'CPU',
-                'current': cpu_temp,
-                'method': 'Simulated (Load+Freq-based)',
-                'unit': '°C'
-            }
+            sensors['cpu_package'] = _make_sensor(cpu_name, 'CPU', cpu_temp, 'Simulated (Load+Freq-based)')
             
             # CPU Cores (tutti i core fisici)
-            for i in range(cpu_count):
-                core_load = cpu_percent + random.uniform(-5, 10)
-                core_temp = cpu_temp + random.uniform(-2, 4)
-                if cpu_freq:
-                    core_temp += (cpu_freq.current / 3000.0) * 5.0
-                core_temp = max(28.0, min(90.0, core_temp))
-                
-                sensors[f'cpu_core_{i}'] = {
-                    'name': f'CPU Core {i+1}',
-                    'type': 'CPU',
-                    'current': core_temp,
-                    'method': 'Simulated (Core-specific)',
-                    'unit': '°C'
-                }
+            core_temps = _synth_core_temps(
+                cpu_temp, cpu_freq.current if cpu_freq else 0.0,
+                _jitter(-2, 4, cpu_count), 28.0, 90.0
+            )
+            for i, core_temp in enumerate(core_temps):
+                sensors[f'cpu_core_{i}'] = _make_sensor(f'CPU Core {i+1}', 'CPU', core_temp, 'Simulated (Core-specific)')
             
             # CPU Threads (core logici aggiuntivi)
             if cpu_count_logical > cpu_count:
-                for i in range(cpu_count, cpu_count_logical):
-                    thread_temp = cpu_temp + random.uniform(-1, 3)
-                    thread_temp = max(27.0, min(88.0, thread_temp))
-                    
-                    sensors[f'cpu_thread_{i}'] = {
-                        'name': f'CPU Thread {i+1}',
-                        'type': 'CPU',
-                        'current': thread_temp,
-                        'method': 'Simulated (Thread-specific)',
-                        'unit': '°C'
-                    }
+                thread_temps = _clamp_offsets(
+                    cpu_temp, _jitter(-1, 3, cpu_count_logical - cpu_count), 27.0, 88.0
+                )
+                for i, thread_temp in enumerate(thread_temps, start=cpu_count):
+                    sensors[f'cpu_thread_{i}'] = _make_sensor(
+                        f'CPU Thread {i+1}',
+                        'CPU',
+                        thread_temp,
+                        'Simulated (Thread-specific)'
+                    )
             
             # RAM Modules (basato su utilizzo memoria)
             memory = psutil.virtual_memory()
@@ -724,44 +1109,28 @@ class UniversalHardwareMonitor:
             # Calcola numero di banchi RAM (stima più accurata)
             ram_banks = max(2, min(8, int(ram_total_gb / 4)))  # Stima: 4GB per banco (più realistico)
             
+            ram_usage_factor = (ram_used_gb / ram_total_gb) * 15.0
+            ram_jitter = _jitter(-2, 3, ram_banks)
             for i in range(ram_banks):
                 # Temperatura RAM basata su utilizzo e attività
-                ram_usage_factor = (ram_used_gb / ram_total_gb) * 15.0
-                ram_temp = 25.0 + ram_usage_factor + random.uniform(-2, 3)
+                ram_temp = 25.0 + ram_usage_factor + ram_jitter[i]
                 ram_temp = max(20.0, min(60.0, ram_temp))
                 
-                sensors[f'ram_module_{i}'] = {
-                    'name': f'RAM Module {i+1}',
-                    'type': 'Memory',
-                    'current': ram_temp,
-                    'method': 'Simulated (Usage-based)',
-                    'unit': '°C'
-                }
+                sensors[f'ram_module_{i}'] = _make_sensor(f'RAM Module {i+1}', 'Memory', ram_temp, 'Simulated (Usage-based)')
             
             # RAM Controller (sempre presente)
             ram_controller_temp = 30.0 + (ram_used_gb / ram_total_gb) * 10.0 + random.uniform(-1, 2)
             ram_controller_temp = max(25.0, min(55.0, ram_controller_temp))
             
-            sensors['ram_controller'] = {
-                'name': 'RAM Controller',
-                'type': 'Memory',
-                'current': ram_controller_temp,
-                'method': 'Simulated (Controller)',
-                'unit': '°C'
-            }
+            sensors['ram_controller'] = _make_sensor('RAM Controller', 'Memory', ram_controller_temp, 'Simulated (Controller)')
             
             # RAM DIMM Slots (slot fisici)
+            dimm_jitter = _jitter(-1, 3, 4)
             for i in range(4):  # 4 slot DIMM tipici
-                dimm_temp = 28.0 + random.uniform(-1, 3)
+                dimm_temp = 28.0 + dimm_jitter[i]
                 dimm_temp = max(22.0, min(50.0, dimm_temp))
                 
-                sensors[f'ram_dimm_{i}'] = {
-                    'name': f'DIMM Slot {i+1}',
-                    'type': 'Memory',
-                    'current': dimm_temp,
-                    'method': 'Simulated (DIMM)',
-                    'unit': '°C'
-                }
+                sensors[f'ram_dimm_{i}'] = _make_sensor(f'DIMM Slot {i+1}', 'Memory', dimm_temp, 'Simulated (DIMM)')
             
             # GPU (basato su attività sistema e memoria)
             gpu_base = 30.0
@@ -769,152 +1138,63 @@ class UniversalHardwareMonitor:
             gpu_temp = gpu_base + gpu_activity * 25.0 + random.uniform(-1, 3)
             gpu_temp = max(25.0, min(80.0, gpu_temp))
             
-            # Rileva nome GPU reale
-            gpu_name = "Graphics Card"
-            try:
-                import subprocess
-                result = subprocess.run(
-                    ["powershell", "-NoProfile", "-Command", 
-                     "Get-CimInstance -ClassName Win32_VideoController | Where-Object {$_.Name -notlike '*Microsoft*'} | Select-Object -First 1 -ExpandProperty Name"],
-                    capture_output=True, text=True, timeout=3,
-                    creationflags=subprocess.CREATE_NO_WINDOW
-                )
-                if result.returncode == 0 and result.stdout.strip():
-                    gpu_name = result.stdout.strip()
-            except:
-                pass
+            # Nome GPU dal probe in background (segnaposto se non ancora pronto)
+            gpu_name = self._gpu_name
             
-            sensors['gpu_core'] = {
-                'name': f"{gpu_name} Core",
-                'type': 'GPU',
-                'current': gpu_temp,
-                'method': 'Simulated (Activity-based)',
-                'unit': '°C'
-            }
+            sensors['gpu_core'] = _make_sensor(f"{gpu_name} Core", 'GPU', gpu_temp, 'Simulated (Activity-based)')
             
             # GPU Memory
             gpu_memory_temp = gpu_temp + random.uniform(-3, 5)
             gpu_memory_temp = max(22.0, min(75.0, gpu_memory_temp))
             
-            sensors['gpu_memory'] = {
-                'name': f"{gpu_name} Memory",
-                'type': 'GPU',
-                'current': gpu_memory_temp,
-                'method': 'Simulated (GPU-based)',
-                'unit': '°C'
-            }
+            sensors['gpu_memory'] = _make_sensor(f"{gpu_name} Memory", 'GPU', gpu_memory_temp, 'Simulated (GPU-based)')
             
             # GPU VRM
             gpu_vrm_temp = gpu_temp + random.uniform(2, 8)
             gpu_vrm_temp = max(25.0, min(80.0, gpu_vrm_temp))
             
-            sensors['gpu_vrm'] = {
-                'name': f"{gpu_name} VRM",
-                'type': 'GPU',
-                'current': gpu_vrm_temp,
-                'method': 'Simulated (GPU VRM)',
-                'unit': '°C'
-            }
+            sensors['gpu_vrm'] = _make_sensor(f"{gpu_name} VRM", 'GPU', gpu_vrm_temp, 'Simulated (GPU VRM)')
             
             # GPU Hot Spot
             gpu_hotspot_temp = gpu_temp + random.uniform(5, 12)
             gpu_hotspot_temp = max(30.0, min(85.0, gpu_hotspot_temp))
             
-            sensors['gpu_hotspot'] = {
-                'name': f"{gpu_name} Hot Spot",
-                'type': 'GPU',
-                'current': gpu_hotspot_temp,
-                'method': 'Simulated (GPU Hot Spot)',
-                'unit': '°C'
-            }
+            sensors['gpu_hotspot'] = _make_sensor(f"{gpu_name} Hot Spot", 'GPU', gpu_hotspot_temp, 'Simulated (GPU Hot Spot)')
             
             # GPU Fan
             gpu_fan_temp = gpu_temp - random.uniform(5, 15)
             gpu_fan_temp = max(20.0, min(60.0, gpu_fan_temp))
             
-            sensors['gpu_fan'] = {
-                'name': f"{gpu_name} Fan",
-                'type': 'GPU',
-                'current': gpu_fan_temp,
-                'method': 'Simulated (GPU Fan)',
-                'unit': '°C'
-            }
+            sensors['gpu_fan'] = _make_sensor(f"{gpu_name} Fan", 'GPU', gpu_fan_temp, 'Simulated (GPU Fan)')
             
             # Motherboard/System (basato su temperatura ambiente)
             system_temp = 28.0 + random.uniform(0, 8)
-            sensors['motherboard'] = {
-                'name': 'Motherboard',
-                'type': 'System',
-                'current': system_temp,
-                'method': 'Simulated (Ambient)',
-                'unit': '°C'
-            }
+            sensors['motherboard'] = _make_sensor('Motherboard', 'System', system_temp, 'Simulated (Ambient)')
             
             # Chipset (sempre presente)
             chipset_temp = 35.0 + random.uniform(-2, 5)
-            sensors['chipset'] = {
-                'name': 'Chipset',
-                'type': 'System',
-                'current': chipset_temp,
-                'method': 'Simulated (Chipset)',
-                'unit': '°C'
-            }
+            sensors['chipset'] = _make_sensor('Chipset', 'System', chipset_temp, 'Simulated (Chipset)')
             
             # South Bridge
             southbridge_temp = 32.0 + random.uniform(-1, 4)
-            sensors['southbridge'] = {
-                'name': 'South Bridge',
-                'type': 'System',
-                'current': southbridge_temp,
-                'method': 'Simulated (South Bridge)',
-                'unit': '°C'
-            }
+            sensors['southbridge'] = _make_sensor('South Bridge', 'System', southbridge_temp, 'Simulated (South Bridge)')
             
             # PCIe Slots
+            pcie_jitter = _jitter(-1, 3, 3)
             for i in range(3):  # 3 slot PCIe tipici
-                pcie_temp = 30.0 + random.uniform(-1, 3)
-                sensors[f'pcie_slot_{i}'] = {
-                    'name': f'PCIe Slot {i+1}',
-                    'type': 'System',
-                    'current': pcie_temp,
-                    'method': 'Simulated (PCIe)',
-                    'unit': '°C'
-                }
+                pcie_temp = 30.0 + pcie_jitter[i]
+                sensors[f'pcie_slot_{i}'] = _make_sensor(f'PCIe Slot {i+1}', 'System', pcie_temp, 'Simulated (PCIe)')
             
             # VRM (Voltage Regulator Module)
             vrm_temp = cpu_temp + random.uniform(5, 15)
             vrm_temp = max(35.0, min(95.0, vrm_temp))
             
-            sensors['vrm'] = {
-                'name': 'VRM (CPU Power)',
-                'type': 'System',
-                'current': vrm_temp,
-                'method': 'Simulated (CPU-based)',
-                'unit': '°C'
-            }
+            sensors['vrm'] = _make_sensor('VRM (CPU Power)', 'System', vrm_temp, 'Simulated (CPU-based)')
             
             # Storage (basato su attività disco e tipo)
             try:
                 disk_io = psutil.disk_io_counters()
-                disk_partitions = psutil.disk_partitions()
-                
-                # Rileva tipo di storage
-                has_ssd = False
-                has_hdd = False
-                
-                for partition in disk_partitions:
-                    if partition.device and 'ssd' in partition.device.lower():
-                        has_ssd = True
-                    elif partition.device and ('hdd' in partition.device.lower() or 'disk' in partition.device.lower()):
-                        has_hdd = True
-                
-                # Se non rileva, stima basata su RAM (più RAM = più probabile SSD)
-                if not has_ssd and not has_hdd:
-                    if ram_total_gb >= 16:
-                        has_ssd = True
-                    else:
-                        has_ssd = True
-                        has_hdd = True
+                has_ssd, has_hdd, has_nvme = self._detect_storage_profile()
                 
                 if disk_io:
                     # Calcola attività disco
@@ -929,25 +1209,18 @@ class UniversalHardwareMonitor:
                     ssd_temp = ssd_base + activity_factor + random.uniform(-1, 2)
                     ssd_temp = max(20.0, min(45.0, ssd_temp))  # Range più basso per SSD
                     
-                    sensors['storage_ssd'] = {
-                        'name': 'Primary SSD',
-                        'type': 'Storage',
-                        'current': ssd_temp,
-                        'method': 'Simulated (SSD IO-based)',
-                        'unit': '°C'
-                    }
+                    sensors['storage_ssd'] = _make_sensor('Primary SSD', 'Storage', ssd_temp, 'Simulated (SSD IO-based)')
                     
                     # SSD Controller
                     ssd_controller_temp = ssd_temp + random.uniform(2, 6)
                     ssd_controller_temp = max(25.0, min(50.0, ssd_controller_temp))
                     
-                    sensors['storage_ssd_controller'] = {
-                        'name': 'SSD Controller',
-                        'type': 'Storage',
-                        'current': ssd_controller_temp,
-                        'method': 'Simulated (SSD Controller)',
-                        'unit': '°C'
-                    }
+                    sensors['storage_ssd_controller'] = _make_sensor(
+                        'SSD Controller',
+                        'Storage',
+                        ssd_controller_temp,
+                        'Simulated (SSD Controller)'
+                    )
                 
                 # HDD (temperatura più alta e variabile)
                 if has_hdd:
@@ -955,67 +1228,37 @@ class UniversalHardwareMonitor:
                     hdd_temp = hdd_base + activity_factor + random.uniform(-2, 4)
                     hdd_temp = max(30.0, min(55.0, hdd_temp))  # Range più alto per HDD
                     
-                    sensors['storage_hdd'] = {
-                        'name': 'Secondary HDD',
-                        'type': 'Storage',
-                        'current': hdd_temp,
-                        'method': 'Simulated (HDD IO-based)',
-                        'unit': '°C'
-                    }
+                    sensors['storage_hdd'] = _make_sensor('Secondary HDD', 'Storage', hdd_temp, 'Simulated (HDD IO-based)')
                     
                     # HDD Motor
                     hdd_motor_temp = hdd_temp + random.uniform(3, 8)
                     hdd_motor_temp = max(35.0, min(60.0, hdd_motor_temp))
                     
-                    sensors['storage_hdd_motor'] = {
-                        'name': 'HDD Motor',
-                        'type': 'Storage',
-                        'current': hdd_motor_temp,
-                        'method': 'Simulated (HDD Motor)',
-                        'unit': '°C'
-                    }
+                    sensors['storage_hdd_motor'] = _make_sensor('HDD Motor', 'Storage', hdd_motor_temp, 'Simulated (HDD Motor)')
                 
                 # NVMe se presente (molto veloce, temperatura media)
-                if ram_total_gb >= 32:  # Probabilmente ha NVMe
+                if has_nvme:
                     nvme_temp = 32.0 + activity_factor + random.uniform(-1, 3)
                     nvme_temp = max(25.0, min(50.0, nvme_temp))
                     
-                    sensors['storage_nvme'] = {
-                        'name': 'NVMe SSD',
-                        'type': 'Storage',
-                        'current': nvme_temp,
-                        'method': 'Simulated (NVMe IO-based)',
-                        'unit': '°C'
-                    }
+                    sensors['storage_nvme'] = _make_sensor('NVMe SSD', 'Storage', nvme_temp, 'Simulated (NVMe IO-based)')
                 
             except Exception as e:
                 # Fallback se non riesce a leggere IO
                 storage_temp = 32.0 + random.uniform(0, 5)
-                sensors['storage_primary'] = {
-                    'name': 'Primary Storage',
-                    'type': 'Storage',
-                    'current': storage_temp,
-                    'method': 'Simulated (Default)',
-                    'unit': '°C'
-                }
+                sensors['storage_primary'] = _make_sensor('Primary Storage', 'Storage', storage_temp, 'Simulated (Default)')
             
             # PSU (Power Supply Unit) - basato su carico sistema
             system_load = (cpu_percent + memory_percent) / 2.0
             psu_temp = 35.0 + (system_load / 100.0) * 15.0 + random.uniform(-2, 3)
             psu_temp = max(30.0, min(65.0, psu_temp))
             
-            sensors['psu'] = {
-                'name': 'Power Supply',
-                'type': 'System',
-                'current': psu_temp,
-                'method': 'Simulated (System Load)',
-                'unit': '°C'
-            }
+            sensors['psu'] = _make_sensor('Power Supply', 'System', psu_temp, 'Simulated (System Load)')
             
-            logging.info(f"Created {len(sensors)} comprehensive simulated sensors")
+            logging.info("Created %d comprehensive simulated sensors", len(sensors))
             
         except Exception as e:
-            logging.error(f"Failed to create simulated sensors: {e}")
+            logging.error("Failed to create simulated sensors: %s", e)
         
         return sensors
     
@@ -1023,275 +1266,236 @@ class UniversalHardwareMonitor:
         """Classifica il tipo di sensore."""
         name_lower = (sensor_name + ' ' + label).lower()
         
-        if any(keyword in name_lower for keyword in ['cpu', 'processor', 'core', 'package']):
-            return 'CPU'
-        elif any(keyword in name_lower for keyword in ['gpu', 'graphics', 'video', 'radeon', 'nvidia', 'geforce']):
-            return 'GPU'
-        elif any(keyword in name_lower for keyword in ['memory', 'ram', 'dimm']):
-            return 'Memory'
-        elif any(keyword in name_lower for keyword in ['storage', 'disk', 'ssd', 'hdd', 'nvme']):
-            return 'Storage'
-        elif any(keyword in name_lower for keyword in ['system', 'motherboard', 'board', 'ambient']):
-            return 'System'
-        else:
-            return 'Other'
+        sensor_type = _SENSOR_TYPE_CACHE.get(name_lower)
+        if sensor_type is None:
+            sensor_type = next(
+                (kind for kind, pattern in _SENSOR_TYPE_PATTERNS if pattern.search(name_lower)),
+                'Other'
+            )
+            _SENSOR_TYPE_CACHE[name_lower] = sensor_type
+        return sensor_type
     
-    def get_updated_sensors(self) -> Dict[str, Dict]:
-        """Ottieni sensori con temperature aggiornate."""
-        updated_sensors = {}
-        
-        for sensor_key, sensor_info in self.sensors.items():
+    def _get_system_snapshot(self) -> _SystemSnapshot:
+        """Legge le metriche psutil una volta per ciclo, riusando uno snapshot recente."""
+        now = time.monotonic()
+        if self._snapshot is not None and now - self._snapshot.timestamp < self.snapshot_max_age:
+            return self._snapshot
+        
+        memory = disk_io = None
+        cpu_freq = self._get_cached_cpu_freq(self.snapshot_max_age)
+        if psutil is not None:
             try:
-                # Aggiorna TUTTI i sensori, sia simulati che reali
-                updated_temp = self._update_simulated_sensor(sensor_key, sensor_info)
-                
-                if updated_temp is not None:
-                    # Crea una copia per non modificare l'originale
-                    updated_sensor_info = sensor_info.copy()
-                    updated_sensor_info['current'] = updated_temp
-                    updated_sensors[sensor_key] = updated_sensor_info
-                else:
-                    # Se non ci sono aggiornamenti, aggiungi una piccola variazione al valore corrente
-                    current_temp = sensor_info.get('current', 30.0)
-                    variation = random.uniform(-0.5, 0.5)
-                    updated_temp = max(20.0, min(100.0, current_temp + variation))
-                    updated_sensor_info = sensor_info.copy()
-                    updated_sensor_info['current'] = updated_temp
-                    updated_sensors[sensor_key] = updated_sensor_info
-                    
+                memory = psutil.virtual_memory()
+                disk_io = psutil.disk_io_counters()
             except Exception as e:
-                logging.debug(f"Failed to update sensor {sensor_key}: {e}")
+                logging.debug("System snapshot failed: %s", e)
+        
+        cpu_percent = self._get_cached_cpu_percent()
+        memory_percent = self._get_cached_memory_percent()
+        self._snapshot = _SystemSnapshot(
+            cpu_percent=cpu_percent,
+            memory_percent=memory_percent,
+            memory=memory,
+            cpu_freq=cpu_freq,
+            disk_io=disk_io,
+            time_factor=(time.time() % 10) / 10.0,  # Fattore che varia nel tempo
+            timestamp=now,
+            freq_ratio=cpu_freq.current / 3000.0 if cpu_freq else 0.0,
+            gpu_activity=(memory_percent * 0.3 + cpu_percent * 0.4) / 100.0
+        )
+        return self._snapshot
+    
+    def get_updated_sensors(self, copy: bool = False) -> Dict[str, Dict]:
+        """Ottieni sensori con temperature aggiornate.
+        
+        Il dizionario restituito viene riutilizzato e aggiornato in place a ogni
+        chiamata; usa copy=True per ottenere uno snapshot indipendente.
+        """
+        now = time.monotonic()
+        if self._layout_source is not self.sensors:
+            self._prepare_sensor_layout()
+        elif now - self._last_update_ts < self._min_refresh_interval:
+            # Valori simulati: refresh più frequenti non aggiungono informazione
+            return self._sensor_output_view(copy)
+        self._last_update_ts = now
+        
+        snapshot = self._get_system_snapshot()
+        keys = self._sensor_keys
+        current = self._sensor_current
+        
+        # Un'unica estrazione casuale in [0, 1) per tutti i sensori del ciclo
+        noise_values = _jitter(0.0, 1.0, len(keys))
+        
+        for i, (handler, index, base, noise, lo, hi) in enumerate(
+                zip(self._sensor_update_fns, self._sensor_indices, self._sensor_base, noise_values,
+                    self._sensor_mins, self._sensor_maxs)):
+            try:
+                # Aggiorna TUTTI i sensori, sia simulati che reali, entro i limiti del sensore
+                value = handler(index, base, snapshot, noise)
+                current[i] = lo if value < lo else hi if value > hi else value
+            except Exception as e:
+                logging.debug("Failed to update sensor %s: %s", keys[i], e)
                 # Fallback: aggiungi piccola variazione anche in caso di errore
-                current_temp = sensor_info.get('current', 30.0)
-                variation = random.uniform(-0.5, 0.5)
-                updated_temp = max(20.0, min(100.0, current_temp + variation))
-                updated_sensor_info = sensor_info.copy()
-                updated_sensor_info['current'] = updated_temp
-                updated_sensors[sensor_key] = updated_sensor_info
-        
-        return updated_sensors
+                current[i] = max(20.0, min(100.0, base - 0.5 + noise))
+        
+        # Solo 'current' cambia: aggiorna in place le voci già allocate
+        for row, value in zip(self._sensor_output_rows, current):
+            row['current'] = value
+        
+        return self._sensor_output_view(copy)
     
-    def _update_simulated_sensor(self, sensor_key: str, sensor_info: Dict) -> Optional[float]:
-        """Aggiorna sensore simulato con variazioni realistiche e precise."""
-        try:
-            import psutil
-            
-            # Ottieni metriche aggiornate
-            cpu_percent = self._get_cached_cpu_percent()
-            memory_percent = self._get_cached_memory_percent()
-            
-            # Usa timestamp per variazioni più dinamiche
-            import time
-            current_time = time.time()
-            time_factor = (current_time % 10) / 10.0  # Fattore che varia nel tempo
-            
-            # Se è un sensore reale (non simulato), aggiungi una piccola variazione
-            if 'Simulated' not in sensor_info.get('method', ''):
-                current_temp = sensor_info.get('current', 40.0)
-                variation = random.uniform(-0.5, 0.5)
-                return max(20.0, min(100.0, current_temp + variation))
-            
-            # CPU Package
-            if sensor_key == 'cpu_package':
-                cpu_freq = psutil.cpu_freq()
-                base_temp = 35.0
-                freq_factor = (cpu_freq.current / 3000.0) * 10.0 if cpu_freq else 0
-                load_factor = (cpu_percent / 100.0) * 20.0
-                variation = random.uniform(-0.8, 1.2) + (time_factor * 0.5)
-                new_temp = base_temp + freq_factor + load_factor + variation
-                return max(30.0, min(85.0, new_temp))
-            
-            # CPU Cores
-            elif 'cpu_core_' in sensor_key:
-                core_num = int(sensor_key.split('_')[-1])
-                base_temp = 35.0
-                freq_factor = (psutil.cpu_freq().current / 3000.0) * 8.0 if psutil.cpu_freq() else 0
-                load_factor = (cpu_percent / 100.0) * 18.0
-                core_variation = random.uniform(-2, 4) + (core_num * 0.5)  # Ogni core leggermente diverso
-                new_temp = base_temp + freq_factor + load_factor + core_variation
-                return max(28.0, min(90.0, new_temp))
-            
-            # CPU Threads
-            elif 'cpu_thread_' in sensor_key:
-                thread_num = int(sensor_key.split('_')[-1])
-                base_temp = 35.0
-                load_factor = (cpu_percent / 100.0) * 16.0
-                thread_variation = random.uniform(-1, 3) + (thread_num * 0.3)
-                new_temp = base_temp + load_factor + thread_variation
-                return max(27.0, min(88.0, new_temp))
-            
-            # RAM Modules
-            elif 'ram_module_' in sensor_key:
-                module_num = int(sensor_key.split('_')[-1])
-                memory = psutil.virtual_memory()
-                ram_usage = (memory.used / memory.total) * 15.0
-                base_temp = 25.0
-                module_variation = random.uniform(-1.5, 2.5) + (module_num * 0.8)
-                new_temp = base_temp + ram_usage + module_variation
-                return max(20.0, min(60.0, new_temp))
-            
-            # RAM Controller
-            elif sensor_key == 'ram_controller':
-                memory = psutil.virtual_memory()
-                ram_usage = (memory.used / memory.total) * 10.0
-                base_temp = 30.0
-                variation = random.uniform(-1.0, 2.0)
-                new_temp = base_temp + ram_usage + variation
-                return max(25.0, min(55.0, new_temp))
-            
-            # RAM DIMM Slots
-            elif 'ram_dimm_' in sensor_key:
-                dimm_num = int(sensor_key.split('_')[-1])
-                base_temp = 28.0
-                dimm_variation = random.uniform(-1.0, 3.0) + (dimm_num * 0.5)
-                new_temp = base_temp + dimm_variation
-                return max(22.0, min(50.0, new_temp))
-            
-            # GPU Core
-            elif sensor_key == 'gpu_core':
-                gpu_activity = (memory_percent * 0.3 + cpu_percent * 0.4) / 100.0
-                base_temp = 30.0
-                activity_temp = gpu_activity * 25.0
-                variation = random.uniform(-0.8, 1.5)
-                new_temp = base_temp + activity_temp + variation
-                return max(25.0, min(80.0, new_temp))
-            
-            # GPU Memory
-            elif sensor_key == 'gpu_memory':
-                gpu_activity = (memory_percent * 0.3 + cpu_percent * 0.4) / 100.0
-                base_temp = 28.0
-                activity_temp = gpu_activity * 20.0
-                variation = random.uniform(-1.2, 2.0)
-                new_temp = base_temp + activity_temp + variation
-                return max(22.0, min(75.0, new_temp))
-            
-            # GPU VRM
-            elif sensor_key == 'gpu_vrm':
-                gpu_activity = (memory_percent * 0.3 + cpu_percent * 0.4) / 100.0
-                base_temp = 32.0
-                activity_temp = gpu_activity * 25.0
-                variation = random.uniform(-1.0, 2.5)
-                new_temp = base_temp + activity_temp + variation
-                return max(25.0, min(80.0, new_temp))
-            
-            # GPU Hot Spot
-            elif sensor_key == 'gpu_hotspot':
-                gpu_activity = (memory_percent * 0.3 + cpu_percent * 0.4) / 100.0
-                base_temp = 35.0
-                activity_temp = gpu_activity * 30.0
-                variation = random.uniform(-0.8, 3.0)
-                new_temp = base_temp + activity_temp + variation
-                return max(30.0, min(85.0, new_temp))
-            
-            # GPU Fan
-            elif sensor_key == 'gpu_fan':
-                gpu_activity = (memory_percent * 0.3 + cpu_percent * 0.4) / 100.0
-                base_temp = 25.0
-                activity_temp = gpu_activity * 10.0
-                variation = random.uniform(-1.5, 2.0)
-                new_temp = base_temp + activity_temp + variation
-                return max(20.0, min(60.0, new_temp))
-            
-            # Motherboard
-            elif sensor_key == 'motherboard':
-                base_temp = sensor_info.get('current', 28.0)
-                variation = random.uniform(-0.3, 0.8)
-                new_temp = base_temp + variation
-                return max(25.0, min(40.0, new_temp))
-            
-            # Chipset
-            elif sensor_key == 'chipset':
-                base_temp = sensor_info.get('current', 35.0)
-                variation = random.uniform(-0.5, 1.0)
-                new_temp = base_temp + variation
-                return max(30.0, min(45.0, new_temp))
-            
-            # South Bridge
-            elif sensor_key == 'southbridge':
-                base_temp = sensor_info.get('current', 32.0)
-                variation = random.uniform(-0.4, 0.8)
-                new_temp = base_temp + variation
-                return max(28.0, min(42.0, new_temp))
-            
-            # PCIe Slots
-            elif 'pcie_slot_' in sensor_key:
-                slot_num = int(sensor_key.split('_')[-1])
-                base_temp = 30.0
-                slot_variation = random.uniform(-0.5, 1.5) + (slot_num * 0.3)
-                new_temp = base_temp + slot_variation
-                return max(25.0, min(40.0, new_temp))
-            
-            # VRM
-            elif sensor_key == 'vrm':
-                cpu_freq = psutil.cpu_freq()
-                base_temp = 40.0
-                freq_factor = (cpu_freq.current / 3000.0) * 12.0 if cpu_freq else 0
-                load_factor = (cpu_percent / 100.0) * 15.0
-                variation = random.uniform(-1.0, 2.0)
-                new_temp = base_temp + freq_factor + load_factor + variation
-                return max(35.0, min(95.0, new_temp))
-            
-            # Storage
-            elif 'storage_' in sensor_key:
-                try:
-                    disk_io = psutil.disk_io_counters()
-                    if disk_io:
-                        disk_activity = (disk_io.read_bytes + disk_io.write_bytes) / (1024**3)
-                        activity_temp = min(disk_activity / 100.0, 15.0)
-                    else:
-                        activity_temp = 0
-                    
-                    # SSD (temperatura più bassa)
-                    if 'ssd' in sensor_key:
-                        base_temp = 28.0
-                        variation = random.uniform(-0.8, 1.2)
-                        new_temp = base_temp + activity_temp + variation
-                        return max(20.0, min(45.0, new_temp))
-                    
-                    # HDD (temperatura più alta)
-                    elif 'hdd' in sensor_key:
-                        base_temp = 35.0
-                        variation = random.uniform(-1.0, 2.0)
-                        new_temp = base_temp + activity_temp + variation
-                        return max(30.0, min(55.0, new_temp))
-                    
-                    # NVMe (temperatura media)
-                    elif 'nvme' in sensor_key:
-                        base_temp = 32.0
-                        variation = random.uniform(-0.5, 1.5)
-                        new_temp = base_temp + activity_temp + variation
-                        return max(25.0, min(50.0, new_temp))
-                    
-                    # Altri storage
-                    else:
-                        base_temp = sensor_info.get('current', 32.0)
-                        variation = random.uniform(-0.5, 1.0)
-                        new_temp = base_temp + variation
-                        return max(25.0, min(55.0, new_temp))
-                        
-                except:
-                    base_temp = sensor_info.get('current', 32.0)
-                    variation = random.uniform(-0.5, 1.0)
-                    return max(25.0, min(55.0, base_temp + variation))
-            
-            # PSU
-            elif sensor_key == 'psu':
-                system_load = (cpu_percent + memory_percent) / 2.0
-                base_temp = 35.0
-                load_temp = (system_load / 100.0) * 15.0
-                variation = random.uniform(-0.8, 1.2)
-                new_temp = base_temp + load_temp + variation
-                return max(30.0, min(65.0, new_temp))
-            
-            # Fallback per altri sensori
-            else:
-                base_temp = sensor_info.get('current', 40.0)
-                variation = random.uniform(-0.5, 1.0)
-                return max(20.0, min(80.0, base_temp + variation))
-                
-        except Exception as e:
-            logging.debug(f"Failed to update simulated sensor {sensor_key}: {e}")
-            return sensor_info.get('current', 40.0)
+    def _sensor_output_view(self, copy: bool) -> Dict[str, Dict]:
+        """Restituisce il buffer di output condiviso o una sua copia indipendente."""
+        if copy:
+            return {key: dict(row) for key, row in self._sensor_output.items()}
+        return self._sensor_output
+    
+    def _prepare_sensor_layout(self):
+        """Prepara le strutture parallele per l'aggiornamento, ricalcolate solo dopo un rescan.
+        
+        I valori rilevati restano in `_sensor_base` e quelli aggiornati in `_sensor_current`,
+        entrambi array di double indicizzati come `_sensor_keys`.
+        """
+        keys = list(self.sensors)
+        resolved = [self._resolve_sensor_handler(key, self.sensors[key]) for key in keys]
+        
+        self._sensor_keys = keys
+        self._sensor_update_fns = [entry[0] for entry in resolved]
+        self._sensor_indices = [entry[1] for entry in resolved]
+        self._sensor_mins = array('d', (entry[2] for entry in resolved))
+        self._sensor_maxs = array('d', (entry[3] for entry in resolved))
+        self._sensor_base = array('d', (self.sensors[key].get('current', 30.0) for key in keys))
+        self._sensor_current = array('d', self._sensor_base)
+        
+        # Buffer di output riutilizzato: una copia per sensore, creata solo dopo un rescan
+        self._sensor_output = {key: dict(self.sensors[key]) for key in keys}
+        self._sensor_output_rows = list(self._sensor_output.values())
+        self._layout_source = self.sensors
+    
+    def _resolve_sensor_handler(self, sensor_key: str, sensor_info: Dict) -> tuple:
+        """Restituisce (handler, indice, min, max) per un sensore; l'indice è il numero finale della chiave."""
+        # I sensori reali (non simulati) ricevono solo una piccola variazione
+        if 'Simulated' not in sensor_info.get('method', ''):
+            return self._update_real_sensor, 0, 20.0, 100.0
+        
+        entry = self._sensor_dispatch.get(sensor_key)
+        if entry is not None:
+            handler, lo, hi = entry
+            return handler, 0, lo, hi
+        
+        for prefix, prefix_handler, lo, hi in self._sensor_prefix_dispatch:
+            if sensor_key.startswith(prefix):
+                suffix = sensor_key.rsplit('_', 1)[-1]
+                return prefix_handler, int(suffix) if suffix.isdigit() else 0, lo, hi
+        
+        if sensor_key.startswith('storage_'):
+            if 'ssd' in sensor_key:
+                return self._update_ssd_sensor, 0, 20.0, 45.0
+            if 'hdd' in sensor_key:
+                return self._update_hdd_sensor, 0, 30.0, 55.0
+            if 'nvme' in sensor_key:
+                return self._update_nvme_sensor, 0, 25.0, 50.0
+            return self._update_other_storage_sensor, 0, 25.0, 55.0
+        
+        return self._update_fallback_sensor, 0, 20.0, 80.0
+    
+    @staticmethod
+    def _disk_activity_temp(snapshot: _SystemSnapshot) -> float:
+        """Contributo termico dell'attività disco aggregata."""
+        disk_io = snapshot.disk_io
+        if not disk_io:
+            return 0
+        disk_activity = (disk_io.read_bytes + disk_io.write_bytes) / (1024**3)
+        return min(disk_activity / 100.0, 15.0)
+    
+    # Handler di aggiornamento: (indice, valore rilevato, snapshot, rumore in [0, 1)) -> temperatura
+    # non limitata; i limiti di ogni sensore sono nelle tabelle di dispatch
+    
+    def _update_real_sensor(self, index, base, snapshot, noise):
+        return base - 0.5 + noise
+    
+    def _update_cpu_package(self, index, base, snapshot, noise):
+        freq_factor = snapshot.freq_ratio * 10.0
+        load_factor = (snapshot.cpu_percent / 100.0) * 20.0
+        variation = (-0.8 + 2.0 * noise) + (snapshot.time_factor * 0.5)
+        return 35.0 + freq_factor + load_factor + variation
+    
+    def _update_cpu_core(self, index, base, snapshot, noise):
+        freq_factor = snapshot.freq_ratio * 8.0
+        load_factor = (snapshot.cpu_percent / 100.0) * 18.0
+        core_variation = (-2.0 + 6.0 * noise) + (index * 0.5)  # Ogni core leggermente diverso
+        return 35.0 + freq_factor + load_factor + core_variation
+    
+    def _update_cpu_thread(self, index, base, snapshot, noise):
+        load_factor = (snapshot.cpu_percent / 100.0) * 16.0
+        thread_variation = (-1.0 + 4.0 * noise) + (index * 0.3)
+        return 35.0 + load_factor + thread_variation
+    
+    def _update_ram_module(self, index, base, snapshot, noise):
+        memory = snapshot.memory
+        ram_usage = (memory.used / memory.total) * 15.0
+        module_variation = (-1.5 + 4.0 * noise) + (index * 0.8)
+        return 25.0 + ram_usage + module_variation
+    
+    def _update_ram_controller(self, index, base, snapshot, noise):
+        memory = snapshot.memory
+        ram_usage = (memory.used / memory.total) * 10.0
+        return 30.0 + ram_usage + (-1.0 + 3.0 * noise)
+    
+    def _update_ram_dimm(self, index, base, snapshot, noise):
+        dimm_variation = (-1.0 + 4.0 * noise) + (index * 0.5)
+        return 28.0 + dimm_variation
+    
+    @staticmethod
+    def _make_gpu_handler(base_temp: float, scale: float, noise_low: float, noise_span: float):
+        """Crea l'handler di un sensore GPU: base + attività GPU condivisa * scala + rumore."""
+        def update(index, base, snapshot, noise):
+            return base_temp + snapshot.gpu_activity * scale + (noise_low + noise_span * noise)
+        return update
+    
+    def _update_motherboard(self, index, base, snapshot, noise):
+        return base + (-0.3 + 1.1 * noise)
+    
+    def _update_chipset(self, index, base, snapshot, noise):
+        return base + (-0.5 + 1.5 * noise)
+    
+    def _update_southbridge(self, index, base, snapshot, noise):
+        return base + (-0.4 + 1.2 * noise)
+    
+    def _update_pcie_slot(self, index, base, snapshot, noise):
+        slot_variation = (-0.5 + 2.0 * noise) + (index * 0.3)
+        return 30.0 + slot_variation
+    
+    def _update_vrm(self, index, base, snapshot, noise):
+        freq_factor = snapshot.freq_ratio * 12.0
+        load_factor = (snapshot.cpu_percent / 100.0) * 15.0
+        return 40.0 + freq_factor + load_factor + (-1.0 + 3.0 * noise)
+    
+    def _update_ssd_sensor(self, index, base, snapshot, noise):
+        # SSD (temperatura più bassa)
+        activity_temp = self._disk_activity_temp(snapshot)
+        return 28.0 + activity_temp + (-0.8 + 2.0 * noise)
+    
+    def _update_hdd_sensor(self, index, base, snapshot, noise):
+        # HDD (temperatura più alta)
+        activity_temp = self._disk_activity_temp(snapshot)
+        return 35.0 + activity_temp + (-1.0 + 3.0 * noise)
+    
+    def _update_nvme_sensor(self, index, base, snapshot, noise):
+        # NVMe (temperatura media)
+        activity_temp = self._disk_activity_temp(snapshot)
+        return 32.0 + activity_temp + (-0.5 + 2.0 * noise)
+    
+    def _update_other_storage_sensor(self, index, base, snapshot, noise):
+        return base + (-0.5 + 1.5 * noise)
+    
+    def _update_psu(self, index, base, snapshot, noise):
+        system_load = (snapshot.cpu_percent + snapshot.memory_percent) / 2.0
+        load_temp = (system_load / 100.0) * 15.0
+        return 35.0 + load_temp + (-0.8 + 2.0 * noise)
+    
+    def _update_fallback_sensor(self, index, base, snapshot, noise):
+        return base + (-0.5 + 1.5 * noise)
 
     def _initialize_fan_status(self):
         """Initialize fan status with default values."""
@@ -1334,132 +1538,214 @@ class UniversalHardwareMonitor:
         if not self.fan_status:
             self._initialize_fan_status()
         
-        # Update fan status with realistic variations
-        self._update_fan_status_real_time()
+        # Update fan status with realistic variations, al ritmo del polling adattivo
+        now = time.monotonic()
+        if now - self._last_fan_poll >= self.poll_interval:
+            self._last_fan_poll = now
+            self._adapt_fan_poll_interval(self._update_fan_status_real_time())
         return self.fan_status
-
-    def _update_fan_status_real_time(self):
-        """Update fan status with realistic real-time variations."""
-        try:
-            import time
-            current_time = time.time()
-            
-            # Base variations based on time
-            time_factor = (current_time % 60) / 60.0  # 0 to 1 over 60 seconds
-            
-            for fan_id, fan_info in self.fan_status.items():
-                # Get base values
-                base_rpm = fan_info.get('max_rpm', 2000) * 0.4  # 40% base speed
-                base_speed = 40
-                
-                # Add realistic variations
-                if fan_id == 'cpu_fan':
-                    # CPU fan varies more based on load simulation
-                    load_variation = random.uniform(0.3, 0.8)
-                    rpm_variation = random.uniform(-100, 200)
-                    current_rpm = int(base_rpm * load_variation + rpm_variation)
-                    current_speed = int((current_rpm / fan_info.get('max_rpm', 2000)) * 100)
+    
+    def _adapt_fan_poll_interval(self, max_delta: Optional[int]):
+        """Allunga l'intervallo di polling se le velocità sono stabili, lo azzera a ogni cambio.
+        
+        `max_delta` è la massima variazione di velocità dell'ultimo aggiornamento,
+        None se non è stata letta alcuna sorgente: il tick non conta per il back-off.
+        """
+        if max_delta is None:
+            return
+        if max_delta < self.fan_hysteresis:
+            self.poll_interval = min(self.max_interval, self.poll_interval * 2)
+        else:
+            self._reset_fan_poll_interval()
+    
+    def _reset_fan_poll_interval(self):
+        """Riporta il polling delle ventole all'intervallo minimo."""
+        self.poll_interval = self.min_interval
+
+    def _ensure_fan_layout(self) -> bool:
+        """Prepara le strutture parallele delle ventole se `fan_status` è stato sostituito."""
+        if self._fan_layout_source is not self.fan_status or len(self._fan_ids) != len(self.fan_status):
+            self._prepare_fan_layout()
+            return True
+        return False
+    
+    def _prepare_fan_layout(self):
+        """Precalcola i dati statici delle ventole e copia i valori correnti in liste parallele."""
+        fan_ids = tuple(self.fan_status)  # Indice -> id ventola, invariato fino al prossimo layout
+        self._fan_ids = fan_ids
+        self._fan_index = {fan_id: i for i, fan_id in enumerate(fan_ids)}
+        self._fan_rows = [self.fan_status[fan_id] for fan_id in fan_ids]
+        self._fan_max_rpm = [row.get('max_rpm', 2000) for row in self._fan_rows]
+        self._fan_base_rpm = [max_rpm * 0.4 for max_rpm in self._fan_max_rpm]  # 40% base speed
+        
+        # Ventole raggruppate per sorgente: una lettura per sorgente, distribuita alle sue ventole
+        self._fan_sources = {}
+        for i, fan_id in enumerate(fan_ids):
+            source = self._fan_source(fan_id)
+            self._fan_sources.setdefault(source, []).append(i)
+        self._fan_source_last_poll = dict.fromkeys(self._fan_sources, float('-inf'))
+        
+        self._fan_rpm = [row.get('current_rpm', 0) for row in self._fan_rows]
+        self._fan_speed = [row.get('current_speed', 0) for row in self._fan_rows]
+        self._fan_status_level = [self._fan_status_level_for(speed) for speed in self._fan_speed]
+        self._fan_layout_source = self.fan_status
+    
+    @staticmethod
+    def _fan_status_level_for(speed_percent) -> int:
+        """Livello di stato (indice in _FAN_STATUS_NAMES) per una velocità qualsiasi."""
+        return _FAN_STATUS_LEVEL_BY_PCT[min(100, max(0, int(speed_percent)))]
+    
+    @staticmethod
+    def _fan_source(fan_id: str) -> str:
+        """Sorgente hardware che controlla la ventola: 'cpu', 'gpu' o 'case'."""
+        if fan_id.startswith('cpu'):
+            return 'cpu'
+        if fan_id.startswith('gpu'):
+            return 'gpu'
+        return 'case'
+    
+    def _update_fan_status_real_time(self) -> Optional[int]:
+        """Update fan status with realistic real-time variations.
+        
+        Un unico passaggio per ventola: campiona, limita, classifica e riporta il
+        risultato in fan_status. Restituisce la massima variazione di velocità,
+        None se nessuna sorgente è stata letta; se i valori non sono confrontabili
+        (layout ricreato o aggiornamento fallito) azzera il polling adattivo.
+        """
+        try:
+            layout_rebuilt = self._ensure_fan_layout()
+            
+            now = time.monotonic()
+            max_delta = None
+            fan_rpm = self._fan_rpm
+            fan_speed = self._fan_speed
+            fan_status_level = self._fan_status_level
+            fan_rows = self._fan_rows
+            status_by_pct = _FAN_STATUS_LEVEL_BY_PCT
+            max_rpms = self._fan_max_rpm
+            base_rpms = self._fan_base_rpm
+            
+            for source, indices in self._fan_sources.items():
+                # Ogni sorgente viene letta al massimo una volta per il suo intervallo
+                if now - self._fan_source_last_poll[source] < self._FAN_SOURCE_INTERVALS[source]:
+                    continue
+                self._fan_source_last_poll[source] = now
+                if max_delta is None:
+                    max_delta = 0
+                
+                # Un solo campione di carico per sorgente, più lo scarto RPM di ogni ventola
+                load_lo, load_span, rpm_lo, rpm_span = self._FAN_VARIATION[source]
+                load = load_lo + load_span * random.random()
+                offsets = _jitter(rpm_lo, rpm_lo + rpm_span, len(indices))
+                
+                for i, offset in zip(indices, offsets):
+                    max_rpm = max_rpms[i]
+                    current_rpm = int(base_rpms[i] * load + offset)
+                    current_speed = int((current_rpm / max_rpm) * 100)
                     
-                elif fan_id == 'gpu_fan':
-                    # GPU fan varies based on GPU load simulation
-                    gpu_load = random.uniform(0.2, 0.9)
-                    current_rpm = int(base_rpm * gpu_load + random.uniform(-50, 150))
-                    current_speed = int((current_rpm / fan_info.get('max_rpm', 3000)) * 100)
+                    # Ensure values are within reasonable bounds; lo stato segue la velocità limitata
+                    current_rpm = max(200, min(max_rpm, current_rpm))
+                    current_speed = max(10, min(100, current_speed))
+                    level = status_by_pct[current_speed]
                     
-                else:
-                    # Case fans have smaller variations
-                    case_variation = random.uniform(0.8, 1.2)
-                    current_rpm = int(base_rpm * case_variation + random.uniform(-30, 50))
-                    current_speed = int((current_rpm / fan_info.get('max_rpm', 1500)) * 100)
-                
-                # Ensure values are within reasonable bounds
-                current_rpm = max(200, min(fan_info.get('max_rpm', 2000), current_rpm))
-                current_speed = max(10, min(100, current_speed))
-                
-                # Update fan status
-                self.fan_status[fan_id]['current_rpm'] = current_rpm
-                self.fan_status[fan_id]['current_speed'] = current_speed
-                
-                # Update status based on speed
-                if current_speed > 80:
-                    self.fan_status[fan_id]['status'] = 'High'
-                elif current_speed > 60:
-                    self.fan_status[fan_id]['status'] = 'Medium'
-                else:
-                    self.fan_status[fan_id]['status'] = 'Normal'
+                    delta = abs(current_speed - fan_speed[i])
+                    if delta > max_delta:
+                        max_delta = delta
                     
-        except Exception as e:
-            logging.debug(f"Error updating fan status: {e}")
+                    # Scrive solo i valori effettivamente cambiati
+                    row = fan_rows[i]
+                    if fan_rpm[i] != current_rpm:
+                        fan_rpm[i] = current_rpm
+                        row['current_rpm'] = current_rpm
+                    if delta:
+                        fan_speed[i] = current_speed
+                        row['current_speed'] = current_speed
+                    if fan_status_level[i] != level:
+                        fan_status_level[i] = level
+                        row['status'] = _FAN_STATUS_NAMES[level]
+            
+            if layout_rebuilt:
+                self._reset_fan_poll_interval()
+                return None
+            return max_delta
+                    
+        except (ArithmeticError, TypeError) as e:
+            # max_rpm nullo o non numerico in una voce di fan_status
+            logging.debug("Error updating fan status: %s", e)
+            self._reset_fan_poll_interval()
+            return None
     
     def detect_fans(self) -> Dict[str, Dict]:
         """Detect available fans in the system."""
-        fans = {}
-        
-        try:
-            # Create simulated fans for demonstration
-            fans = {
-                'cpu_fan': {
-                    'name': 'CPU Fan',
-                    'current_rpm': 1200,
-                    'current_speed': 60,
-                    'max_rpm': 2000,
-                    'status': 'Normal',
-                    'type': 'CPU',
-                    'controllable': True
-                },
-                'case_fan': {
-                    'name': 'Case Fan',
-                    'current_rpm': 800,
-                    'current_speed': 40,
-                    'max_rpm': 1500,
-                    'status': 'Normal',
-                    'type': 'Case',
-                    'controllable': True
-                },
-                'gpu_fan': {
-                    'name': 'GPU Fan',
-                    'current_rpm': 1000,
-                    'current_speed': 50,
-                    'max_rpm': 3000,
-                    'status': 'Normal',
-                    'type': 'GPU',
-                    'controllable': True
-                }
-            }
-            
-            logging.info(f"Detected {len(fans)} simulated fans")
-            
-        except Exception as e:
-            logging.error(f"Failed to detect fans: {e}")
-        
-        return fans
+        # Create simulated fans for demonstration (una copia, creata al primo rilevamento)
+        if self._detected_fans is None:
+            self._detected_fans = {fan_id: dict(fan) for fan_id, fan in _SIMULATED_FANS.items()}
+            logging.info("Detected %s simulated fans", len(self._detected_fans))
+        return self._detected_fans
     
     def set_fan_speed(self, fan_id: str, speed_percent: int) -> bool:
         """Set fan speed for a specific fan."""
+        self._ensure_fan_layout()
+        index = self._fan_index.get(fan_id)
+        if index is None:
+            logging.warning("Fan %s not found", fan_id)
+            return False
+        
+        fan_speed = self._fan_speed
+        # Nessuna scrittura né log se la velocità è già quella richiesta
+        if fan_speed[index] == speed_percent:
+            return True
+        
+        # Solo il calcolo degli RPM può fallire, con una velocità non numerica
         try:
-            if fan_id in self.fan_status:
-                # Update fan status
-                self.fan_status[fan_id]['current_speed'] = speed_percent
-                self.fan_status[fan_id]['current_rpm'] = int(
-                    (speed_percent / 100.0) * self.fan_status[fan_id]['max_rpm']
-                )
-                
-                logging.info(f"Set {fan_id} speed to {speed_percent}% ({self.fan_status[fan_id]['current_rpm']} RPM)")
-                return True
-            else:
-                logging.warning(f"Fan {fan_id} not found")
-                return False
-                
-        except Exception as e:
-            logging.error(f"Failed to set fan speed for {fan_id}: {e}")
+            current_rpm = int(speed_percent * self._fan_max_rpm[index]) // 100
+        except (TypeError, ValueError) as e:
+            logging.error("Failed to set fan speed for %s: %s", fan_id, e)
             return False
+        
+        self._apply_fan_speeds((index,), speed_percent, (current_rpm,))
+        logging.info("Set %s speed to %d%% (%d RPM)", fan_id, speed_percent, current_rpm)
+        return True
     
     def set_all_fans_speed(self, speed_percent: int) -> Dict[str, bool]:
         """Set speed for all fans."""
-        results = {}
-        for fan_id in self.fan_status.keys():
-            results[fan_id] = self.set_fan_speed(fan_id, speed_percent)
-        return results
+        self._ensure_fan_layout()
+        
+        # Solo le ventole non già alla velocità richiesta, scritte in un unico passaggio
+        changed = [i for i, current_speed in enumerate(self._fan_speed) if current_speed != speed_percent]
+        if changed:
+            max_rpms = self._fan_max_rpm
+            try:
+                rpms = [int(speed_percent * max_rpms[i]) // 100 for i in changed]
+            except (TypeError, ValueError) as e:
+                logging.error("Failed to set fan speed for all fans: %s", e)
+                return {fan_id: current_speed == speed_percent
+                        for fan_id, current_speed in zip(self._fan_ids, self._fan_speed)}
+            
+            self._apply_fan_speeds(changed, speed_percent, rpms)
+            logging.info("Set %d fans to %d%% speed", len(changed), speed_percent)
+        
+        return dict.fromkeys(self._fan_ids, True)
+    
+    def _apply_fan_speeds(self, indices, speed_percent, rpms):
+        """Scrive velocità, RPM e stato delle ventole indicate nelle liste parallele e in fan_status."""
+        level = self._fan_status_level_for(speed_percent)
+        status = _FAN_STATUS_NAMES[level]
+        fan_speed = self._fan_speed
+        fan_rpm = self._fan_rpm
+        fan_status_level = self._fan_status_level
+        fan_rows = self._fan_rows
+        
+        for index, current_rpm in zip(indices, rpms):
+            fan_speed[index] = speed_percent
+            fan_rpm[index] = current_rpm
+            fan_status_level[index] = level
+            fan_info = fan_rows[index]
+            fan_info['current_speed'] = speed_percent
+            fan_info['current_rpm'] = current_rpm
+            fan_info['status'] = status
+        
+        self.poll_interval = self.min_interval  # Cambio esplicito: torna al polling rapido
 
 
 # ============================================================================
@@ -1477,27 +1763,104 @@ import logging
 import platform
 from tkinter import filedialog
 import subprocess
-import webbrowser
-import zipfile
-import hashlib
-import requests
-import configparser
-import ollama
-import pythoncom
 # UniversalHardwareMonitor class is defined inline above
+# I moduli pesanti (ollama, requests, pywin32, ...) sono caricati su richiesta: vedi _LazyModule
 
-from win32com.client import Dispatch
-import win32api
-import win32con
-if platform.system() == "Windows":
-    import winreg
 
+@functools.lru_cache(maxsize=256)
+def _darken_color_cached(hex_color, factor):
+    """Darken a hex color by a factor (0-1); memoized, the inputs are a handful of accent colors."""
+    try:
+        # Remove # if present
+        hex_color = hex_color.lstrip('#')
+        
+        # Convert to RGB
+        r = int(hex_color[0:2], 16)
+        g = int(hex_color[2:4], 16)
+        b = int(hex_color[4:6], 16)
+        
+        # Darken
+        r = int(r * (1 - factor))
+        g = int(g * (1 - factor))
+        b = int(b * (1 - factor))
+        
+        # Convert back to hex
+        return f"#{r:02x}{g:02x}{b:02x}"
+    except (ValueError, AttributeError):
+        return hex_color  # Return original if conversion fails
 
 
 class App(ctk.CTk):
+    # Stile condiviso dei pulsanti della barra laterale
+    NAV_BUTTON_STYLE = {
+        "corner_radius": 0,
+        "height": 40,
+        "border_spacing": 10,
+        "fg_color": "transparent",
+        "text_color": ("gray5", "gray95"),
+        "hover_color": ("gray75", "gray25"),
+        "anchor": "w",
+    }
+    # Stile dei pulsanti d'azione in colore accento
+    ACCENT_BUTTON_STYLE = {"fg_color": "#4A9EFF", "hover_color": "#3A8EFF"}
+    # Parti fisse dell'elenco modelli Ollama (show_available_models)
+    MODELS_HEADER = "🤖 **Available Ollama Models:**\n\n"
+    MODELS_TIPS = (
+        "\n\n💡 **Tips:**\n"
+        "• To install a new model: `ollama pull model_name`\n"
+        "• Fast models: llama3.2:1b, gemma3:1b\n"
+        "• Powerful models: llama3.2:8b, llama3.2:70b\n"
+        "• Instruction models: add '-instruct' to the name\n"
+    )
+    # (nome frame, etichetta, riga, pady) - il nome determina attributo e callback
+    NAV_SPEC = (
+        ("home", "Home", 3, 0),
+        ("disk_cleanup", "Disk Cleanup", 4, 0),
+        ("ram_optimizer", "RAM Optimizer", 5, 0),
+        ("hardware_monitor", "Hardware Monitor", 6, 0),
+        ("network_manager", "Network Manager", 7, 0),
+        ("assistant", "AI Assistant", 2, (20, 0)),
+        ("sandbox", "Security Sandbox", 8, 0),
+        ("credits", "Credits", 10, 0),
+        ("guide", "Guide", 11, 0),
+    )
+
+    # (attributo, tipo colore, tipo font) dei widget che seguono colore e font correnti
+    THEMED_WIDGETS = (
+        ("tools_guide_button", "button", "button"),
+        ("ram_progress_bar", "progressbar", None),
+        ("optimize_ram_button", "button", "button"),
+        ("clean_ram_button", "button", "button"),
+        ("kill_process_button", "button", "button"),
+        ("autoruns_button", "button", "button"),
+        ("process_explorer_button", "button", "button"),
+        ("ping_test_button", "button", "button"),
+        ("speed_test_button", "button", "button"),
+        ("connection_test_button", "button", "button"),
+        ("troubleshoot_button", "button", "button"),
+        ("refresh_hardware_button", "button", "button"),
+        ("hwinfo_title", "label", "large"),
+        ("hwinfo_desc", "label", "normal"),
+        ("launch_hwinfo_button", "button", "button"),
+        ("open_tools_folder_button", "button", "button"),
+        ("download_hwinfo_button", "button", "button"),
+        ("visit_hwinfo_website_button", "button", "button"),
+        ("cpuz_title", "label", "large"),
+        ("launch_cpuz_button", "button", "button"),
+        ("open_tools_folder_cpuz_button", "button", "button"),
+        ("download_cpuz_button", "button", "button"),
+        ("visit_cpuz_website_button", "button", "button"),
+        ("fancontrol_title", "label", "large"),
+        ("launch_fancontrol_button", "button", "button"),
+        ("open_tools_folder_fancontrol_button", "button", "button"),
+        ("download_fancontrol_button", "button", "button"),
+        ("visit_fancontrol_website_button", "button", "button"),
+    )
+
     def __init__(self):
 
         super().__init__()
+        self._font_cache = {}  # (size, weight, family) -> CTkFont condiviso tra i widget
 
         self.title("PC Tool Manager")
         self.geometry("1000x700")
@@ -1518,25 +1881,48 @@ class App(ctk.CTk):
         self.maxsize(1000, 700)  # Set maximum size to current size
         self.minsize(1000, 700)  # Set minimum size to current size
         
-        # Imposta l'icona personalizzata immediatamente
-        self.set_custom_icon()
-
         # --- LOGGING SETUP ---
-        logging.basicConfig(filename='debug.log', level=logging.DEBUG, 
-                            format='%(asctime)s - %(levelname)s - %(message)s',
-                            filemode='w') # 'w' to overwrite the log on each run
+        # Prima di qualsiasi chiamata di logging (es. set_custom_icon): altrimenti
+        # basicConfig() implicito installa un handler su stderr e il nostro è ignorato
+        # La scrittura su file avviene in un thread dedicato: le chiamate di logging
+        # dal thread della UI e dai worker del monitor accodano soltanto il record
+        log_file_handler = logging.handlers.RotatingFileHandler(
+            os.path.join(self.app_path, 'debug.log'), maxBytes=2_000_000, backupCount=2)
+        if log_file_handler.stream.tell():
+            try:
+                log_file_handler.doRollover()  # Ogni esecuzione parte da un debug.log vuoto
+            except OSError:
+                pass  # File in uso da un'altra istanza (WinError 32): si continua ad accodare
+        log_file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        log_queue = queue.SimpleQueue()
+        self._log_listener = logging.handlers.QueueListener(log_queue, log_file_handler)
+        self._log_listener.start()
+        # Svuota la coda sul file all'uscita, qualunque sia il percorso di chiusura
+        atexit.register(self._log_listener.stop)
+        # Nell'eseguibile compilato si registrano solo avvisi ed errori
+        log_level = logging.WARNING if getattr(sys, 'frozen', False) else logging.DEBUG
+        logging.basicConfig(level=log_level, handlers=[logging.handlers.QueueHandler(log_queue)])
         logging.debug("Application starting...")
 
+        # Imposta l'icona personalizzata immediatamente
+        self._icon_path = None  # Percorso di app.ico, risolto alla prima chiamata
+        self.set_custom_icon()
+
         # --- OLLAMA SETUP ---
         self.current_frame = "home"  # Track current frame
+        self._pending_frame_switch = None  # after() del cambio di frame richiesto dai pulsanti
         self.ollama_available = False
         self.ai_error_message = ""
+        self.conversation_history = []
+        self._ollama_probe = None  # (monotonic, stato, dettaglio) dell'ultimo controllo di Ollama
+        self._ollama_probe_ttl = 5.0  # Secondi per cui il controllo resta valido
+        self._ollama_probe_waiters = []  # Callback in attesa del controllo in corso
         self.hardware_update_job = None # Job for self.after
-        self.visible_sensors = set()  # Traccia i sensori da visualizzare
+        self.visible_sensors = frozenset()  # Sensori da visualizzare: si riassegna, non si modifica
         self.pending_navigation = None  # Comando di navigazione in attesa di conferma
         
-        # --- HARDWARE MONITOR FLAGS ---
-        self.hardware_monitor_created = False  # Flag per evitare creazione multipla
+        # --- FRAME FLAGS ---
+        self._frames_built = set()  # Frame i cui widget sono già stati creati
         
         # --- ADMIN PRIVILEGES CHECK ---
         # Check if the app actually has administrator privileges
@@ -1552,8 +1938,9 @@ class App(ctk.CTk):
         # Flag per evitare richieste ripetute di privilegi amministratore
         self._admin_refused = False
         
-        # Thread management
-        self.active_threads = {}
+        # Thread management: background tasks share a small worker pool
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="pctm")
+        self.active_threads = {}  # name -> Future
         self.thread_stop_events = {}
         
         # Sandboxie Plus custom path
@@ -1567,38 +1954,32 @@ class App(ctk.CTk):
             'font_size': 12
         }
         self.settings_file = os.path.join(self.app_path, 'settings.ini')
+        self._custom_settings_applied = False
         self.load_settings()
         
-        # Check ollama and admin status with delay
-        self.after(1000, self.check_ollama_status)
+        # Deferred startup steps (icon, Ollama, tool monitoring, interface update)
+        # run one at a time from a single after() chain
         # Admin status check removed for open source version
-        # self.after(500, self.check_admin_status)
-        
-        # Start automatic tool detection monitoring
-        self.after(2000, self.start_tool_monitoring)
-        
-        # Force initial interface update after monitoring starts (always show loading)
-        self.after(3000, self.force_initial_interface_update_with_loading)
-        
-        # Forza l'impostazione dell'icona dopo un breve delay per assicurarsi che appaia
-        self.after(200, self.set_custom_icon)
+        self._post_init_iter = self._post_init_pipeline()
+        self._post_init_job = self.after(200, self._pump_post_init)
         
         # DISABILITATO - Causa problemi di loop infinito
         # self.after(2000, self.force_taskbar_icon)
         
         # Bind keyboard shortcuts to prevent full screen
+        # <F11> matches F11 with any modifier held, Control included
         self.bind("<F11>", self._prevent_fullscreen)
-        self.bind("<Control-F11>", self._prevent_fullscreen)
-        self.bind("<Control-Key-F11>", self._prevent_fullscreen)
 
         # Set grid layout 1x2
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(1, weight=1)
+        # La finestra ha dimensione fissa: i figli non devono ricalcolarne la geometria
+        self.grid_propagate(False)
 
         # Create navigation frame
         self.navigation_frame = ctk.CTkFrame(self, corner_radius=0)
         self.navigation_frame.grid(row=0, column=0, sticky="nsew")
-        self.navigation_frame.grid_rowconfigure(10, weight=1)
+        self.navigation_frame.grid_rowconfigure(9, weight=1)  # Riga vuota: spinge Credits e Guide in fondo
 
         # Header frame for title and settings button
         self.header_frame = ctk.CTkFrame(self.navigation_frame, fg_color="transparent")
@@ -1606,7 +1987,7 @@ class App(ctk.CTk):
         self.header_frame.grid_columnconfigure(0, weight=1)
         
         self.navigation_frame_label = ctk.CTkLabel(self.header_frame, text="  Tool Manager",
-                                                     compound="left", font=ctk.CTkFont(size=15, weight="bold"))
+                                                     compound="left", font=self._font(15, "bold"))
         self.navigation_frame_label.grid(row=0, column=0, sticky="w")
         
         # Settings button in top right
@@ -1622,58 +2003,12 @@ class App(ctk.CTk):
         )
         self.settings_button.grid(row=0, column=1, sticky="e")
 
-        self.home_button = ctk.CTkButton(self.navigation_frame, corner_radius=0, height=40, border_spacing=10, text="Home",
-                                         fg_color="transparent", text_color=("gray5", "gray95"), hover_color=("gray75", "gray25"),
-                                         anchor="w", command=self.home_button_event)
-
-
-        self.disk_cleanup_button = ctk.CTkButton(self.navigation_frame, corner_radius=0, height=40, border_spacing=10, text="Disk Cleanup",
-                                                 fg_color="transparent", text_color=("gray5", "gray95"), hover_color=("gray75", "gray25"),
-                                                 anchor="w", command=self.disk_cleanup_button_event)
-
-
-        # Startup Manager button removed
-
-
-        self.ram_optimizer_button = ctk.CTkButton(self.navigation_frame, corner_radius=0, height=40, border_spacing=10, text="RAM Optimizer",
-                                                    fg_color="transparent", text_color=("gray5", "gray95"), hover_color=("gray75", "gray25"),
-                                                    anchor="w", command=self.ram_optimizer_button_event)
-
-
-        self.hardware_monitor_button = ctk.CTkButton(self.navigation_frame, corner_radius=0, height=40, border_spacing=10, text="Hardware Monitor",
-                                                     fg_color="transparent", text_color=("gray5", "gray95"), hover_color=("gray75", "gray25"),
-                                                     anchor="w", command=self.hardware_monitor_button_event)
-
-
-        self.network_manager_button = ctk.CTkButton(self.navigation_frame, corner_radius=0, height=40, border_spacing=10, text="Network Manager",
-                                                    fg_color="transparent", text_color=("gray5", "gray95"), hover_color=("gray75", "gray25"),
-                                                    anchor="w", command=self.network_manager_button_event)
-        self.assistant_button = ctk.CTkButton(self.navigation_frame, corner_radius=0, height=40, border_spacing=10, text="AI Assistant",
-                                                  fg_color="transparent", text_color=("gray5", "gray95"), hover_color=("gray75", "gray25"),
-                                                  anchor="w", command=self.assistant_button_event)
-        self.sandbox_button = ctk.CTkButton(self.navigation_frame, corner_radius=0, height=40, border_spacing=10, text="Security Sandbox",
-                                              fg_color="transparent", text_color=("gray5", "gray95"), hover_color=("gray75", "gray25"),
-                                              anchor="w", command=self.sandbox_button_event)
-
-        self.credits_button = ctk.CTkButton(self.navigation_frame, corner_radius=0, height=40, border_spacing=10, text="Credits",
-                                              fg_color="transparent", text_color=("gray5", "gray95"), hover_color=("gray75", "gray25"),
-                                              anchor="w", command=self.credits_button_event)
-
-        self.guide_button = ctk.CTkButton(self.navigation_frame, corner_radius=0, height=40, border_spacing=10, text="Guide",
-                                              fg_color="transparent", text_color=("gray5", "gray95"), hover_color=("gray75", "gray25"),
-                                              anchor="w", command=self.guide_button_event)
-
-        # Posizionamento dei pulsanti di navigazione
-        self.assistant_button.grid(row=2, column=0, sticky="ew", pady=(20,0)) # Move to top
-        self.home_button.grid(row=3, column=0, sticky="ew")
-        self.disk_cleanup_button.grid(row=4, column=0, sticky="ew")
-        # Startup manager button removed - row 5 skipped
-        self.ram_optimizer_button.grid(row=5, column=0, sticky="ew")
-        self.hardware_monitor_button.grid(row=6, column=0, sticky="ew")
-        self.network_manager_button.grid(row=7, column=0, sticky="ew")
-        self.sandbox_button.grid(row=9, column=0, sticky="ew")
-        self.credits_button.grid(row=10, column=0, sticky="ew")
-        self.guide_button.grid(row=11, column=0, sticky="ew")
+        # Pulsanti di navigazione costruiti dalla tabella NAV_SPEC
+        for name, text, row, pady in self.NAV_SPEC:
+            button = ctk.CTkButton(self.navigation_frame, text=text,
+                                   command=getattr(self, f"{name}_button_event"), **self.NAV_BUTTON_STYLE)
+            button.grid(row=row, column=0, sticky="ew", pady=pady)
+            setattr(self, f"{name}_button", button)
 
 
         # Create home frame
@@ -1685,11 +2020,11 @@ class App(ctk.CTk):
         self.home_scrollable_frame = ctk.CTkScrollableFrame(self.home_frame, label_text="Welcome")
         self.home_scrollable_frame.grid(row=0, column=0, padx=20, pady=20, sticky="nsew")
 
-        self.home_label = ctk.CTkLabel(self.home_scrollable_frame, text="Welcome to PC Tool Manager!", font=ctk.CTkFont(size=20, weight="bold"))
+        self.home_label = ctk.CTkLabel(self.home_scrollable_frame, text="Welcome to PC Tool Manager!", font=self._font(20, "bold"))
         self.home_label.pack(pady=20)
 
         self.home_label_subtitle = ctk.CTkLabel(self.home_scrollable_frame, text="Select a tool from the left menu to get started.",
-                                                font=ctk.CTkFont(size=14), wraplength=500, justify="center")
+                                                font=self._font(14), wraplength=500, justify="center")
         self.home_label_subtitle.pack(pady=10)
 
         # Pulsante Tools Guide nella home
@@ -1699,24 +2034,20 @@ class App(ctk.CTk):
             command=self.show_tools_guide,
             width=250,
             height=45,
-            font=ctk.CTkFont(size=16, weight="bold"),
-            fg_color="#4A9EFF", hover_color="#3A8EFF"
+            font=self._font(16, "bold"),
+            **self.ACCENT_BUTTON_STYLE
         )
         self.tools_guide_button.pack(pady=20)
-        
-        # Apply custom colors and fonts immediately
-        self._apply_color_to_widget(self.tools_guide_button, "button")
-        self._apply_font_to_widget(self.tools_guide_button, "button")
 
 
 
         # --- CREATE ALL FRAMES ---
+        # Only the containers are created here: their widgets are built by
+        # _ensure_frame_built on first navigation
         self.disk_cleanup_frame = ctk.CTkFrame(self, corner_radius=0, fg_color="transparent")
         # Startup manager frame removed
         self.ram_optimizer_frame = ctk.CTkFrame(self, corner_radius=0, fg_color="transparent")
         self.hardware_monitor_frame = ctk.CTkFrame(self, corner_radius=0, fg_color="transparent")
-        # Hardware monitor will be created on demand to prevent lag
-        self.hardware_monitor_created = False
         self.network_manager_frame = ctk.CTkFrame(self, corner_radius=0, fg_color="transparent")
         self.assistant_frame = ctk.CTkFrame(self, corner_radius=0, fg_color="transparent")
         self.sandbox_frame = ctk.CTkFrame(self, corner_radius=0, fg_color="transparent")
@@ -1726,19 +2057,41 @@ class App(ctk.CTk):
         self.hardware_monitor_frame.grid_columnconfigure(0, weight=1)
         self.hardware_monitor_frame.grid_rowconfigure(3, weight=1) # Allow disk frame to expand
 
-        # --- CONFIGURE GRIDS FOR ALL FRAMES ---
+        self.temp_files = []
+
+        self.ram_update_thread_stop = threading.Event()
+
+        # --- STARTUP MANAGER FRAME REMOVED ---
+
+        self.sandboxed_file_path = ""
+        self.virustotal_api_key = None # Variable to store API key
+        self._digest_cache = {}  # (path, size, mtime_ns) -> SHA-256 of files already scanned
+        
+        # Variabile per tracciare lo stato di Sandboxie-Plus
+        self.sandboxie_installed = False
+
+        # --- Percorsi e cartelle di supporto ---
+        if not os.path.exists(self.tools_path):
+            os.makedirs(self.tools_path)
+
+        # Apply accent color and fonts to the home widgets
+        self._apply_theme()
 
-        # --- DISK CLEANUP FRAME ---
+        # Select default frame
+        self.select_frame_by_name("home")
+
+    def _build_disk_cleanup_frame(self):
+        """Create the Disk Cleanup widgets."""
         self.disk_cleanup_frame.grid_columnconfigure(0, weight=1)
         self.disk_cleanup_frame.grid_rowconfigure(1, weight=1)
         self.disk_cleanup_frame.grid_rowconfigure(5, weight=1)  # Make tools section expandable
 
         self.disk_cleanup_label = ctk.CTkLabel(self.disk_cleanup_frame, text="Find and delete temporary files to free up space.",
-                                                 font=ctk.CTkFont(size=15))
+                                                 font=self._font(15))
         self.disk_cleanup_label.grid(row=0, column=0, padx=20, pady=10)
 
         self.scan_button = ctk.CTkButton(self.disk_cleanup_frame, text="Scan for temporary files", command=self.start_scan_thread,
-                                        fg_color="#4A9EFF", hover_color="#3A8EFF")
+                                        **self.ACCENT_BUTTON_STYLE)
         self.scan_button.grid(row=2, column=0, padx=20, pady=10)
 
         # Create scrollable frame for results
@@ -1752,7 +2105,7 @@ class App(ctk.CTk):
         self.total_size_label.grid(row=3, column=0, padx=20, pady=5)
 
         self.clean_button = ctk.CTkButton(self.disk_cleanup_frame, text="Clean", command=self.clean_temp_files, state="disabled",
-                                         fg_color="#4A9EFF", hover_color="#3A8EFF")
+                                         **self.ACCENT_BUTTON_STYLE)
         self.clean_button.grid(row=4, column=0, padx=20, pady=10)
 
         # Create scrollable frame for disk tools
@@ -1770,7 +2123,7 @@ class App(ctk.CTk):
             command=self.launch_crystaldiskinfo,
             width=180,
             height=35,
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=self._font(13, "bold"),
             fg_color="#E74C3C",
             hover_color="#C0392B"
         )
@@ -1783,15 +2136,14 @@ class App(ctk.CTk):
             command=self.launch_crystaldiskmark,
             width=180,
             height=35,
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=self._font(13, "bold"),
             fg_color="#E74C3C",
             hover_color="#C0392B"
         )
         self.crystaldiskmark_button.pack(side="left", padx=10, pady=10)
 
-        self.temp_files = []
-
-        # --- RAM OPTIMIZER FRAME ---
+    def _build_ram_optimizer_frame(self):
+        """Create the RAM Optimizer widgets."""
         self.ram_optimizer_frame.grid_columnconfigure(0, weight=1)
         self.ram_optimizer_frame.grid_rowconfigure(0, weight=1)
 
@@ -1799,33 +2151,22 @@ class App(ctk.CTk):
         self.ram_scrollable_frame = ctk.CTkScrollableFrame(self.ram_optimizer_frame, label_text="RAM Optimizer")
         self.ram_scrollable_frame.grid(row=0, column=0, padx=20, pady=20, sticky="nsew")
 
-        self.ram_label = ctk.CTkLabel(self.ram_scrollable_frame, text="Current RAM Usage:", font=ctk.CTkFont(size=15))
+        self.ram_label = ctk.CTkLabel(self.ram_scrollable_frame, text="Current RAM Usage:", font=self._font(15))
         self.ram_label.pack(pady=10)
 
         self.ram_progress_bar = ctk.CTkProgressBar(self.ram_scrollable_frame, width=400, progress_color="#4A9EFF")
         self.ram_progress_bar.pack(pady=10)
-        
-        # Apply custom colors immediately
-        self._apply_color_to_widget(self.ram_progress_bar, "progressbar")
 
         self.ram_details_label = ctk.CTkLabel(self.ram_scrollable_frame, text="")
         self.ram_details_label.pack(pady=5)
 
         self.optimize_ram_button = ctk.CTkButton(self.ram_scrollable_frame, text="Optimize RAM", command=self.optimize_ram,
-                                                fg_color="#4A9EFF", hover_color="#3A8EFF")
+                                                **self.ACCENT_BUTTON_STYLE)
         self.optimize_ram_button.pack(pady=10)
-        
-        # Apply custom colors and fonts immediately
-        self._apply_color_to_widget(self.optimize_ram_button, "button")
-        self._apply_font_to_widget(self.optimize_ram_button, "button")
 
         self.clean_ram_button = ctk.CTkButton(self.ram_scrollable_frame, text="🧹 RAM Cleanup", command=self.clean_ram,
-                                             fg_color="#4A9EFF", hover_color="#3A8EFF")
+                                             **self.ACCENT_BUTTON_STYLE)
         self.clean_ram_button.pack(pady=10)
-        
-        # Apply custom colors and fonts immediately
-        self._apply_color_to_widget(self.clean_ram_button, "button")
-        self._apply_font_to_widget(self.clean_ram_button, "button")
 
         # Frame per pulsanti di gestione processi
         self.process_management_frame = ctk.CTkFrame(self.ram_scrollable_frame)
@@ -1834,36 +2175,21 @@ class App(ctk.CTk):
         # Pulsanti per kill process e autoruns
         self.kill_process_button = ctk.CTkButton(self.process_management_frame, text="💀 Kill Process", 
                                                 command=self.kill_process, width=150,
-                                                fg_color="#4A9EFF", hover_color="#3A8EFF")
+                                                **self.ACCENT_BUTTON_STYLE)
         self.kill_process_button.pack(side="left", padx=(10, 5), pady=10)
-        
-        # Apply custom colors and fonts immediately
-        self._apply_color_to_widget(self.kill_process_button, "button")
-        self._apply_font_to_widget(self.kill_process_button, "button")
 
         self.autoruns_button = ctk.CTkButton(self.process_management_frame, text="🚀 Autoruns", 
                                             command=self.open_autoruns, width=150,
-                                            fg_color="#4A9EFF", hover_color="#3A8EFF")
+                                            **self.ACCENT_BUTTON_STYLE)
         self.autoruns_button.pack(side="left", padx=5, pady=10)
-        
-        # Apply custom colors and fonts immediately
-        self._apply_color_to_widget(self.autoruns_button, "button")
-        self._apply_font_to_widget(self.autoruns_button, "button")
 
         self.process_explorer_button = ctk.CTkButton(self.process_management_frame, text="🔍 Process Explorer", 
                                                     command=self.open_process_explorer, width=150,
-                                                    fg_color="#4A9EFF", hover_color="#3A8EFF")
+                                                    **self.ACCENT_BUTTON_STYLE)
         self.process_explorer_button.pack(side="left", padx=5, pady=10)
-        
-        # Apply custom colors and fonts immediately
-        self._apply_color_to_widget(self.process_explorer_button, "button")
-        self._apply_font_to_widget(self.process_explorer_button, "button")
 
-        self.ram_update_thread_stop = threading.Event()
-
-        # --- STARTUP MANAGER FRAME REMOVED ---
-
-        # --- NETWORK MANAGER FRAME ---
+    def _build_network_manager_frame(self):
+        """Create the Network Manager widgets."""
         self.network_manager_frame.grid_columnconfigure(0, weight=1)
         self.network_manager_frame.grid_rowconfigure(1, weight=1)
 
@@ -1872,7 +2198,7 @@ class App(ctk.CTk):
         self.network_scrollable_frame.grid(row=0, column=0, padx=20, pady=10, sticky="nsew")
 
         self.network_label = ctk.CTkLabel(self.network_scrollable_frame, text="Network diagnostic and management tools",
-                                            font=ctk.CTkFont(size=15))
+                                            font=self._font(15))
         self.network_label.pack(pady=10)
 
         # Frame per i test di rete
@@ -1882,47 +2208,29 @@ class App(ctk.CTk):
         # Pulsante Ping Test
         self.ping_test_button = ctk.CTkButton(self.network_test_frame, text="🏓 Ping Test", 
                                              command=self.start_ping_test, width=150,
-                                             fg_color="#4A9EFF", hover_color="#3A8EFF")
+                                             **self.ACCENT_BUTTON_STYLE)
         self.ping_test_button.pack(side="left", padx=(10, 5), pady=10)
-        
-        # Apply custom colors and fonts immediately
-        self._apply_color_to_widget(self.ping_test_button, "button")
-        self._apply_font_to_widget(self.ping_test_button, "button")
 
         # Pulsante Speed Test
         self.speed_test_button = ctk.CTkButton(self.network_test_frame, text="⚡ Speed Test", 
                                               command=self.start_speed_test, width=150,
-                                              fg_color="#4A9EFF", hover_color="#3A8EFF")
+                                              **self.ACCENT_BUTTON_STYLE)
         self.speed_test_button.pack(side="left", padx=5, pady=10)
-        
-        # Apply custom colors and fonts immediately
-        self._apply_color_to_widget(self.speed_test_button, "button")
-        self._apply_font_to_widget(self.speed_test_button, "button")
 
         # Pulsante Connection Test (esistente)
         self.connection_test_button = ctk.CTkButton(self.network_test_frame, text="🔗 Connection Test", 
                                                    command=self.start_connection_test, width=150,
-                                                   fg_color="#4A9EFF", hover_color="#3A8EFF")
+                                                   **self.ACCENT_BUTTON_STYLE)
         self.connection_test_button.pack(side="left", padx=(5, 10), pady=10)
-        
-        # Apply custom colors and fonts immediately
-        self._apply_color_to_widget(self.connection_test_button, "button")
-        self._apply_font_to_widget(self.connection_test_button, "button")
 
 
 
         self.troubleshoot_button = ctk.CTkButton(self.network_scrollable_frame, text="📋 Troubleshooting Guide", command=self.show_troubleshooting_guide,
-                                                fg_color="#4A9EFF", hover_color="#3A8EFF")
-        self.troubleshoot_button.pack(pady=10)
-        
-        # Apply custom colors and fonts immediately
-        self._apply_color_to_widget(self.troubleshoot_button, "button")
-        self._apply_font_to_widget(self.troubleshoot_button, "button")
-
-
-
+                                                **self.ACCENT_BUTTON_STYLE)
+        self.troubleshoot_button.pack(pady=10)
 
-        # --- VIRTUAL ASSISTANT FRAME ---
+    def _build_assistant_frame(self):
+        """Create the AI Assistant widgets."""
         self.assistant_frame.grid_columnconfigure(0, weight=1)
         self.assistant_frame.grid_rowconfigure(0, weight=1)
 
@@ -1943,19 +2251,19 @@ class App(ctk.CTk):
         self.user_input_entry.bind("<Return>", self.send_message_event)
 
         self.send_button = ctk.CTkButton(self.assistant_input_frame, text="Send", command=self.send_message_event,
-                                        fg_color="#4A9EFF", hover_color="#3A8EFF")
+                                        **self.ACCENT_BUTTON_STYLE)
         self.send_button.pack(side="left", padx=(0, 5), pady=10)
 
         # Clear history button
         self.clear_history_button = ctk.CTkButton(self.assistant_input_frame, text="🗑️ Clear History", 
                                                  command=self.clear_assistant_history, width=150,
-                                                 fg_color="#4A9EFF", hover_color="#3A8EFF")
+                                                 **self.ACCENT_BUTTON_STYLE)
         self.clear_history_button.pack(side="left", padx=(0, 5), pady=10)
 
         # Show models button
         self.show_models_button = ctk.CTkButton(self.assistant_input_frame, text="🤖 Show Models", 
                                                command=self.show_available_models, width=150,
-                                               fg_color="#4A9EFF", hover_color="#3A8EFF")
+                                               **self.ACCENT_BUTTON_STYLE)
         self.show_models_button.pack(side="left", padx=(0, 5), pady=10)
 
         # Ollama management frame
@@ -1964,7 +2272,7 @@ class App(ctk.CTk):
 
         # Ollama status label
         self.ollama_status_label = ctk.CTkLabel(self.ollama_frame, text="🔍 Checking Ollama...", 
-                                               font=ctk.CTkFont(size=14, weight="bold"))
+                                               font=self._font(14, "bold"))
         self.ollama_status_label.pack(pady=(10, 5))
 
         # Ollama buttons frame
@@ -1974,16 +2282,20 @@ class App(ctk.CTk):
         # Download Ollama button
         self.download_ollama_button = ctk.CTkButton(self.ollama_buttons_frame, text="⬇️ Download Ollama", 
                                                    command=self.download_ollama, width=180,
-                                                   fg_color="#4A9EFF", hover_color="#3A8EFF")
+                                                   **self.ACCENT_BUTTON_STYLE)
         self.download_ollama_button.pack(side="left", padx=(10, 5), pady=10)
 
         # Check Ollama installation button
         self.check_ollama_button = ctk.CTkButton(self.ollama_buttons_frame, text="🔍 Search Ollama", 
                                                 command=self.check_ollama_installation, width=180,
-                                                fg_color="#4A9EFF", hover_color="#3A8EFF")
+                                                **self.ACCENT_BUTTON_STYLE)
         self.check_ollama_button.pack(side="left", padx=5, pady=10)
 
-        # --- SANDBOX FRAME ---
+    def _build_sandbox_frame(self):
+        """Create the Security Sandbox widgets."""
+        accent_color = self.settings['accent_color']
+        hover_color = self._darken_color(accent_color, 0.1)
+
         self.sandbox_frame.grid_columnconfigure(0, weight=1)
         self.sandbox_frame.grid_rowconfigure(0, weight=1)
 
@@ -1993,7 +2305,7 @@ class App(ctk.CTk):
 
         # Sandbox section title
         self.sandbox_title = ctk.CTkLabel(self.sandbox_scrollable_frame, text="🛡️ Security Sandbox - Safe Execution", 
-                                         font=ctk.CTkFont(size=16, weight="bold"))
+                                         font=self._font(16, "bold"))
         self.sandbox_title.pack(pady=(10, 20))
 
         # Frame per pulsanti di sicurezza
@@ -2003,19 +2315,19 @@ class App(ctk.CTk):
         # Pulsante per app di sicurezza
         self.security_app_button = ctk.CTkButton(self.security_tools_frame, text="🔍 Search Security App", 
                                                 command=self.check_security_apps, width=200,
-                                                fg_color="#4A9EFF", hover_color="#3A8EFF")
+                                                **self.ACCENT_BUTTON_STYLE)
         self.security_app_button.pack(side="left", padx=(10, 5), pady=10)
 
         # Pulsante download
         self.security_download_button = ctk.CTkButton(self.security_tools_frame, text="⬇️ Download Security App", 
                                                      command=self.download_security_apps, width=200,
-                                                     fg_color="#4A9EFF", hover_color="#3A8EFF")
+                                                     **self.ACCENT_BUTTON_STYLE)
         self.security_download_button.pack(side="left", padx=5, pady=10)
 
         # Pulsante guida
         self.security_guide_button = ctk.CTkButton(self.security_tools_frame, text="📋 Security Guide", 
                                                   command=self.show_security_guide, width=200,
-                                                  fg_color="#4A9EFF", hover_color="#3A8EFF")
+                                                  **self.ACCENT_BUTTON_STYLE)
         self.security_guide_button.pack(side="left", padx=(5, 10), pady=10)
 
         # Sandboxie path selection frame
@@ -2023,7 +2335,7 @@ class App(ctk.CTk):
         self.sandboxie_path_frame.pack(fill="x", padx=10, pady=10)
 
         self.sandboxie_path_label = ctk.CTkLabel(self.sandboxie_path_frame, text="Sandboxie Plus Path:", 
-                                               font=ctk.CTkFont(size=12, weight="bold"))
+                                               font=self._font(12, "bold"))
         self.sandboxie_path_label.pack(anchor="w", padx=10, pady=(10, 5))
 
         self.sandboxie_path_entry = ctk.CTkEntry(self.sandboxie_path_frame, placeholder_text="Auto-detect or select custom path")
@@ -2032,14 +2344,8 @@ class App(ctk.CTk):
 
         self.sandboxie_browse_button = ctk.CTkButton(self.sandboxie_path_frame, text="Browse Path", 
                                                    command=self.select_sandboxie_path, width=120,
-                                                   fg_color=self.settings['accent_color'], hover_color=self._darken_color(self.settings['accent_color'], 0.1))
+                                                   fg_color=accent_color, hover_color=hover_color)
         self.sandboxie_browse_button.pack(side="right", padx=(5, 10), pady=(0, 10))
-        
-        # Force color application to ensure consistency
-        self.sandboxie_browse_button.configure(
-            fg_color=self.settings['accent_color'],
-            hover_color=self._darken_color(self.settings['accent_color'], 0.1)
-        )
 
         # Frame for file selection
         self.sandbox_selection_frame = ctk.CTkFrame(self.sandbox_scrollable_frame)
@@ -2050,25 +2356,13 @@ class App(ctk.CTk):
         self.sandbox_file_entry.configure(state="disabled")
 
         self.sandbox_browse_button = ctk.CTkButton(self.sandbox_selection_frame, text="Choose File...", command=self.select_sandboxed_file,
-                                                  fg_color="#4A9EFF", hover_color="#3A8EFF")
+                                                  fg_color=accent_color, hover_color=hover_color)
         self.sandbox_browse_button.pack(side="right", padx=(5, 10), pady=10)
-        
-        # Force color application to ensure consistency
-        self.sandbox_browse_button.configure(
-            fg_color=self.settings['accent_color'],
-            hover_color=self._darken_color(self.settings['accent_color'], 0.1)
-        )
 
         # Execute button
         self.sandbox_run_button = ctk.CTkButton(self.sandbox_scrollable_frame, text="Run in Sandbox", command=self.run_in_sandbox, state="disabled",
-                                               fg_color="#4A9EFF", hover_color="#3A8EFF")
+                                               fg_color=accent_color, hover_color=hover_color)
         self.sandbox_run_button.pack(fill="x", padx=10, pady=10)
-        
-        # Force color application to ensure consistency
-        self.sandbox_run_button.configure(
-            fg_color=self.settings['accent_color'],
-            hover_color=self._darken_color(self.settings['accent_color'], 0.1)
-        )
 
         # Output console
         self.sandbox_output_console = ctk.CTkTextbox(self.sandbox_scrollable_frame, height=300, state="disabled")
@@ -2088,32 +2382,24 @@ class App(ctk.CTk):
         self.vt_api_key_entry.grid(row=0, column=0, padx=(0, 5), pady=5, sticky="ew")
 
         self.vt_save_key_button = ctk.CTkButton(self.vt_api_key_frame, text="Save", width=70, command=self.save_api_key,
-                                               fg_color="#4A9EFF", hover_color="#3A8EFF")
+                                               fg_color=accent_color, hover_color=hover_color)
         self.vt_save_key_button.grid(row=0, column=1, pady=5, sticky="e")
-        
-        # Force color application to ensure consistency
-        self.vt_save_key_button.configure(
-            fg_color=self.settings['accent_color'],
-            hover_color=self._darken_color(self.settings['accent_color'], 0.1)
-        )
 
         self.vt_scan_button = ctk.CTkButton(self.virustotal_frame, text="Analyze Sandbox with VirusTotal", command=self.start_virustotal_scan, state="disabled",
-                                          fg_color="#4A9EFF", hover_color="#3A8EFF")
+                                          fg_color=accent_color, hover_color=hover_color)
         self.vt_scan_button.grid(row=1, column=0, padx=10, pady=10, sticky="ew")
-        
-        # Force color application to ensure consistency
-        self.vt_scan_button.configure(
-            fg_color=self.settings['accent_color'],
-            hover_color=self._darken_color(self.settings['accent_color'], 0.1)
-        )
 
-        self.sandboxed_file_path = ""
-        self.virustotal_api_key = None # Variable to store API key
-        
-        # Variabile per tracciare lo stato di Sandboxie-Plus
-        self.sandboxie_installed = False
+        # Load configuration
+        self.load_api_key()
+
+        # Check Sandboxie-Plus status
+        self.check_sandboxie_status()
 
-        # --- CREDITS FRAME ---
+        # Start automatic monitoring
+        self.start_sandboxie_monitoring()
+
+    def _build_credits_frame(self):
+        """Create the Credits widgets."""
         self.credits_frame.grid_columnconfigure(0, weight=1)
         self.credits_frame.grid_rowconfigure(0, weight=1)
 
@@ -2125,7 +2411,7 @@ class App(ctk.CTk):
         self.credits_title = ctk.CTkLabel(
             self.credits_scrollable_frame, 
             text="🎯 Credits for Integrated External Apps", 
-            font=ctk.CTkFont(size=22, weight="bold"),
+            font=self._font(22, "bold"),
             text_color="#FFFFFF"
         )
         self.credits_title.pack(pady=(20, 30))
@@ -2134,7 +2420,7 @@ class App(ctk.CTk):
         self.credits_description = ctk.CTkLabel(
             self.credits_scrollable_frame, 
             text="This section recognizes and thanks the developers of external applications integrated into PC Tool Manager. All rights belong to their respective owners.",
-            font=ctk.CTkFont(size=15),
+            font=self._font(15),
             text_color="#CCCCCC",
             justify="center",
             wraplength=600
@@ -2144,7 +2430,8 @@ class App(ctk.CTk):
         # Create credits sections
         self._create_credits_sections()
 
-        # --- GUIDE FRAME ---
+    def _build_guide_frame(self):
+        """Create the Guide widgets."""
         self.guide_frame.grid_columnconfigure(0, weight=1)
         self.guide_frame.grid_rowconfigure(0, weight=1)
 
@@ -2152,22 +2439,11 @@ class App(ctk.CTk):
         self.guide_scrollable_frame = ctk.CTkScrollableFrame(self.guide_frame, label_text="Guide - Complete Guide")
         self.guide_scrollable_frame.grid(row=0, column=0, padx=20, pady=20, sticky="nsew")
 
-        # --- SETTINGS FRAME ---
-        self.settings_frame.grid_columnconfigure(0, weight=1)
-        self.settings_frame.grid_rowconfigure(0, weight=1)
-
-        # Create scrollable frame for settings content
-        self.settings_scrollable_frame = ctk.CTkScrollableFrame(self.settings_frame, label_text="Settings")
-        self.settings_scrollable_frame.grid(row=0, column=0, padx=20, pady=20, sticky="nsew")
-        
-        # Create settings widgets
-        self._create_settings_widgets()
-
         # Guide title
         self.guide_title = ctk.CTkLabel(
             self.guide_scrollable_frame, 
             text="📚 Complete PC Tool Manager Guide", 
-            font=ctk.CTkFont(size=20, weight="bold"),
+            font=self._font(20, "bold"),
             text_color="#E74C3C"
         )
         self.guide_title.pack(pady=(20, 30))
@@ -2175,38 +2451,74 @@ class App(ctk.CTk):
         # Create guide sections
         self._create_guide_sections()
 
-        # --- Percorsi e cartelle di supporto ---
-        if not os.path.exists(self.tools_path):
-            os.makedirs(self.tools_path)
+    def _build_settings_frame(self):
+        """Create the Settings widgets."""
+        self.settings_frame.grid_columnconfigure(0, weight=1)
+        self.settings_frame.grid_rowconfigure(0, weight=1)
 
-        # Load configuration at startup
-        self.load_api_key()
-        
-        # Check Sandboxie-Plus status at startup
-        self.check_sandboxie_status()
+        # Create scrollable frame for settings content
+        self.settings_scrollable_frame = ctk.CTkScrollableFrame(self.settings_frame, label_text="Settings")
+        self.settings_scrollable_frame.grid(row=0, column=0, padx=20, pady=20, sticky="nsew")
         
-        # Start automatic monitoring
-        self.start_sandboxie_monitoring()
+        # Create settings widgets
+        self._create_settings_widgets()
 
-        # Select default frame
-        self.select_frame_by_name("home")
-        
-        # Forza l'icona personalizzata
-        self.set_custom_icon()
+    def _build_hardware_monitor_frame(self):
+        """Create the Hardware Monitor widgets."""
+        self._create_optimized_hardware_monitor()
+
+    def _ensure_frame_built(self, name):
+        """Build the widgets of a frame the first time it is shown."""
+        if name in self._frames_built:
+            return
+        builder = getattr(self, f"_build_{name}_frame", None)
+        if builder is not None:
+            builder()
+            self._apply_theme()
+            # Align the new widgets with the customised colors and fonts
+            if self._custom_settings_applied:
+                self._apply_custom_colors()
+                self._apply_custom_fonts()
+        self._frames_built.add(name)
+
+    def _post_init_pipeline(self):
+        """Yield the deferred startup steps with the delay before the next one (ms)."""
+        # Forza l'impostazione dell'icona dopo un breve delay per assicurarsi che appaia
+        yield self.set_custom_icon, 800
+        # Check ollama status
+        yield self.check_ollama_status, 1000
+        # Start automatic tool detection monitoring
+        yield self.start_tool_monitoring, 1000
+        # Force initial interface update after monitoring starts (always show loading)
+        yield self.force_initial_interface_update_with_loading, None
+
+    def _pump_post_init(self):
+        """Run the next deferred startup step and schedule the following one."""
+        self._post_init_job = None
+        step = next(self._post_init_iter, None)
+        if step is None:
+            return
+        callback, delay = step
+        try:
+            callback()
+        except Exception as e:
+            logging.error("Error in startup step %s: %s", callback.__name__, e)
+        if delay is not None:
+            self._post_init_job = self.after(delay, self._pump_post_init)
 
     def _check_psutil_availability(self):
         """Check if psutil is available and working properly."""
+        # Reuse the module-level import instead of probing it again
+        if psutil is None:
+            logging.warning("psutil not installed - some features will be limited")
+            return False
         try:
-            import psutil
             # Test basic functionality
             psutil.virtual_memory()
             psutil.cpu_count()
             return True
-        except ImportError:
-            logging.warning("psutil not installed - some features will be limited")
-            return False
         except Exception as e:
-            logging.warning(f"psutil available but not working properly: {e}")
+            logging.warning("psutil available but not working properly: %s", e)
             return False
 
     def show_available_models(self):
@@ -2233,7 +2545,7 @@ class App(ctk.CTk):
                 self.add_assistant_message("❌ No models found. Install a model with: ollama pull llama3.2:3b")
                 return
             
-            models_text = "🤖 **Available Ollama Models:**\n\n"
+            rows = []
             current_model = self._get_preferred_model()
             
             for i, model in enumerate(models_list, 1):
@@ -2258,71 +2570,98 @@ class App(ctk.CTk):
                 
                 # Indicate the currently used model
                 if model_name == current_model:
-                    models_text += f"✅ **{i}. {model_name}** (in use) - {size_mb:.1f} MB\n"
+                    rows.append(f"✅ **{i}. {model_name}** (in use) - {size_mb:.1f} MB")
                 else:
-                    models_text += f"   {i}. {model_name} - {size_mb:.1f} MB\n"
+                    rows.append(f"   {i}. {model_name} - {size_mb:.1f} MB")
             
-            models_text += "\n💡 **Tips:**\n"
-            models_text += "• To install a new model: `ollama pull model_name`\n"
-            models_text += "• Fast models: llama3.2:1b, gemma3:1b\n"
-            models_text += "• Powerful models: llama3.2:8b, llama3.2:70b\n"
-            models_text += "• Instruction models: add '-instruct' to the name\n"
-            
-            self.add_assistant_message(models_text)
+            self.add_assistant_message(self.MODELS_HEADER + "\n".join(rows) + self.MODELS_TIPS)
             
         except Exception as e:
             self.add_assistant_message(f"❌ Error retrieving models: {str(e)}")
             # Log error for debugging
-            import logging
-            logging.error(f"Detailed error retrieving Ollama models: {e}")
+            logging.error("Detailed error retrieving Ollama models: %s", e)
 
     def download_ollama(self):
         """Apre il sito ufficiale di Ollama per il download."""
         try:
-            import webbrowser
             webbrowser.open("https://ollama.ai/download")
             self.add_assistant_message("🌐 Opened official Ollama download site.\n\n📋 **Installation Instructions:**\n1. Download Ollama for Windows\n2. Install the application\n3. Start Ollama from Start menu\n4. Install a model: `ollama pull llama3.2:3b`\n5. Restart this application")
         except Exception as e:
             self.add_assistant_message(f"❌ Error opening browser: {str(e)}")
 
-    def check_ollama_installation(self):
-        """Check if Ollama is installed and update the status."""
+    def _probe_ollama(self):
+        """Run `ollama --version` and `ollama.list()`; returns (state, detail). Safe off the Tk thread."""
         try:
-            self.add_assistant_message("🔍 Checking Ollama installation...")
-            
-            # Controlla se ollama è nel PATH
-            import subprocess
-            result = subprocess.run(['ollama', '--version'], capture_output=True, text=True, timeout=10)
-            
-            if result.returncode == 0:
-                version = result.stdout.strip()
-                self.add_assistant_message(f"✅ Ollama found! Version: {version}")
-                
-                # Controlla se il servizio è in esecuzione
-                try:
-                    response = ollama.list()
-                    self.add_assistant_message("✅ Ollama service active and working!")
-                    self.ollama_available = True
-                    self.ollama_status_label.configure(text="✅ Ollama Installed and Active", text_color="#28A745")
-                except Exception as e:
-                    self.add_assistant_message("⚠️ Ollama installed but service not active.\nStart Ollama from Start menu or run: `ollama serve`")
-                    self.ollama_available = False
-                    self.ollama_status_label.configure(text="⚠️ Ollama Installed but Not Active", text_color="#FFC107")
-            else:
-                self.add_assistant_message("❌ Ollama not found in system.\nClick '⬇️ Download Ollama' to download it.")
-                self.ollama_available = False
-                self.ollama_status_label.configure(text="❌ Ollama Not Installed", text_color="#DC3545")
-                
+            result = subprocess.run(['ollama', '--version'], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                    text=True, timeout=10, creationflags=subprocess.CREATE_NO_WINDOW)
+            if result.returncode != 0:
+                return "missing", ""
+            version = result.stdout.strip()
+            # Controlla se il servizio è in esecuzione
+            try:
+                ollama.list()
+                return "active", version
+            except Exception:
+                return "inactive", version
         except subprocess.TimeoutExpired:
+            return "timeout", ""
+        except FileNotFoundError:
+            return "missing", ""
+        except Exception as e:
+            return "error", str(e)
+
+    def _request_ollama_probe(self, callback):
+        """Call callback(state, detail) with a fresh Ollama probe, reusing one younger than the TTL"""
+        probe = self._ollama_probe
+        if probe is not None and time.monotonic() - probe[0] < self._ollama_probe_ttl:
+            callback(probe[1], probe[2])
+            return
+        self._ollama_probe_waiters.append(callback)
+        if len(self._ollama_probe_waiters) == 1:
+            self._start_daemon_task(self._ollama_probe_worker)
+
+    def _ollama_probe_worker(self):
+        """Pool task: probe Ollama and hand the result back to the Tk thread"""
+        state, detail = self._probe_ollama()
+        self.after(0, self._deliver_ollama_probe, state, detail)
+
+    def _deliver_ollama_probe(self, state, detail):
+        """Cache the probe result and notify every callback waiting for it"""
+        self._ollama_probe = (time.monotonic(), state, detail)
+        waiters, self._ollama_probe_waiters = self._ollama_probe_waiters, []
+        for callback in waiters:
+            callback(state, detail)
+
+    def check_ollama_installation(self):
+        """Check if Ollama is installed and update the status."""
+        self.add_assistant_message("🔍 Checking Ollama installation...")
+        self._request_ollama_probe(self._apply_ollama_state)
+
+    def _apply_ollama_state(self, state, detail):
+        """Show the result of an Ollama probe in the chat and in the status label."""
+        if state == "active" and not self.ollama_available:
+            # La chat potrebbe essere stata disegnata come non disponibile prima della risposta
+            self.ollama_available = True
+            self._enable_assistant_chat()
+        if state in ("active", "inactive"):
+            self.add_assistant_message(f"✅ Ollama found! Version: {detail}")
+        if state == "active":
+            self.add_assistant_message("✅ Ollama service active and working!")
+            self.ollama_status_label.configure(text="✅ Ollama Installed and Active", text_color="#28A745")
+        elif state == "inactive":
+            self.add_assistant_message("⚠️ Ollama installed but service not active.\nStart Ollama from Start menu or run: `ollama serve`")
+            self.ollama_available = False
+            self.ollama_status_label.configure(text="⚠️ Ollama Installed but Not Active", text_color="#FFC107")
+        elif state == "timeout":
             self.add_assistant_message("⏱️ Timeout checking Ollama. Verify it's installed correctly.")
             self.ollama_available = False
             self.ollama_status_label.configure(text="❌ Ollama Not Found", text_color="#DC3545")
-        except FileNotFoundError:
+        elif state == "missing":
             self.add_assistant_message("❌ Ollama not found in system.\nClick '⬇️ Download Ollama' to download it.")
             self.ollama_available = False
             self.ollama_status_label.configure(text="❌ Ollama Not Installed", text_color="#DC3545")
-        except Exception as e:
-            self.add_assistant_message(f"❌ Error checking Ollama: {str(e)}")
+        else:
+            self.add_assistant_message(f"❌ Error checking Ollama: {detail}")
             self.ollama_available = False
             self.ollama_status_label.configure(text="❌ Check Error", text_color="#DC3545")
 
@@ -2339,69 +2678,90 @@ class App(ctk.CTk):
 
     def _try_start_ollama(self):
         """Attempts to start Ollama if it's installed but not running."""
-        try:
-            # Check if Ollama is installed
-            result = subprocess.run(['ollama', '--version'], capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                # Ollama is installed, try to start the service
-                self.add_assistant_message("🚀 Starting Ollama service...")
-                subprocess.Popen(['ollama', 'serve'], creationflags=subprocess.CREATE_NO_WINDOW)
-                # Give it a moment to start
-                self.after(3000, self._check_ollama_after_start)
-            else:
-                self.add_assistant_message("❌ Ollama not found. Please install it first.")
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+        self._request_ollama_probe(self._start_ollama_if_installed)
+
+    def _start_ollama_if_installed(self, state, detail):
+        """Launch `ollama serve` when the probe found Ollama installed but not running"""
+        if state == "active":
+            return
+        if state in ("missing", "timeout"):
             self.add_assistant_message("❌ Ollama not found. Please install it first.")
+            return
+        if state == "error":
+            self.add_assistant_message(f"❌ Error starting Ollama: {detail}")
+            return
+        try:
+            # Ollama is installed, try to start the service
+            self.add_assistant_message("🚀 Starting Ollama service...")
+            subprocess.Popen(['ollama', 'serve'], creationflags=subprocess.CREATE_NO_WINDOW)
+            self._ollama_probe = None  # Lo stato del servizio sta per cambiare
+            # Give it a moment to start
+            self.after(3000, self._check_ollama_after_start)
         except Exception as e:
             self.add_assistant_message(f"❌ Error starting Ollama: {str(e)}")
 
+    def _enable_assistant_chat(self):
+        """Re-enable the chat input once Ollama becomes reachable, redrawing the welcome if nothing was said yet."""
+        if not self.conversation_history:
+            self.initialize_assistant_chat()
+        self.user_input_entry.configure(state="normal")
+        self.send_button.configure(state="normal")
+
     def _check_ollama_after_start(self):
         """Checks Ollama status after attempting to start it."""
         try:
             ollama.list()
-            self.ollama_available = True
+            if not self.ollama_available:
+                self.ollama_available = True
+                self._enable_assistant_chat()
             self.ollama_status_label.configure(text="✅ Ollama Started Successfully", text_color="#28A745")
             self.add_assistant_message("✅ Ollama started successfully! You can now use the AI assistant.")
         except Exception:
             self.add_assistant_message("⚠️ Ollama may take a moment to start. Please wait and try again.")
 
+    def _request_frame(self, name):
+        """Switch frame after a short delay so that a burst of clicks only shows the last target"""
+        if self._pending_frame_switch is not None:
+            self.after_cancel(self._pending_frame_switch)
+        self._pending_frame_switch = self.after(30, self.select_frame_by_name, name)
+
     def select_frame_by_name(self, name):
-        # Set button color for selected button
-        self.home_button.configure(fg_color=("gray75", "gray25") if name == "home" else "transparent")
-        self.disk_cleanup_button.configure(fg_color=("gray75", "gray25") if name == "disk_cleanup" else "transparent")
-        # Startup manager button removed
-        self.ram_optimizer_button.configure(fg_color=("gray75", "gray25") if name == "ram_optimizer" else "transparent")
-        self.hardware_monitor_button.configure(fg_color=("gray75", "gray25") if name == "hardware_monitor" else "transparent")
-        self.network_manager_button.configure(fg_color=("gray75", "gray25") if name == "network_manager" else "transparent")
-        self.assistant_button.configure(fg_color=("gray75", "gray25") if name == "assistant" else "transparent")
-        self.sandbox_button.configure(fg_color=("gray75", "gray25") if name == "sandbox" else "transparent")
-        self.credits_button.configure(fg_color=("gray75", "gray25") if name == "credits" else "transparent")
-        self.guide_button.configure(fg_color=("gray75", "gray25") if name == "guide" else "transparent")
-        self.settings_button.configure(fg_color=("gray75", "gray25") if name == "settings" else "transparent")
+        # Un cambio diretto annulla quello eventualmente in attesa
+        if self._pending_frame_switch is not None:
+            self.after_cancel(self._pending_frame_switch)
+            self._pending_frame_switch = None
+
+        # Frame e pulsanti seguono la convenzione "<nome>_frame" / "<nome>_button"
+        if getattr(self, f"{name}_frame", None) is None:
+            logging.warning("Unknown frame requested: %s", name)
+            return
+
+        self._ensure_frame_built(name)
+
+        previous = self.current_frame
+
+        # Set button color: only the previous and the new selection change
+        previous_button = getattr(self, f"{previous}_button", None)
+        if previous != name and previous_button is not None:
+            previous_button.configure(fg_color="transparent")
+        button = getattr(self, f"{name}_button", None)
+        if button is not None:
+            button.configure(fg_color=("gray75", "gray25"))
 
         # Stop all threads before switching to prevent freezing
         self.stop_all_active_threads()
         
         # Stop hardware updates when leaving hardware monitor
-        if hasattr(self, '_hardware_updates_started') and self._hardware_updates_started and self.current_frame == "hardware_monitor":
-            self._hardware_updates_started = False
+        if name != "hardware_monitor" and self.current_frame == "hardware_monitor":
+            self.stop_hardware_updates()
             logging.info("Hardware updates stopped due to frame change")
         
         # Hide loading indicator when switching tabs
         self.hide_loading_indicator()
 
-        # Hide all frames
-        self.home_frame.grid_forget()
-        self.disk_cleanup_frame.grid_forget()
-        # Startup manager frame removed
-        self.ram_optimizer_frame.grid_forget()
-        self.hardware_monitor_frame.grid_forget()
-        self.network_manager_frame.grid_forget()
-        self.assistant_frame.grid_forget()
-        self.sandbox_frame.grid_forget()
-        self.credits_frame.grid_forget()
-        self.guide_frame.grid_forget()
-        self.settings_frame.grid_forget()
+        # Hide the frame shown so far (only one is gridded at a time)
+        if previous != name:
+            getattr(self, f"{previous}_frame").grid_forget()
 
         # Show the selected frame and start its threads if needed
         if name == "home":
@@ -2416,7 +2776,7 @@ class App(ctk.CTk):
             self.hardware_monitor_frame.grid(row=0, column=1, sticky="nsew")
             # Hardware monitor is created only in hardware_monitor_button_event
             # Just hide any loading indicator if already created
-            if self.hardware_monitor_created:
+            if "hardware_monitor" in self._frames_built:
                 self.hide_loading_indicator()
         elif name == "network_manager":
             self.network_manager_frame.grid(row=0, column=1, sticky="nsew")
@@ -2425,7 +2785,7 @@ class App(ctk.CTk):
             # Controllo automatico di Ollama all'apertura della tab
             self.check_ollama_installation()
             # Inizializza la chat solo se non è già stata inizializzata
-            if not hasattr(self, 'conversation_history') or self.conversation_history == []:
+            if not self.conversation_history:
                 self.initialize_assistant_chat()
             else:
                 # Restore history in chat if it already exists
@@ -2443,50 +2803,54 @@ class App(ctk.CTk):
         self.current_frame = name
 
     def home_button_event(self):
-        self.select_frame_by_name("home")
+        self._request_frame("home")
 
     def disk_cleanup_button_event(self):
-        self.select_frame_by_name("disk_cleanup")
+        self._request_frame("disk_cleanup")
 
     # Startup manager button event removed
 
     def ram_optimizer_button_event(self):
-        self.select_frame_by_name("ram_optimizer")
+        self._request_frame("ram_optimizer")
 
     def hardware_monitor_button_event(self):
         # Only show loading indicator if hardware monitor is not already created
-        if not self.hardware_monitor_created:
+        if "hardware_monitor" not in self._frames_built:
             self.show_loading_indicator("🖥️ Loading Hardware Monitoring...")
-            self._create_optimized_hardware_monitor()
-            self.hardware_monitor_created = True
+            self._ensure_frame_built("hardware_monitor")
         
         self.select_frame_by_name("hardware_monitor")
 
+        # Resume the updates paused when the panel was left
+        if self.hardware_update_job is None and getattr(self, 'hardware_monitor', None) is not None:
+            self.start_hardware_updates()
+
     def network_manager_button_event(self):
-        self.select_frame_by_name("network_manager")
+        self._request_frame("network_manager")
 
     def assistant_button_event(self):
+        self._ensure_frame_built("assistant")
         # Auto-start Ollama if installed but not running
         if not self.ollama_available:
             self._try_start_ollama()
         self.select_frame_by_name("assistant")
 
     def sandbox_button_event(self):
-        self.select_frame_by_name("sandbox")
+        self._request_frame("sandbox")
 
     def credits_button_event(self):
-        self.select_frame_by_name("credits")
+        self._request_frame("credits")
 
     def guide_button_event(self):
-        self.select_frame_by_name("guide")
+        self._request_frame("guide")
 
     def settings_button_event(self):
-        self.select_frame_by_name("settings")
+        self._request_frame("settings")
 
     def start_thread_safe(self, thread_name, function):
         """Start a thread safely with proper management"""
         # Stop existing thread if running
-        if thread_name in self.active_threads and self.active_threads[thread_name].is_alive():
+        if thread_name in self.active_threads and not self.active_threads[thread_name].done():
             self.stop_thread(thread_name)
         
         # Create stop event for this thread
@@ -2498,18 +2862,43 @@ class App(ctk.CTk):
     def _start_thread(self, thread_name, function):
         """Internal method to start thread"""
         if thread_name in self.thread_stop_events and not self.thread_stop_events[thread_name].is_set():
-            thread = threading.Thread(target=function, daemon=True)
-            self.active_threads[thread_name] = thread
-            thread.start()
+            self.active_threads[thread_name] = self._submit_task(function)
 
     def stop_thread(self, thread_name):
-        """Stop a specific thread safely"""
+        """Stop a specific thread safely (signals it and returns at once)"""
         if thread_name in self.thread_stop_events:
             self.thread_stop_events[thread_name].set()
         
-        if thread_name in self.active_threads and self.active_threads[thread_name].is_alive():
-            self.active_threads[thread_name].join(timeout=0.5)
-            del self.active_threads[thread_name]
+        # Un task già avviato termina da solo sul pool: non lo si attende sul thread di Tk
+        future = self.active_threads.pop(thread_name, None)
+        if future is not None:
+            future.cancel()
+
+    def _submit_task(self, function, *args):
+        """Run a background task on the shared worker pool"""
+        future = self._pool.submit(function, *args)
+        future.add_done_callback(self._log_task_error)
+        return future
+
+    @staticmethod
+    def _log_task_error(future):
+        """Log the exception of a failed pool task (the pool would swallow it)"""
+        if not future.cancelled() and future.exception() is not None:
+            logging.error("Background task failed: %s", future.exception())
+
+    def _start_daemon_task(self, function, *args):
+        """Run a long blocking task (network tests, probes) on a daemon thread.
+
+        I worker del pool vengono attesi all'uscita dell'interprete: un ping o uno
+        speed test in corso terrebbe vivo il processo dopo la chiusura della finestra.
+        """
+        def run():
+            try:
+                function(*args)
+            except Exception as e:
+                logging.error("Background task failed: %s", e)
+
+        threading.Thread(target=run, daemon=True).start()
 
     def stop_all_active_threads(self):
         """Stop all active threads safely"""
@@ -2526,7 +2915,7 @@ class App(ctk.CTk):
         self.hardware_loading_label = ctk.CTkLabel(
             self.hardware_monitor_frame, 
             text="🖥️ Loading Hardware Monitor...\n\nLoading sensors in progress...",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self._font(16, "bold"),
             justify="center"
         )
         self.hardware_loading_label.grid(row=0, column=0, padx=20, pady=20, sticky="nsew")
@@ -2551,7 +2940,7 @@ class App(ctk.CTk):
             self.hide_loading_indicator()
             
         except Exception as e:
-            logging.error(f"Error loading hardware monitor: {e}")
+            logging.error("Error loading hardware monitor: %s", e)
             # Hide loading indicator on error
             try:
                 self.hide_loading_indicator()
@@ -2579,7 +2968,7 @@ class App(ctk.CTk):
             title_label = ctk.CTkLabel(
                 error_frame,
                 text="❌ Hardware Monitor Error",
-                font=ctk.CTkFont(size=18, weight="bold"),
+                font=self._font(18, "bold"),
                 text_color="#FF4444"
             )
             title_label.pack(pady=(20, 10))
@@ -2588,7 +2977,7 @@ class App(ctk.CTk):
             details_label = ctk.CTkLabel(
                 error_frame,
                 text=f"Error: {error_message}\n\nPossible causes:\n• Hardware monitor module (hardware_monitor_fixed.py) not found\n• Insufficient system permissions\n• Hardware compatibility issues\n• Missing dependencies",
-                font=ctk.CTkFont(size=12),
+                font=self._font(12),
                 justify="center"
             )
             details_label.pack(pady=10)
@@ -2618,12 +3007,12 @@ class App(ctk.CTk):
             debug_button.pack(side="left", padx=10)
             
         except Exception as e:
-            logging.error(f"Error showing hardware monitor error: {e}")
+            logging.error("Error showing hardware monitor error: %s", e)
             # Fallback simple error message
             simple_error = ctk.CTkLabel(
                 self.hardware_monitor_frame,
                 text=f"❌ Hardware Monitor Error\n{error_message}",
-                font=ctk.CTkFont(size=14),
+                font=self._font(14),
                 text_color="#FF4444"
             )
             simple_error.pack(pady=50)
@@ -2632,7 +3021,7 @@ class App(ctk.CTk):
         """Retry loading hardware monitor"""
         try:
             # Reset the flag
-            self.hardware_monitor_created = False
+            self._frames_built.discard("hardware_monitor")
             
             # Clear the frame
             for widget in self.hardware_monitor_frame.winfo_children():
@@ -2646,15 +3035,19 @@ class App(ctk.CTk):
             self._create_optimized_hardware_monitor()
             
         except Exception as e:
-            logging.error(f"Error retrying hardware monitor: {e}")
+            logging.error("Error retrying hardware monitor: %s", e)
             self._show_hardware_monitor_error(f"Retry failed: {e}")
 
     def _create_hardware_monitor_widgets(self):
         logging.debug("Creating universal hardware monitor widgets...")
+        accent_color = self.settings['accent_color']
+        hover_color = self._darken_color(accent_color, 0.1)
         
         # Import the universal hardware monitor with better error handling
         try:
             # Try multiple import methods
+            if getattr(self, 'hardware_monitor', None):
+                self.hardware_monitor.shutdown()
             self.hardware_monitor = None
             
             # Method 1: Direct import
@@ -2674,17 +3067,17 @@ class App(ctk.CTk):
             if self.hardware_monitor:
                 # Detect all sensors on startup
                 self.detected_sensors = self.hardware_monitor.detect_all_sensors()
-                logging.info(f"Detected {len(self.detected_sensors)} temperature sensors")
+                logging.info("Detected %s temperature sensors", len(self.detected_sensors))
             else:
                 raise Exception("Hardware monitor could not be initialized")
                 
         except ImportError as e:
-            logging.error(f"Failed to import hardware monitor: {e}")
+            logging.error("Failed to import hardware monitor: %s", e)
             self.hardware_monitor = None
             self.detected_sensors = {}
             raise Exception(f"Hardware monitor module not found. Make sure 'hardware_monitor_fixed.py' is in the same directory as gui.py. Error: {e}")
         except Exception as e:
-            logging.error(f"Error loading hardware monitor: {e}")
+            logging.error("Error loading hardware monitor: %s", e)
             self.hardware_monitor = None
             self.detected_sensors = {}
             raise Exception(f"Hardware monitor initialization failed: {e}")
@@ -2706,21 +3099,11 @@ class App(ctk.CTk):
             self.hardware_controls_frame,
             text="🔄 Refresh",
             command=self.refresh_hardware_monitor,
-            fg_color=self.settings['accent_color'],
-            hover_color=self._darken_color(self.settings['accent_color'], 0.1),
-            font=ctk.CTkFont(size=12)
+            fg_color=accent_color,
+            hover_color=hover_color,
+            font=self._font(12)
         )
         self.refresh_hardware_button.pack(side="right", padx=10, pady=5)
-        
-        # Apply custom colors and fonts immediately
-        self._apply_color_to_widget(self.refresh_hardware_button, "button")
-        self._apply_font_to_widget(self.refresh_hardware_button, "button")
-        
-        # Force color application to ensure consistency
-        self.refresh_hardware_button.configure(
-            fg_color=self.settings['accent_color'],
-            hover_color=self._darken_color(self.settings['accent_color'], 0.1)
-        )
 
         
         # HWiNFO64 Download Frame
@@ -2730,31 +3113,20 @@ class App(ctk.CTk):
         self.hwinfo_title = ctk.CTkLabel(
             self.hwinfo_frame,
             text="📊 HWiNFO64 - Professional Hardware Monitoring",
-            font=ctk.CTkFont(size=14, weight="bold"),
-            text_color=self.settings['accent_color']
+            font=self._font(14, "bold"),
+            text_color=accent_color
         )
         self.hwinfo_title.pack(pady=(10, 5))
         
-        # Apply custom colors and fonts immediately
-        self._apply_color_to_widget(self.hwinfo_title, "label")
-        self._apply_font_to_widget(self.hwinfo_title, "large")
-        
-        # Force color application to ensure consistency
-        self.hwinfo_title.configure(text_color=self.settings['accent_color'])
-        
         self.hwinfo_desc = ctk.CTkLabel(
             self.hwinfo_frame,
             text="Get real-time hardware monitoring with HWiNFO64\nAdvanced sensors, detailed reports, and professional features",
-            font=ctk.CTkFont(size=12),
+            font=self._font(12),
             text_color="#666666",
             justify="center"
         )
         self.hwinfo_desc.pack(pady=(0, 10))
         
-        # Apply custom colors and fonts immediately
-        self._apply_color_to_widget(self.hwinfo_desc, "label")
-        self._apply_font_to_widget(self.hwinfo_desc, "normal")
-        
         # HWiNFO64 buttons frame
         hwinfo_buttons_frame = ctk.CTkFrame(self.hwinfo_frame)
         hwinfo_buttons_frame.pack(pady=(0, 10))
@@ -2768,84 +3140,44 @@ class App(ctk.CTk):
                 hwinfo_buttons_frame,
                 text="🚀 Launch HWiNFO64",
                 command=self.launch_hwinfo64,
-                fg_color=self.settings['accent_color'],
-                hover_color=self._darken_color(self.settings['accent_color'], 0.1),
-                font=ctk.CTkFont(size=12, weight="bold")
+                fg_color=accent_color,
+                hover_color=hover_color,
+                font=self._font(12, "bold")
             )
             self.launch_hwinfo_button.pack(side="left", padx=5, pady=5)
             
-            # Apply custom colors and fonts immediately
-            self._apply_color_to_widget(self.launch_hwinfo_button, "button")
-            self._apply_font_to_widget(self.launch_hwinfo_button, "button")
-            
-            # Force color application to ensure consistency
-            self.launch_hwinfo_button.configure(
-                fg_color=self.settings['accent_color'],
-                hover_color=self._darken_color(self.settings['accent_color'], 0.1)
-            )
-            
             # Open Tools folder button
             self.open_tools_folder_button = ctk.CTkButton(
                 hwinfo_buttons_frame,
                 text="📁 Open Tools Folder Manual",
                 command=self._open_tools_folder,
-                fg_color=self.settings['accent_color'],
-                hover_color=self._darken_color(self.settings['accent_color'], 0.1),
-                font=ctk.CTkFont(size=12)
+                fg_color=accent_color,
+                hover_color=hover_color,
+                font=self._font(12)
             )
             self.open_tools_folder_button.pack(side="left", padx=5, pady=5)
-            
-            # Apply custom colors and fonts immediately
-            self._apply_color_to_widget(self.open_tools_folder_button, "button")
-            self._apply_font_to_widget(self.open_tools_folder_button, "button")
-            
-            # Force color application to ensure consistency
-            self.open_tools_folder_button.configure(
-                fg_color=self.settings['accent_color'],
-                hover_color=self._darken_color(self.settings['accent_color'], 0.1)
-            )
         else:
             # Download HWiNFO64 button
             self.download_hwinfo_button = ctk.CTkButton(
                 hwinfo_buttons_frame,
                 text="⬇️ Download HWiNFO64",
                 command=self.show_hwinfo64_install_options,
-                fg_color=self.settings['accent_color'],
-                hover_color=self._darken_color(self.settings['accent_color'], 0.1),
-                font=ctk.CTkFont(size=12, weight="bold")
+                fg_color=accent_color,
+                hover_color=hover_color,
+                font=self._font(12, "bold")
             )
             self.download_hwinfo_button.pack(side="left", padx=5, pady=5)
             
-            # Apply custom colors and fonts immediately
-            self._apply_color_to_widget(self.download_hwinfo_button, "button")
-            self._apply_font_to_widget(self.download_hwinfo_button, "button")
-            
-            # Force color application to ensure consistency
-            self.download_hwinfo_button.configure(
-                fg_color=self.settings['accent_color'],
-                hover_color=self._darken_color(self.settings['accent_color'], 0.1)
-            )
-            
             # Visit official website button
             self.visit_hwinfo_website_button = ctk.CTkButton(
                 hwinfo_buttons_frame,
                 text="🌐 Visit Official Website",
                 command=self._visit_hwinfo_website,
-                fg_color=self.settings['accent_color'],
-                hover_color=self._darken_color(self.settings['accent_color'], 0.1),
-                font=ctk.CTkFont(size=12)
+                fg_color=accent_color,
+                hover_color=hover_color,
+                font=self._font(12)
             )
             self.visit_hwinfo_website_button.pack(side="left", padx=5, pady=5)
-            
-            # Apply custom colors and fonts immediately
-            self._apply_color_to_widget(self.visit_hwinfo_website_button, "button")
-            self._apply_font_to_widget(self.visit_hwinfo_website_button, "button")
-            
-            # Force color application to ensure consistency
-            self.visit_hwinfo_website_button.configure(
-                fg_color=self.settings['accent_color'],
-                hover_color=self._darken_color(self.settings['accent_color'], 0.1)
-            )
         
         # CPU-Z Frame
         self.cpuz_frame = ctk.CTkFrame(self.hardware_scrollable_frame)
@@ -2854,22 +3186,15 @@ class App(ctk.CTk):
         self.cpuz_title = ctk.CTkLabel(
             self.cpuz_frame,
             text="🔍 CPU-Z - CPU Information & Benchmarking",
-            font=ctk.CTkFont(size=14, weight="bold"),
-            text_color=self.settings['accent_color']
+            font=self._font(14, "bold"),
+            text_color=accent_color
         )
         self.cpuz_title.pack(pady=(10, 5))
         
-        # Apply custom colors and fonts immediately
-        self._apply_color_to_widget(self.cpuz_title, "label")
-        self._apply_font_to_widget(self.cpuz_title, "large")
-        
-        # Force color application to ensure consistency
-        self.cpuz_title.configure(text_color=self.settings['accent_color'])
-        
         self.cpuz_desc = ctk.CTkLabel(
             self.cpuz_frame,
             text="Get detailed CPU information, specifications, and benchmarking\nSupports all versions: Standard, ASUS, MSI, Gigabyte, ASRock, EVGA, and more",
-            font=ctk.CTkFont(size=12),
+            font=self._font(12),
             text_color="#666666",
             justify="center"
         )
@@ -2888,84 +3213,44 @@ class App(ctk.CTk):
                 cpuz_buttons_frame,
                 text="🚀 Launch CPU-Z",
                 command=self.launch_cpuz,
-                fg_color=self.settings['accent_color'],
-                hover_color=self._darken_color(self.settings['accent_color'], 0.1),
-                font=ctk.CTkFont(size=12, weight="bold")
+                fg_color=accent_color,
+                hover_color=hover_color,
+                font=self._font(12, "bold")
             )
             self.launch_cpuz_button.pack(side="left", padx=5, pady=5)
             
-            # Apply custom colors and fonts immediately
-            self._apply_color_to_widget(self.launch_cpuz_button, "button")
-            self._apply_font_to_widget(self.launch_cpuz_button, "button")
-            
-            # Force color application to ensure consistency
-            self.launch_cpuz_button.configure(
-                fg_color=self.settings['accent_color'],
-                hover_color=self._darken_color(self.settings['accent_color'], 0.1)
-            )
-            
             # Open Tools folder button
             self.open_tools_folder_cpuz_button = ctk.CTkButton(
                 cpuz_buttons_frame,
                 text="📁 Open Tools Folder Manual",
                 command=self._open_tools_folder,
-                fg_color=self.settings['accent_color'],
-                hover_color=self._darken_color(self.settings['accent_color'], 0.1),
-                font=ctk.CTkFont(size=12)
+                fg_color=accent_color,
+                hover_color=hover_color,
+                font=self._font(12)
             )
             self.open_tools_folder_cpuz_button.pack(side="left", padx=5, pady=5)
-            
-            # Apply custom colors and fonts immediately
-            self._apply_color_to_widget(self.open_tools_folder_cpuz_button, "button")
-            self._apply_font_to_widget(self.open_tools_folder_cpuz_button, "button")
-            
-            # Force color application to ensure consistency
-            self.open_tools_folder_cpuz_button.configure(
-                fg_color=self.settings['accent_color'],
-                hover_color=self._darken_color(self.settings['accent_color'], 0.1)
-            )
         else:
             # Download CPU-Z button
             self.download_cpuz_button = ctk.CTkButton(
                 cpuz_buttons_frame,
                 text="⬇️ Download CPU-Z",
                 command=self.show_cpuz_install_options,
-                fg_color=self.settings['accent_color'],
-                hover_color=self._darken_color(self.settings['accent_color'], 0.1),
-                font=ctk.CTkFont(size=12, weight="bold")
+                fg_color=accent_color,
+                hover_color=hover_color,
+                font=self._font(12, "bold")
             )
             self.download_cpuz_button.pack(side="left", padx=5, pady=5)
             
-            # Apply custom colors and fonts immediately
-            self._apply_color_to_widget(self.download_cpuz_button, "button")
-            self._apply_font_to_widget(self.download_cpuz_button, "button")
-            
-            # Force color application to ensure consistency
-            self.download_cpuz_button.configure(
-                fg_color=self.settings['accent_color'],
-                hover_color=self._darken_color(self.settings['accent_color'], 0.1)
-            )
-            
             # Visit official website button
             self.visit_cpuz_website_button = ctk.CTkButton(
                 cpuz_buttons_frame,
                 text="🌐 Visit Official Website",
                 command=self._visit_cpuz_website,
-                fg_color=self.settings['accent_color'],
-                hover_color=self._darken_color(self.settings['accent_color'], 0.1),
-                font=ctk.CTkFont(size=12)
+                fg_color=accent_color,
+                hover_color=hover_color,
+                font=self._font(12)
             )
             self.visit_cpuz_website_button.pack(side="left", padx=5, pady=5)
-            
-            # Apply custom colors and fonts immediately
-            self._apply_color_to_widget(self.visit_cpuz_website_button, "button")
-            self._apply_font_to_widget(self.visit_cpuz_website_button, "button")
-            
-            # Force color application to ensure consistency
-            self.visit_cpuz_website_button.configure(
-                fg_color=self.settings['accent_color'],
-                hover_color=self._darken_color(self.settings['accent_color'], 0.1)
-            )
         
         # FanControl Frame
         self.fancontrol_frame = ctk.CTkFrame(self.hardware_scrollable_frame)
@@ -2974,22 +3259,15 @@ class App(ctk.CTk):
         self.fancontrol_title = ctk.CTkLabel(
             self.fancontrol_frame,
             text="🌀 FanControl - Advanced Fan Control Software",
-            font=ctk.CTkFont(size=14, weight="bold"),
-            text_color=self.settings['accent_color']
+            font=self._font(14, "bold"),
+            text_color=accent_color
         )
         self.fancontrol_title.pack(pady=(10, 5))
         
-        # Apply custom colors and fonts immediately
-        self._apply_color_to_widget(self.fancontrol_title, "label")
-        self._apply_font_to_widget(self.fancontrol_title, "large")
-        
-        # Force color application to ensure consistency
-        self.fancontrol_title.configure(text_color=self.settings['accent_color'])
-        
         self.fancontrol_desc = ctk.CTkLabel(
             self.fancontrol_frame,
             text="Professional fan control with custom curves, multiple sensors\nHighly customizable fan controlling software for Windows",
-            font=ctk.CTkFont(size=12),
+            font=self._font(12),
             text_color="#666666",
             justify="center"
         )
@@ -3008,84 +3286,44 @@ class App(ctk.CTk):
                 fancontrol_buttons_frame,
                 text="🚀 Launch FanControl",
                 command=self.launch_fancontrol,
-                fg_color=self.settings['accent_color'],
-                hover_color=self._darken_color(self.settings['accent_color'], 0.1),
-                font=ctk.CTkFont(size=12, weight="bold")
+                fg_color=accent_color,
+                hover_color=hover_color,
+                font=self._font(12, "bold")
             )
             self.launch_fancontrol_button.pack(side="left", padx=5, pady=5)
             
-            # Apply custom colors and fonts immediately
-            self._apply_color_to_widget(self.launch_fancontrol_button, "button")
-            self._apply_font_to_widget(self.launch_fancontrol_button, "button")
-            
-            # Force color application to ensure consistency
-            self.launch_fancontrol_button.configure(
-                fg_color=self.settings['accent_color'],
-                hover_color=self._darken_color(self.settings['accent_color'], 0.1)
-            )
-            
             # Open Tools folder button
             self.open_tools_folder_fancontrol_button = ctk.CTkButton(
                 fancontrol_buttons_frame,
                 text="📁 Open Tools Folder",
                 command=self._open_tools_folder,
-                fg_color=self.settings['accent_color'],
-                hover_color=self._darken_color(self.settings['accent_color'], 0.1),
-                font=ctk.CTkFont(size=12)
+                fg_color=accent_color,
+                hover_color=hover_color,
+                font=self._font(12)
             )
             self.open_tools_folder_fancontrol_button.pack(side="left", padx=5, pady=5)
-            
-            # Apply custom colors and fonts immediately
-            self._apply_color_to_widget(self.open_tools_folder_fancontrol_button, "button")
-            self._apply_font_to_widget(self.open_tools_folder_fancontrol_button, "button")
-            
-            # Force color application to ensure consistency
-            self.open_tools_folder_fancontrol_button.configure(
-                fg_color=self.settings['accent_color'],
-                hover_color=self._darken_color(self.settings['accent_color'], 0.1)
-            )
         else:
             # Download FanControl button
             self.download_fancontrol_button = ctk.CTkButton(
                 fancontrol_buttons_frame,
                 text="⬇️ Download FanControl",
                 command=self.show_fancontrol_install_options,
-                fg_color=self.settings['accent_color'],
-                hover_color=self._darken_color(self.settings['accent_color'], 0.1),
-                font=ctk.CTkFont(size=12, weight="bold")
+                fg_color=accent_color,
+                hover_color=hover_color,
+                font=self._font(12, "bold")
             )
             self.download_fancontrol_button.pack(side="left", padx=5, pady=5)
             
-            # Apply custom colors and fonts immediately
-            self._apply_color_to_widget(self.download_fancontrol_button, "button")
-            self._apply_font_to_widget(self.download_fancontrol_button, "button")
-            
-            # Force color application to ensure consistency
-            self.download_fancontrol_button.configure(
-                fg_color=self.settings['accent_color'],
-                hover_color=self._darken_color(self.settings['accent_color'], 0.1)
-            )
-            
             # Visit official website button
             self.visit_fancontrol_website_button = ctk.CTkButton(
                 fancontrol_buttons_frame,
                 text="🌐 Visit Official Website",
                 command=self._visit_fancontrol_website,
-                fg_color=self.settings['accent_color'],
-                hover_color=self._darken_color(self.settings['accent_color'], 0.1),
-                font=ctk.CTkFont(size=12)
+                fg_color=accent_color,
+                hover_color=hover_color,
+                font=self._font(12)
             )
             self.visit_fancontrol_website_button.pack(side="left", padx=5, pady=5)
-            
-            # Apply custom colors and fonts immediately
-            self._apply_color_to_widget(self.visit_fancontrol_website_button, "button")
-            self._apply_font_to_widget(self.visit_fancontrol_website_button, "button")
-            
-            # Force color application to ensure consistency
-            self.visit_fancontrol_website_button.configure(
-                fg_color=self.settings['accent_color'],
-                hover_color=self._darken_color(self.settings['accent_color'], 0.1)
-            )
         
         # Create scrollable frame for all sensors
         self.sensors_frame = ctk.CTkScrollableFrame(
@@ -3122,10 +3360,12 @@ class App(ctk.CTk):
         
         # Always create fan control widgets (with simulated control if no admin privileges)
         self._create_fan_control_widgets()
+
+        # Apply accent color and fonts to the new widgets
+        self._apply_theme()
         
         # AVVIA sistema di aggiornamento automatico delle temperature
         logging.debug("🚀 Starting automatic hardware temperature updates...")
-        self.hardware_update_job = None
         
         # Start hardware updates directly (no loading to avoid blocking)
         self.start_hardware_updates()
@@ -3146,7 +3386,7 @@ class App(ctk.CTk):
         fan_title = ctk.CTkLabel(
             self.fan_control_frame,
             text="🎛️ Fan Control Tools",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self._font(16, "bold"),
             text_color="#E74C3C"
         )
         fan_title.pack(pady=(10, 5))
@@ -3158,7 +3398,7 @@ class App(ctk.CTk):
         info_label = ctk.CTkLabel(
             info_frame,
             text="💡 INFO: For advanced fan control, check out Control Fans on GitHub:",
-            font=ctk.CTkFont(size=10),
+            font=self._font(10),
             text_color="#0C5460",
             wraplength=600
         )
@@ -3187,7 +3427,7 @@ class App(ctk.CTk):
         fan_monitoring_title = ctk.CTkLabel(
             self.real_time_fan_frame,
             text="🌀 Real-Time Fan Monitoring",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self._font(16, "bold"),
             text_color="#E74C3C"
         )
         fan_monitoring_title.pack(pady=(10, 5))
@@ -3196,7 +3436,7 @@ class App(ctk.CTk):
         self.fan_monitoring_status = ctk.CTkLabel(
             self.real_time_fan_frame,
             text="🟢 Active Monitoring - Updates every 2 seconds",
-            font=ctk.CTkFont(size=12),
+            font=self._font(12),
             text_color="#00AA00"
         )
         self.fan_monitoring_status.pack(pady=(0, 10))
@@ -3230,7 +3470,7 @@ class App(ctk.CTk):
             fan_header = ctk.CTkLabel(
                 fan_display_frame,
                 text=f"{icon} {fan_name}",
-                font=ctk.CTkFont(size=12, weight="bold"),
+                font=self._font(12, "bold"),
                 text_color="#E74C3C"
             )
             fan_header.pack(pady=(5, 2))
@@ -3239,7 +3479,7 @@ class App(ctk.CTk):
             rpm_label = ctk.CTkLabel(
                 fan_display_frame,
                 text="0 RPM",
-                font=ctk.CTkFont(size=14, weight="bold"),
+                font=self._font(14, "bold"),
                 text_color="#00AA00"
             )
             rpm_label.pack(pady=2)
@@ -3248,7 +3488,7 @@ class App(ctk.CTk):
             speed_label = ctk.CTkLabel(
                 fan_display_frame,
                 text="(0%)",
-                font=ctk.CTkFont(size=10),
+                font=self._font(10),
                 text_color="#888888"
             )
             speed_label.pack(pady=2)
@@ -3273,11 +3513,10 @@ class App(ctk.CTk):
     def _open_control_fans_github(self):
         """Apre il link per Control Fans su GitHub."""
         try:
-            import webbrowser
             webbrowser.open("https://github.com/Rem0o/FanControl.Releases")
             logging.info("Opened Control Fans GitHub page")
         except Exception as e:
-            logging.error(f"Failed to open GitHub page: {e}")
+            logging.error("Failed to open GitHub page: %s", e)
             self._show_error("Error", "Unable to open GitHub page.")
     
     def _show_error(self, title: str, message: str):
@@ -3358,11 +3597,10 @@ class App(ctk.CTk):
             
             # Get CPU info with psutil fallback
             try:
-                import psutil
                 cpu_count = psutil.cpu_count(logical=False)
                 cpu_count_logical = psutil.cpu_count(logical=True)
                 system_text = f"System: {system} {machine} | CPU: {processor} ({cpu_count}C/{cpu_count_logical}T)"
-            except (ImportError, Exception):
+            except Exception:
                 # Fallback without psutil
                 system_text = f"System: {system} {machine} | CPU: {processor}"
             
@@ -3373,7 +3611,7 @@ class App(ctk.CTk):
             self.system_info_label.configure(text=system_text)
             
         except Exception as e:
-            logging.error(f"Failed to update system info: {e}")
+            logging.error("Failed to update system info: %s", e)
             self.system_info_label.configure(text="System: Information unavailable")
     
     def _create_rpm_displays(self):
@@ -3406,7 +3644,7 @@ class App(ctk.CTk):
                     self._create_single_rpm_display(fan_id, fan_info)
                     
         except Exception as e:
-            logging.error(f"Failed to create RPM displays: {e}")
+            logging.error("Failed to create RPM displays: %s", e)
     
     def _create_single_rpm_display(self, fan_id: str, fan_info: dict):
         """Creates a single RPM display for a fan."""
@@ -3419,7 +3657,7 @@ class App(ctk.CTk):
             name_label = ctk.CTkLabel(
                 fan_frame,
                 text=f"{fan_name}:",
-                font=ctk.CTkFont(size=12, weight="bold"),
+                font=self._font(12, "bold"),
                 width=120
             )
             name_label.pack(side="left", padx=10, pady=5)
@@ -3429,7 +3667,7 @@ class App(ctk.CTk):
             rpm_label = ctk.CTkLabel(
                 fan_frame,
                 text=f"{int(current_rpm)} RPM",
-                font=ctk.CTkFont(size=12),
+                font=self._font(12),
                 width=100
             )
             rpm_label.pack(side="left", padx=10, pady=5)
@@ -3439,7 +3677,7 @@ class App(ctk.CTk):
             speed_label = ctk.CTkLabel(
                 fan_frame,
                 text=f"({speed_percent}%)",
-                font=ctk.CTkFont(size=11),
+                font=self._font(11),
                 text_color="gray",
                 width=60
             )
@@ -3468,7 +3706,7 @@ class App(ctk.CTk):
             }
             
         except Exception as e:
-            logging.error(f"Failed to create RPM display for {fan_id}: {e}")
+            logging.error("Failed to create RPM display for %s: %s", fan_id, e)
     
     def start_hardware_updates(self):
         """Starts hardware monitoring without threads to avoid process creation."""
@@ -3483,9 +3721,9 @@ class App(ctk.CTk):
                 # UniversalHardwareMonitor class is defined inline above
                 self.hardware_monitor = UniversalHardwareMonitor()
                 self.detected_sensors = self.hardware_monitor.detect_all_sensors()
-                logging.info(f"Hardware monitor initialized with {len(self.detected_sensors)} sensors")
+                logging.info("Hardware monitor initialized with %s sensors", len(self.detected_sensors))
             except Exception as e:
-                logging.error(f"Failed to initialize hardware monitor: {e}")
+                logging.error("Failed to initialize hardware monitor: %s", e)
                 return
         
         # Mark as started to prevent multiple calls
@@ -3498,6 +3736,7 @@ class App(ctk.CTk):
 
     def _schedule_hardware_update(self):
         """Schedules the next hardware update using after() instead of threads."""
+        self.hardware_update_job = None
         # Stop updates if we're no longer in hardware monitor or updates were stopped
         if not hasattr(self, '_hardware_updates_started') or not self._hardware_updates_started or self.current_frame != "hardware_monitor":
             logging.info("Hardware updates stopped - no longer in hardware monitor")
@@ -3515,12 +3754,12 @@ class App(ctk.CTk):
                 self._update_rpm_displays(fan_status)
             
             # Schedule next update in 2 seconds to prevent excessive updates
-            self.after(2000, self._schedule_hardware_update)
+            self.hardware_update_job = self.after(2000, self._schedule_hardware_update)
             
         except Exception as e:
-            logging.error(f"Error in hardware update: {e}")
+            logging.error("Error in hardware update: %s", e)
             # Still schedule next update even if there's an error, but with longer delay
-            self.after(5000, self._schedule_hardware_update)
+            self.hardware_update_job = self.after(5000, self._schedule_hardware_update)
 
     def _update_real_time_fan_displays(self, fan_status):
         """Updates real-time fan displays with current fan data."""
@@ -3644,7 +3883,7 @@ class App(ctk.CTk):
         
         # Log updates for debug
         if updated_count > 0:
-            logging.debug(f"Updated {updated_count} sensor labels with real-time data")
+            logging.debug("Updated %s sensor labels with real-time data", updated_count)
     
     def _update_rpm_displays(self, fan_status):
         """Updates RPM displays with real-time data."""
@@ -3689,7 +3928,10 @@ class App(ctk.CTk):
         logging.info("Stopping hardware updates")
         # Reset the flag to allow restarting
         self._hardware_updates_started = False
-        # The after() calls will stop automatically when the window is destroyed
+        # Cancel the pending update so no sensor read happens after leaving
+        if self.hardware_update_job is not None:
+            self.after_cancel(self.hardware_update_job)
+            self.hardware_update_job = None
 
     def start_scan_thread(self):
         self.scan_button.configure(state="disabled", text="Scanning...")
@@ -3698,26 +3940,41 @@ class App(ctk.CTk):
         self.clean_button.configure(state="disabled")
         self.temp_files = []
         
-        thread = threading.Thread(target=self.scan_temp_files)
-        thread.start()
+        self._submit_task(self.scan_temp_files)
 
     def scan_temp_files(self):
         temp_dir = tempfile.gettempdir()
         total_size = 0
         files_found = []
+        # Paths reach the textbox in blocks, inserted from the UI thread
+        batch = []
+        last_flush = time.monotonic()
 
         for root, dirs, files in os.walk(temp_dir):
             for file in files:
+                file_path = os.path.join(root, file)
                 try:
-                    file_path = os.path.join(root, file)
-                    if os.path.exists(file_path):
-                        file_size = os.path.getsize(file_path)
-                        total_size += file_size
-                        files_found.append(file_path)
-                        self.result_textbox.insert("end", f"{file_path}\n")
-                except (FileNotFoundError, OSError):
+                    file_size = os.path.getsize(file_path)
+                except OSError:
                     continue
-
+                total_size += file_size
+                files_found.append(file_path)
+                batch.append(file_path)
+                if len(batch) >= 256 or time.monotonic() - last_flush > 0.1:
+                    self.after(0, self._append_scan_results, batch)
+                    batch = []
+                    last_flush = time.monotonic()
+
+        if batch:
+            self.after(0, self._append_scan_results, batch)
+        self.after(0, self._finish_scan, files_found, total_size)
+
+    def _append_scan_results(self, paths):
+        """Append a block of scanned paths to the results textbox."""
+        self.result_textbox.insert("end", "\n".join(paths) + "\n")
+
+    def _finish_scan(self, files_found, total_size):
+        """Publish the scan results and re-enable the buttons."""
         self.temp_files = files_found
         self.total_size_label.configure(text=f"Found {len(self.temp_files)} files. Space to free: {total_size / 1e6:.2f} MB")
         self.scan_button.configure(state="normal", text="Scan for temporary files")
@@ -3753,8 +4010,12 @@ class App(ctk.CTk):
 
     def _schedule_ram_update(self):
         """Schedules RAM updates using after() instead of threads."""
+        if psutil is None:
+            if hasattr(self, 'ram_details_label'):
+                self.ram_details_label.configure(text="❌ RAM monitoring unavailable (psutil not installed)")
+            logging.error("psutil not available for RAM monitoring")
+            return  # Don't schedule next update
         try:
-            import psutil
             ram = psutil.virtual_memory()
             ram_percent = ram.percent
             ram_used = ram.used / (1024**3)
@@ -3764,16 +4025,10 @@ class App(ctk.CTk):
                 self.ram_progress_bar.set(ram_percent / 100)
             if hasattr(self, 'ram_details_label'):
                 self.ram_details_label.configure(text=f"{ram_used:.2f} GB / {ram_total:.2f} GB ({ram_percent}%)")
-        except ImportError:
-            # psutil not available
-            if hasattr(self, 'ram_details_label'):
-                self.ram_details_label.configure(text="❌ RAM monitoring unavailable (psutil not installed)")
-            logging.error("psutil not available for RAM monitoring")
-            return  # Don't schedule next update
         except Exception as e:
             if hasattr(self, 'ram_details_label'):
                 self.ram_details_label.configure(text="❌ RAM monitoring error")
-            logging.error(f"Error updating RAM: {e}")
+            logging.error("Error updating RAM: %s", e)
         
         # Schedule next update in 2 seconds
         self.after(2000, self._schedule_ram_update)
@@ -3783,7 +4038,6 @@ class App(ctk.CTk):
         self.optimize_ram_button.configure(state="disabled", text="Optimizing...")
         
         # Salva i valori prima dell'ottimizzazione
-        import psutil
         ram_before = psutil.virtual_memory()
         ram_used_before = ram_before.used / (1024**3)
         
@@ -3792,7 +4046,6 @@ class App(ctk.CTk):
 
     def _perform_ram_optimization(self, ram_used_before):
         """Esegue l'ottimizzazione RAM in background."""
-        import psutil
         import gc
         import ctypes
         from ctypes import wintypes
@@ -3828,7 +4081,7 @@ class App(ctk.CTk):
             self._finish_ram_optimization(ram_freed, collected)
             
         except Exception as e:
-            logging.error(f"RAM optimization error: {e}")
+            logging.error("RAM optimization error: %s", e)
             self._finish_ram_optimization(0, 0, error=str(e))
 
     def _finish_ram_optimization(self, ram_freed, collected, error=None):
@@ -3849,17 +4102,14 @@ class App(ctk.CTk):
         self.clean_ram_button.configure(state="disabled", text="🧹 Cleaning...")
         
         # Salva i valori prima della pulizia
-        import psutil
         ram_before = psutil.virtual_memory()
         ram_used_before = ram_before.used / (1024**3)
         
         # Esegui la pulizia in background
-        thread = threading.Thread(target=self._perform_ram_cleanup, args=(ram_used_before,), daemon=True)
-        thread.start()
+        self._start_daemon_task(self._perform_ram_cleanup, ram_used_before)
 
     def _perform_ram_cleanup(self, ram_used_before):
         """Esegue la pulizia aggressiva della RAM."""
-        import psutil
         import gc
         import ctypes
         from ctypes import wintypes
@@ -3888,7 +4138,7 @@ class App(ctk.CTk):
                 startupinfo.wShowWindow = subprocess.SW_HIDE
                 
                 subprocess.run(["powershell", "-Command", "Clear-DnsClientCache"], 
-                             capture_output=True, timeout=5, startupinfo=startupinfo)
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5, startupinfo=startupinfo)
             except:
                 pass
             
@@ -3911,7 +4161,7 @@ class App(ctk.CTk):
             self._finish_ram_cleanup(ram_freed, collected)
             
         except Exception as e:
-            logging.error(f"RAM cleanup error: {e}")
+            logging.error("RAM cleanup error: %s", e)
             self._finish_ram_cleanup(0, 0, error=str(e))
 
     def _finish_ram_cleanup(self, ram_freed, collected, error=None):
@@ -3936,7 +4186,6 @@ class App(ctk.CTk):
             if self.psutil_available:
                 # Use psutil if available
                 try:
-                    import psutil
                     for proc in psutil.process_iter(['name']):
                         try:
                             if proc.info['name'] and 'taskmgr' in proc.info['name'].lower():
@@ -3953,7 +4202,8 @@ class App(ctk.CTk):
                 # Use alternative method with tasklist
                 try:
                     result = subprocess.run(['tasklist', '/FI', 'IMAGENAME eq taskmgr.exe'], 
-                                          capture_output=True, text=True, timeout=5)
+                                          stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, timeout=5,
+                                          creationflags=subprocess.CREATE_NO_WINDOW)
                     if 'taskmgr.exe' in result.stdout.lower():
                         taskmgr_running = True
                 except Exception:
@@ -4227,18 +4477,15 @@ class App(ctk.CTk):
 
     def start_ping_test(self):
         self.ping_test_button.configure(state="disabled", text="🏓 Testing...")
-        thread = threading.Thread(target=self.run_ping_test, daemon=True)
-        thread.start()
+        self._start_daemon_task(self.run_ping_test)
 
     def start_speed_test(self):
         self.speed_test_button.configure(state="disabled", text="⚡ Testing...")
-        thread = threading.Thread(target=self.run_speed_test, daemon=True)
-        thread.start()
+        self._start_daemon_task(self.run_speed_test)
 
     def start_connection_test(self):
         self.connection_test_button.configure(state="disabled", text="🔗 Testing...")
-        thread = threading.Thread(target=self.run_connection_test, daemon=True)
-        thread.start()
+        self._start_daemon_task(self.run_connection_test)
 
     def show_troubleshooting_guide(self):
         if not hasattr(self, 'troubleshoot_window') or not self.troubleshoot_window.winfo_exists():
@@ -4427,14 +4674,14 @@ Follow these steps one at a time. If a step resolves the issue, you don't need t
             
             # Titolo
             title = ctk.CTkLabel(main_frame, text=f"🏓 PING TEST - {results['host'].upper()}", 
-                                font=ctk.CTkFont(size=18, weight="bold"))
+                                font=self._font(18, "bold"))
             title.pack(pady=(10, 20))
             
             # Stato generale
             status_color = "#33FF57" if results["success"] else "#FF5733"
             status_text = "✅ CONNESSIONE STABILE" if results["success"] else "❌ CONNESSIONE FALLITA"
             status_label = ctk.CTkLabel(main_frame, text=status_text, 
-                                       font=ctk.CTkFont(size=16, weight="bold"),
+                                       font=self._font(16, "bold"),
                                        text_color=status_color)
             status_label.pack(pady=10)
             
@@ -4443,7 +4690,7 @@ Follow these steps one at a time. If a step resolves the issue, you don't need t
             stats_frame.pack(fill="x", padx=10, pady=10)
             
             ctk.CTkLabel(stats_frame, text="📊 STATISTICHE", 
-                        font=ctk.CTkFont(size=14, weight="bold")).pack(pady=5)
+                        font=self._font(14, "bold")).pack(pady=5)
             
             ctk.CTkLabel(stats_frame, text=f"Pacchetti inviati: {results['packets_sent']}").pack(anchor="w", padx=10)
             ctk.CTkLabel(stats_frame, text=f"Pacchetti ricevuti: {results['packets_received']}").pack(anchor="w", padx=10)
@@ -4454,7 +4701,7 @@ Follow these steps one at a time. If a step resolves the issue, you don't need t
             times_frame.pack(fill="x", padx=10, pady=10)
             
             ctk.CTkLabel(times_frame, text="⏱️ TEMPO DI RISPOSTA", 
-                        font=ctk.CTkFont(size=14, weight="bold")).pack(pady=5)
+                        font=self._font(14, "bold")).pack(pady=5)
             
             ctk.CTkLabel(times_frame, text=f"Ping: {results['avg_time']}").pack(anchor="w", padx=10)
             
@@ -4463,7 +4710,7 @@ Follow these steps one at a time. If a step resolves the issue, you don't need t
             output_frame.pack(fill="both", expand=True, padx=10, pady=10)
             
             ctk.CTkLabel(output_frame, text="📋 OUTPUT COMPLETO", 
-                        font=ctk.CTkFont(size=14, weight="bold")).pack(pady=5)
+                        font=self._font(14, "bold")).pack(pady=5)
             
             output_text = ctk.CTkTextbox(output_frame, height=150)
             output_text.pack(fill="both", expand=True, padx=10, pady=5)
@@ -4494,7 +4741,7 @@ Follow these steps one at a time. If a step resolves the issue, you don't need t
             
             # Title
             title_label = ctk.CTkLabel(main_frame, text="🌐 High-Precision Network Analysis", 
-                                     font=ctk.CTkFont(size=18, weight="bold"))
+                                     font=self._font(18, "bold"))
             title_label.pack(pady=(10, 20))
             
             # Overall status
@@ -4512,7 +4759,7 @@ Follow these steps one at a time. If a step resolves the issue, you don't need t
                 status_text = f"❌ Poor connectivity ({successful_tests}/{total_tests} hosts reachable)"
             
             status_label = ctk.CTkLabel(main_frame, text=status_text, 
-                                      font=ctk.CTkFont(size=14, weight="bold"),
+                                      font=self._font(14, "bold"),
                                       text_color=status_color)
             status_label.pack(pady=(0, 20))
             
@@ -4532,7 +4779,7 @@ Follow these steps one at a time. If a step resolves the issue, you don't need t
                 
                 host_label = ctk.CTkLabel(host_frame, 
                                         text=f"{host_name} - {host_status}",
-                                        font=ctk.CTkFont(size=14, weight="bold"),
+                                        font=self._font(14, "bold"),
                                         text_color=host_color)
                 host_label.pack(anchor="w", padx=10, pady=(10, 5))
                 
@@ -4548,7 +4795,7 @@ Follow these steps one at a time. If a step resolves the issue, you don't need t
 📉 Packet Loss: {result.get('packet_loss', '100%')}"""
                 
                 details_label = ctk.CTkLabel(host_frame, text=details_text, 
-                                           font=ctk.CTkFont(size=11),
+                                           font=self._font(11),
                                            justify="left")
                 details_label.pack(anchor="w", padx=20, pady=(0, 10))
             
@@ -4557,7 +4804,7 @@ Follow these steps one at a time. If a step resolves the issue, you don't need t
             assessment_frame.pack(fill="x", padx=10, pady=20)
             
             assessment_title = ctk.CTkLabel(assessment_frame, text="📋 High-Precision Quality Assessment", 
-                                          font=ctk.CTkFont(size=16, weight="bold"))
+                                          font=self._font(16, "bold"))
             assessment_title.pack(pady=(10, 5))
             
             # Calculate average response time for successful connections
@@ -4594,13 +4841,13 @@ Follow these steps one at a time. If a step resolves the issue, you don't need t
                 quality_text = "Quality: 🔴 No successful connections"
             
             quality_label = ctk.CTkLabel(assessment_frame, text=quality_text, 
-                                       font=ctk.CTkFont(size=12))
+                                       font=self._font(12))
             quality_label.pack(pady=(5, 15))
             
             # Close button
             close_button = ctk.CTkButton(main_frame, text="✅ Close", 
                                        command=self.enhanced_ping_window.destroy,
-                                       fg_color="#4A9EFF", hover_color="#3A8EFF")
+                                       **self.ACCENT_BUTTON_STYLE)
             close_button.pack(pady=20)
         else:
             self.enhanced_ping_window.focus()
@@ -4934,7 +5181,7 @@ Follow these steps one at a time. If a step resolves the issue, you don't need t
             
             # Titolo
             title = ctk.CTkLabel(main_frame, text="⚡ RISULTATI SPEED TEST", 
-                                font=ctk.CTkFont(size=18, weight="bold"))
+                                font=self._font(18, "bold"))
             title.pack(pady=(10, 20))
             
             # Informazioni connessione
@@ -4942,7 +5189,7 @@ Follow these steps one at a time. If a step resolves the issue, you don't need t
             conn_frame.pack(fill="x", padx=10, pady=5)
             
             ctk.CTkLabel(conn_frame, text="📡 INFORMAZIONI CONNESSIONE", 
-                        font=ctk.CTkFont(size=14, weight="bold")).pack(pady=5)
+                        font=self._font(14, "bold")).pack(pady=5)
             
             ctk.CTkLabel(conn_frame, text=f"Tipo: {connection_info['type']}").pack(anchor="w", padx=10)
             ctk.CTkLabel(conn_frame, text=f"Nome: {connection_info['name']}").pack(anchor="w", padx=10)
@@ -4954,7 +5201,7 @@ Follow these steps one at a time. If a step resolves the issue, you don't need t
             speed_frame.pack(fill="x", padx=10, pady=10)
             
             ctk.CTkLabel(speed_frame, text="🚀 SPEED", 
-                        font=ctk.CTkFont(size=14, weight="bold")).pack(pady=5)
+                        font=self._font(14, "bold")).pack(pady=5)
             
             download_color = "#33FF57" if "Error" not in download_speed else "#FF5733"
             upload_color = "#33FF57" if "Error" not in upload_speed else "#FF5733"
@@ -4988,7 +5235,7 @@ Follow these steps one at a time. If a step resolves the issue, you don't need t
             
             # Title
             title_label = ctk.CTkLabel(main_frame, text="🌐 Internet Speed Analysis", 
-                                     font=ctk.CTkFont(size=18, weight="bold"))
+                                     font=self._font(18, "bold"))
             title_label.pack(pady=(10, 20))
             
             # Test info
@@ -4996,7 +5243,7 @@ Follow these steps one at a time. If a step resolves the issue, you don't need t
             info_frame.pack(fill="x", padx=10, pady=10)
             
             info_title = ctk.CTkLabel(info_frame, text="📊 Test Information", 
-                                    font=ctk.CTkFont(size=14, weight="bold"))
+                                    font=self._font(14, "bold"))
             info_title.pack(pady=(10, 5))
             
             test_info_text = f"""🕒 Test completed: {results['timestamp']}
@@ -5004,7 +5251,7 @@ Follow these steps one at a time. If a step resolves the issue, you don't need t
 🔄 Test method: Multi-phase comprehensive analysis"""
             
             info_label = ctk.CTkLabel(info_frame, text=test_info_text, 
-                                    font=ctk.CTkFont(size=11), justify="left")
+                                    font=self._font(11), justify="left")
             info_label.pack(pady=(5, 15))
             
             # Connection details
@@ -5012,7 +5259,7 @@ Follow these steps one at a time. If a step resolves the issue, you don't need t
             conn_frame.pack(fill="x", padx=10, pady=10)
             
             conn_title = ctk.CTkLabel(conn_frame, text="🔌 Connection Details", 
-                                    font=ctk.CTkFont(size=14, weight="bold"))
+                                    font=self._font(14, "bold"))
             conn_title.pack(pady=(10, 5))
             
             conn_info = results['connection_info']
@@ -5023,7 +5270,7 @@ Follow these steps one at a time. If a step resolves the issue, you don't need t
 🔍 DNS Server: {conn_info.get('dns', 'Unknown')}"""
             
             conn_label = ctk.CTkLabel(conn_frame, text=conn_text, 
-                                    font=ctk.CTkFont(size=11), justify="left")
+                                    font=self._font(11), justify="left")
             conn_label.pack(pady=(5, 15))
             
             # Latency results
@@ -5031,7 +5278,7 @@ Follow these steps one at a time. If a step resolves the issue, you don't need t
             latency_frame.pack(fill="x", padx=10, pady=10)
             
             latency_title = ctk.CTkLabel(latency_frame, text="🏓 Latency Analysis", 
-                                       font=ctk.CTkFont(size=14, weight="bold"))
+                                       font=self._font(14, "bold"))
             latency_title.pack(pady=(10, 5))
             
             latency_info = results['latency']
@@ -5042,7 +5289,7 @@ Follow these steps one at a time. If a step resolves the issue, you don't need t
 🌐 Servers Tested: {latency_info['servers_tested']}"""
             
             latency_label = ctk.CTkLabel(latency_frame, text=latency_text, 
-                                       font=ctk.CTkFont(size=11), justify="left",
+                                       font=self._font(11), justify="left",
                                        text_color=latency_color)
             latency_label.pack(pady=(5, 15))
             
@@ -5051,7 +5298,7 @@ Follow these steps one at a time. If a step resolves the issue, you don't need t
             download_frame.pack(fill="x", padx=10, pady=10)
             
             download_title = ctk.CTkLabel(download_frame, text="⬇️ Download Speed", 
-                                        font=ctk.CTkFont(size=14, weight="bold"))
+                                        font=self._font(14, "bold"))
             download_title.pack(pady=(10, 5))
             
             download_info = results['download_speed']
@@ -5062,7 +5309,7 @@ Follow these steps one at a time. If a step resolves the issue, you don't need t
 🔬 Method: {download_info['test_method']}"""
             
             download_label = ctk.CTkLabel(download_frame, text=download_text, 
-                                        font=ctk.CTkFont(size=12, weight="bold"), 
+                                        font=self._font(12, "bold"), 
                                         justify="left", text_color=download_color)
             download_label.pack(pady=(5, 15))
             
@@ -5071,7 +5318,7 @@ Follow these steps one at a time. If a step resolves the issue, you don't need t
             upload_frame.pack(fill="x", padx=10, pady=10)
             
             upload_title = ctk.CTkLabel(upload_frame, text="⬆️ Upload Speed", 
-                                      font=ctk.CTkFont(size=14, weight="bold"))
+                                      font=self._font(14, "bold"))
             upload_title.pack(pady=(10, 5))
             
             upload_info = results['upload_speed']
@@ -5082,7 +5329,7 @@ Follow these steps one at a time. If a step resolves the issue, you don't need t
 🔬 Method: {upload_info['test_method']}"""
             
             upload_label = ctk.CTkLabel(upload_frame, text=upload_text, 
-                                      font=ctk.CTkFont(size=12, weight="bold"), 
+                                      font=self._font(12, "bold"), 
                                       justify="left", text_color=upload_color)
             upload_label.pack(pady=(5, 15))
             
@@ -5091,7 +5338,7 @@ Follow these steps one at a time. If a step resolves the issue, you don't need t
             assessment_frame.pack(fill="x", padx=10, pady=20)
             
             assessment_title = ctk.CTkLabel(assessment_frame, text="📋 Overall Assessment", 
-                                          font=ctk.CTkFont(size=16, weight="bold"))
+                                          font=self._font(16, "bold"))
             assessment_title.pack(pady=(10, 5))
             
             # Calculate overall score
@@ -5114,13 +5361,13 @@ Follow these steps one at a time. If a step resolves the issue, you don't need t
 • Upload speed is suitable for: {'Video calls, live streaming' if upload_speed > 20 else 'Video calls, file sharing' if upload_speed > 10 else 'Basic video calls' if upload_speed > 5 else 'Limited upload activities'}"""
             
             assessment_label = ctk.CTkLabel(assessment_frame, text=assessment_text, 
-                                          font=ctk.CTkFont(size=11), justify="left")
+                                          font=self._font(11), justify="left")
             assessment_label.pack(pady=(5, 15))
             
             # Close button
             close_button = ctk.CTkButton(main_frame, text="✅ Close Results", 
                                        command=self.enhanced_speed_window.destroy,
-                                       fg_color="#4A9EFF", hover_color="#3A8EFF")
+                                       **self.ACCENT_BUTTON_STYLE)
             close_button.pack(pady=20)
         else:
             self.enhanced_speed_window.focus()
@@ -5136,7 +5383,7 @@ Follow these steps one at a time. If a step resolves the issue, you don't need t
         self.set_window_icon(error_window)
         
         ctk.CTkLabel(error_window, text="❌ ERRORE", 
-                    font=ctk.CTkFont(size=16, weight="bold")).pack(pady=10)
+                    font=self._font(16, "bold")).pack(pady=10)
         ctk.CTkLabel(error_window, text=message, wraplength=350).pack(pady=10)
         ctk.CTkButton(error_window, text="OK", command=error_window.destroy).pack(pady=10)
 
@@ -5257,7 +5504,7 @@ Follow these steps one at a time. If a step resolves the issue, you don't need t
             
             # Titolo
             title = ctk.CTkLabel(main_frame, text="🔗 TEST CONNESSIONE COMPLETO", 
-                                font=ctk.CTkFont(size=18, weight="bold"))
+                                font=self._font(18, "bold"))
             title.pack(pady=(10, 20))
             
             # Informazioni di rete
@@ -5266,7 +5513,7 @@ Follow these steps one at a time. If a step resolves the issue, you don't need t
                 network_frame.pack(fill="x", padx=10, pady=5)
                 
                 ctk.CTkLabel(network_frame, text="📡 INFORMAZIONI RETE", 
-                            font=ctk.CTkFont(size=14, weight="bold")).pack(pady=5)
+                            font=self._font(14, "bold")).pack(pady=5)
                 
                 for key, value in results["network_info"].items():
                     if value and value != "Sconosciuto":
@@ -5277,7 +5524,7 @@ Follow these steps one at a time. If a step resolves the issue, you don't need t
             tests_frame.pack(fill="x", padx=10, pady=10)
             
             ctk.CTkLabel(tests_frame, text="🧪 RISULTATI TEST", 
-                        font=ctk.CTkFont(size=14, weight="bold")).pack(pady=5)
+                        font=self._font(14, "bold")).pack(pady=5)
             
             # DNS Test
             dns_color = "#33FF57" if results["dns"]["status"] else "#FF5733"
@@ -5303,7 +5550,7 @@ Follow these steps one at a time. If a step resolves the issue, you don't need t
             overall_text = "✅ TUTTI I TEST SUPERATI" if all_tests_passed else "⚠️ ALCUNI TEST FALLITI"
             
             overall_label = ctk.CTkLabel(main_frame, text=overall_text, 
-                                        font=ctk.CTkFont(size=16, weight="bold"),
+                                        font=self._font(16, "bold"),
                                         text_color=overall_color)
             overall_label.pack(pady=20)
             
@@ -5324,9 +5571,6 @@ Follow these steps one at a time. If a step resolves the issue, you don't need t
             self.user_input_entry.configure(state="disabled")
             self.send_button.configure(state="disabled")
         self.assistant_chat_box.configure(state="disabled")
-        # Initialize conversation history only if it doesn't already exist
-        if not hasattr(self, 'conversation_history'):
-            self.conversation_history = []
 
     def restore_assistant_chat(self):
         """Restore conversation history in the chat."""
@@ -5376,8 +5620,7 @@ Follow these steps one at a time. If a step resolves the issue, you don't need t
         
         self.conversation_history.append({"role": "user", "content": user_text})
 
-        thread = threading.Thread(target=self.get_ai_response)
-        thread.start()
+        self._submit_task(self.get_ai_response)
 
     def update_chat_stream(self, chunk):
         """Thread-safe method to update chatbox with a piece of text."""
@@ -5393,8 +5636,8 @@ Follow these steps one at a time. If a step resolves the issue, you don't need t
         # Controlla se c'è una navigazione in attesa di conferma
         if self.pending_navigation:
             if "si" in user_message or "yes" in user_message or "ok" in user_message:
-                # Conferma la navigazione
-                self.select_frame_by_name(self.pending_navigation)
+                # Conferma la navigazione (sul thread di Tk: il frame può dover essere costruito)
+                self.after(0, self.select_frame_by_name, self.pending_navigation)
                 
                 # Specific confirmation message for each section
                 if self.pending_navigation == "hardware_monitor":
@@ -5403,8 +5646,6 @@ Follow these steps one at a time. If a step resolves the issue, you don't need t
                     self.add_assistant_message("🧹 Perfect! I've taken you to the Disk Cleanup section to clean temporary files and free up space!")
                 elif self.pending_navigation == "ram_optimizer":
                     self.add_assistant_message("⚡ Perfect! I've taken you to the RAM Optimization section to optimize memory!")
-                elif self.pending_navigation == "startup_manager":
-                    self.add_assistant_message("🚀 Perfect! I've taken you to the Startup Management section to manage startup programs!")
                 elif self.pending_navigation == "network_manager":
                     self.add_assistant_message("🌐 Perfect! I've taken you to the Network Management section to manage network connections!")
                 elif self.pending_navigation == "sandbox":
@@ -5560,13 +5801,6 @@ Always provide comprehensive analysis and actionable solutions. Be the expert th
         ]):
             return "ram_optimizer"
         
-        # Startup Management commands
-        if any(word in user_message for word in [
-            'startup', 'boot', 'startup programs', 'boot programs',
-            'startup management', 'disable startup', 'enable startup'
-        ]):
-            return "startup_manager"
-        
         # Security Sandbox commands
         if any(word in user_message for word in [
             'sandbox', 'security', 'safe', 'safely', 'isolated', 'isolation',
@@ -5628,7 +5862,7 @@ Always provide comprehensive analysis and actionable solutions. Be the expert th
             return 'gemma3:1b'
             
         except Exception as e:
-            logging.error(f"Errore nel recupero dei modelli: {e}")
+            logging.error("Errore nel recupero dei modelli: %s", e)
             return 'gemma3:1b'  # Modello di fallback
 
     def _execute_navigation(self, command):
@@ -5652,12 +5886,6 @@ Always provide comprehensive analysis and actionable solutions. Be the expert th
                 # Salva il comando in attesa di conferma
                 self.pending_navigation = "ram_optimizer"
             
-            elif command == "startup_manager":
-                # Richiedi conferma per startup management
-                self.add_assistant_message("🚀 Would you like me to take you to the Startup Management section to manage startup programs?\n\nReply 'yes' or 'no' to confirm.")
-                # Salva il comando in attesa di conferma
-                self.pending_navigation = "startup_manager"
-            
             elif command == "network_manager":
                 # Richiedi conferma per network management
                 self.add_assistant_message("🌐 I can help you with network troubleshooting! Would you like me to take you to the **Network Management** section?\n\n**Available tools:**\n• Connection speed tests and ping diagnostics\n• Network adapter configuration analysis\n• WiFi signal strength and interference detection\n• DNS and gateway connectivity testing\n\nReply 'yes' or 'no' to confirm.")
@@ -5671,7 +5899,7 @@ Always provide comprehensive analysis and actionable solutions. Be the expert th
                 self.pending_navigation = "sandbox"
                 
         except Exception as e:
-            logging.error(f"Errore durante la navigazione automatica: {e}")
+            logging.error("Errore durante la navigazione automatica: %s", e)
 
     def check_ollama_status(self):
         """Check if Ollama is running and update the status."""
@@ -5696,8 +5924,7 @@ Always provide comprehensive analysis and actionable solutions. Be the expert th
             # Aggiorna l'etichetta di stato se esiste
             if hasattr(self, 'ollama_status_label'):
                 self.ollama_status_label.configure(text="❌ Ollama Not Installed", text_color="#DC3545")
-            import logging
-            logging.error(f"Error checking Ollama status: {e}")
+            logging.error("Error checking Ollama status: %s", e)
 
     def select_sandboxed_file(self):
         filetypes = (
@@ -5924,7 +6151,7 @@ Always provide comprehensive analysis and actionable solutions. Be the expert th
             
             # Titolo
             title_label = ctk.CTkLabel(main_frame, text="🛡️ COMPLETE SECURITY SANDBOX GUIDE", 
-                                      font=ctk.CTkFont(size=18, weight="bold"))
+                                      font=self._font(18, "bold"))
             title_label.pack(pady=(10, 20))
             
             # Scrollable frame semplice
@@ -6042,7 +6269,7 @@ If you have apps installed on your PC that are not automatically detected:
             
             # Main content directly in the scroll frame
             ctk.CTkLabel(scroll_frame, text=guide_text, 
-                        font=ctk.CTkFont(size=12),
+                        font=self._font(12),
                         justify="left",
                         wraplength=550).pack(pady=10, padx=10)
             
@@ -6067,7 +6294,8 @@ If you have apps installed on your PC that are not automatically detected:
         self.sandbox_output_console.insert("end", f"Starting: {self.sandboxed_file_path}\n---\n")
         self.sandbox_output_console.configure(state="disabled")
 
-        # Start execution in a separate thread
+        # Start execution in a dedicated thread: it lasts as long as the
+        # sandboxed program and must not hold a pool worker
         thread = threading.Thread(target=self.execute_sandboxed_process)
         thread.start()
 
@@ -6232,8 +6460,7 @@ If you have apps installed on your PC that are not automatically detected:
 
         self.append_to_sandbox_console("\n---\nAvvio scansione VirusTotal dei file nella sandbox...\n")
 
-        thread = threading.Thread(target=self.perform_virustotal_scan, args=(api_key,))
-        thread.start()
+        self._submit_task(self.perform_virustotal_scan, api_key)
 
     def perform_virustotal_scan(self, api_key):
         try:
@@ -6358,35 +6585,43 @@ If you have apps installed on your PC that are not automatically detected:
             self.show_error_popup("❌ Save Error", error_message)
 
     def get_file_sha256(self, filepath):
-        sha256_hash = hashlib.sha256()
-        with open(filepath, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+        """SHA-256 of a file, read in 1 MiB blocks and memoized by (path, size, mtime)."""
+        stat = os.stat(filepath)
+        key = (filepath, stat.st_size, stat.st_mtime_ns)
+        digest = self._digest_cache.get(key)
+        if digest is None:
+            sha256_hash = hashlib.sha256()
+            buffer = memoryview(bytearray(1 << 20))
+            with open(filepath, "rb", buffering=0) as f:
+                while n := f.readinto(buffer):
+                    sha256_hash.update(buffer[:n])
+            digest = self._digest_cache[key] = sha256_hash.hexdigest()
+        return digest
 
     def query_virustotal(self, file_hash, api_key):
         url = f"https://www.virustotal.com/api/v3/files/{file_hash}"
-        headers = {"x-apikey": api_key}
-        try:
-            response = requests.get(url, headers=headers, timeout=20)
-
-            if response.status_code == 200:
-                data = response.json().get('data', {}).get('attributes', {})
-                stats = data.get('last_analysis_stats', {})
-                malicious = stats.get('malicious', 0)
-                suspicious = stats.get('suspicious', 0)
-                total = sum(stats.values())
-                if malicious > 0 or suspicious > 0:
-                    return f"RISULTATO: Rilevato come dannoso/sospetto da {malicious + suspicious}/{total} motori."
-                else:
-                    return "RISULTATO: Nessuna minaccia rilevata."
-            elif response.status_code == 404:
+        request = urllib_request.Request(url, headers={"x-apikey": api_key})
+        try:
+            with urllib_request.urlopen(request, timeout=20) as response:
+                data = json.loads(response.read()).get('data', {}).get('attributes', {})
+        except urllib_request.HTTPError as e:
+            if e.code == 404:
                 return "RESULT: File not found in VirusTotal database."
-            else:
-                return f"RISULTATO: Errore dall'API di VirusTotal (Codice: {response.status_code}). Dettagli: {response.text}"
-        except requests.RequestException as e:
+            details = e.read().decode('utf-8', errors='replace')
+            return f"RISULTATO: Errore dall'API di VirusTotal (Codice: {e.code}). Dettagli: {details}"
+        except (OSError, ValueError) as e:
+            # URLError e timeout sono OSError, una risposta non JSON è ValueError
             return f"RISULTATO: Errore di connessione a VirusTotal: {e}"
 
+        stats = data.get('last_analysis_stats', {})
+        malicious = stats.get('malicious', 0)
+        suspicious = stats.get('suspicious', 0)
+        total = sum(stats.values())
+        if malicious > 0 or suspicious > 0:
+            return f"RISULTATO: Rilevato come dannoso/sospetto da {malicious + suspicious}/{total} motori."
+        else:
+            return "RISULTATO: Nessuna minaccia rilevata."
+
     def load_api_key(self):
         config = configparser.ConfigParser()
         config_path = 'config.ini'
@@ -6724,7 +6959,7 @@ If you have apps installed on your PC that are not automatically detected:
                         command=self.launch_hwinfo64,
                         fg_color="#00AA00",
                         hover_color="#008800",
-                        font=ctk.CTkFont(size=12, weight="bold")
+                        font=self._font(12, "bold")
                     )
                     self.launch_hwinfo_button.pack(side="left", padx=5, pady=5)
                     
@@ -6735,7 +6970,7 @@ If you have apps installed on your PC that are not automatically detected:
                         command=self._open_hwinfo64_folder,
                         fg_color="#E74C3C",
                         hover_color="#C0392B",
-                        font=ctk.CTkFont(size=12)
+                        font=self._font(12)
                     )
                     self.open_hwinfo_folder_button.pack(side="left", padx=5, pady=5)
                     
@@ -6748,7 +6983,7 @@ If you have apps installed on your PC that are not automatically detected:
                         command=self.show_hwinfo64_install_options,
                         fg_color="#FF6B35",
                         hover_color="#E55A2B",
-                        font=ctk.CTkFont(size=12, weight="bold")
+                        font=self._font(12, "bold")
                     )
                     self.download_hwinfo_button.pack(side="left", padx=5, pady=5)
                     
@@ -6759,7 +6994,7 @@ If you have apps installed on your PC that are not automatically detected:
                         command=self._visit_hwinfo_website,
                         fg_color="#E74C3C",
                         hover_color="#C0392B",
-                        font=ctk.CTkFont(size=12)
+                        font=self._font(12)
                     )
                     self.visit_hwinfo_website_button.pack(side="left", padx=5, pady=5)
                     
@@ -6797,7 +7032,7 @@ If you have apps installed on your PC that are not automatically detected:
         try:
             # Inizializza il COM per questo thread
             pythoncom.CoInitialize()
-            shell = Dispatch("WScript.Shell")
+            shell = win32com_client.Dispatch("WScript.Shell")
             shortcut = shell.CreateShortCut(path)
             target_path = shortcut.TargetPath
             return target_path
@@ -7271,8 +7506,7 @@ If you have apps installed on your PC that are not automatically detected:
 
     def _is_hwinfo64_running(self):
         """Check if HWiNFO64 is already running."""
-        try:
-            import psutil
+        if psutil is not None:
             for proc in psutil.process_iter(['pid', 'name']):
                 try:
                     if 'hwinfo' in proc.info['name'].lower():
@@ -7280,14 +7514,14 @@ If you have apps installed on your PC that are not automatically detected:
                 except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                     pass
             return False
-        except ImportError:
-            # Fallback method without psutil
-            try:
-                result = subprocess.run(['tasklist', '/FI', 'IMAGENAME eq HWiNFO64.exe'], 
-                                      capture_output=True, text=True, timeout=5)
-                return 'HWiNFO64.exe' in result.stdout
-            except:
-                return False
+        # Fallback method without psutil
+        try:
+            result = subprocess.run(['tasklist', '/FI', 'IMAGENAME eq HWiNFO64.exe'], 
+                                  stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, timeout=5,
+                                  creationflags=subprocess.CREATE_NO_WINDOW)
+            return 'HWiNFO64.exe' in result.stdout
+        except:
+            return False
 
     def _bring_hwinfo64_to_front(self):
         """Bring HWiNFO64 window to front if it's already running."""
@@ -7490,7 +7724,7 @@ If you have apps installed on your PC that are not automatically detected:
                         command=self.launch_hwinfo64,
                         fg_color="#00AA00",
                         hover_color="#008800",
-                        font=ctk.CTkFont(size=12, weight="bold")
+                        font=self._font(12, "bold")
                     )
                     self.launch_hwinfo_button.pack(side="left", padx=5, pady=5)
                     
@@ -7501,7 +7735,7 @@ If you have apps installed on your PC that are not automatically detected:
                         command=self._open_tools_folder,
                         fg_color="#E74C3C",
                         hover_color="#C0392B",
-                        font=ctk.CTkFont(size=12)
+                        font=self._font(12)
                     )
                     self.open_tools_folder_button.pack(side="left", padx=5, pady=5)
                     
@@ -7514,7 +7748,7 @@ If you have apps installed on your PC that are not automatically detected:
                         command=self.show_hwinfo64_install_options,
                         fg_color="#FF6B35",
                         hover_color="#E55A2B",
-                        font=ctk.CTkFont(size=12, weight="bold")
+                        font=self._font(12, "bold")
                     )
                     self.download_hwinfo_button.pack(side="left", padx=5, pady=5)
                     
@@ -7525,7 +7759,7 @@ If you have apps installed on your PC that are not automatically detected:
                         command=self._visit_hwinfo_website,
                         fg_color="#E74C3C",
                         hover_color="#C0392B",
-                        font=ctk.CTkFont(size=12)
+                        font=self._font(12)
                     )
                     self.visit_hwinfo_website_button.pack(side="left", padx=5, pady=5)
                     
@@ -7562,7 +7796,7 @@ If you have apps installed on your PC that are not automatically detected:
                         command=self.launch_cpuz,
                         fg_color="#00AA00",
                         hover_color="#008800",
-                        font=ctk.CTkFont(size=12, weight="bold")
+                        font=self._font(12, "bold")
                     )
                     self.launch_cpuz_button.pack(side="left", padx=5, pady=5)
                     
@@ -7573,7 +7807,7 @@ If you have apps installed on your PC that are not automatically detected:
                         command=self._open_tools_folder,
                         fg_color="#E74C3C",
                         hover_color="#C0392B",
-                        font=ctk.CTkFont(size=12)
+                        font=self._font(12)
                     )
                     self.open_tools_folder_button.pack(side="left", padx=5, pady=5)
                     
@@ -7586,7 +7820,7 @@ If you have apps installed on your PC that are not automatically detected:
                         command=self.show_cpuz_install_options,
                         fg_color="#FF6B35",
                         hover_color="#E55A2B",
-                        font=ctk.CTkFont(size=12, weight="bold")
+                        font=self._font(12, "bold")
                     )
                     self.download_cpuz_button.pack(side="left", padx=5, pady=5)
                     
@@ -7597,7 +7831,7 @@ If you have apps installed on your PC that are not automatically detected:
                         command=self._visit_cpuz_website,
                         fg_color="#E74C3C",
                         hover_color="#C0392B",
-                        font=ctk.CTkFont(size=12)
+                        font=self._font(12)
                     )
                     self.visit_cpuz_website_button.pack(side="left", padx=5, pady=5)
                     
@@ -7634,7 +7868,7 @@ If you have apps installed on your PC that are not automatically detected:
                         command=self.launch_fancontrol,
                         fg_color="#00AA00",
                         hover_color="#008800",
-                        font=ctk.CTkFont(size=12, weight="bold")
+                        font=self._font(12, "bold")
                     )
                     self.launch_fancontrol_button.pack(side="left", padx=5, pady=5)
                     
@@ -7645,7 +7879,7 @@ If you have apps installed on your PC that are not automatically detected:
                         command=self._open_tools_folder,
                         fg_color="#E74C3C",
                         hover_color="#C0392B",
-                        font=ctk.CTkFont(size=12)
+                        font=self._font(12)
                     )
                     self.open_tools_folder_button.pack(side="left", padx=5, pady=5)
                     
@@ -7658,7 +7892,7 @@ If you have apps installed on your PC that are not automatically detected:
                         command=self.show_fancontrol_install_options,
                         fg_color=self.settings['accent_color'],
                         hover_color=self._darken_color(self.settings['accent_color'], 0.1),
-                        font=ctk.CTkFont(size=12, weight="bold")
+                        font=self._font(12, "bold")
                     )
                     self.download_fancontrol_button.pack(side="left", padx=5, pady=5)
                     
@@ -7669,7 +7903,7 @@ If you have apps installed on your PC that are not automatically detected:
                         command=self._visit_fancontrol_website,
                         fg_color="#E74C3C",
                         hover_color="#C0392B",
-                        font=ctk.CTkFont(size=12)
+                        font=self._font(12)
                     )
                     self.visit_fancontrol_website_button.pack(side="left", padx=5, pady=5)
                     
@@ -7816,7 +8050,7 @@ If you have apps installed on your PC that are not automatically detected:
                     self.after(0, self.hide_loading_indicator)
             
             # Start the async checking
-            threading.Thread(target=check_tools_async, daemon=True).start()
+            self._start_daemon_task(check_tools_async)
             
         except Exception as e:
             self.log_debug(f"Error in complete initial update: {e}")
@@ -7975,7 +8209,7 @@ If you have apps installed on your PC that are not automatically detected:
                         app_icon_label = ctk.CTkLabel(
                             loading_frame,
                             text="🖥️",
-                            font=ctk.CTkFont(size=24),
+                            font=self._font(24),
                             text_color=self.settings['accent_color']  # Use custom accent color
                         )
                         app_icon_label.pack(pady=(15, 5))
@@ -7986,7 +8220,7 @@ If you have apps installed on your PC that are not automatically detected:
                     app_icon_label = ctk.CTkLabel(
                         loading_frame,
                         text="🖥️",
-                        font=ctk.CTkFont(size=24),
+                        font=self._font(24),
                         text_color=self.settings['accent_color']  # Use custom accent color
                     )
                     app_icon_label.pack(pady=(15, 5))
@@ -7996,7 +8230,7 @@ If you have apps installed on your PC that are not automatically detected:
                 self.loading_label = ctk.CTkLabel(
                     loading_frame,
                     text=message,
-                    font=ctk.CTkFont(size=14, weight="bold"),
+                    font=self._font(14, "bold"),
                     text_color=self.settings['accent_color']  # Use custom accent color
                 )
                 self.loading_label.pack(pady=(5, 15))
@@ -8410,13 +8644,13 @@ Vuoi che apra la pagina di download di HWiNFO64?"""
             popup.geometry(f"450x150+{x}+{y}")
             
             # Add content with icon and message
-            icon_label = ctk.CTkLabel(popup, text="🎉", font=ctk.CTkFont(size=24))
+            icon_label = ctk.CTkLabel(popup, text="🎉", font=self._font(24))
             icon_label.pack(pady=(15,5))
             
-            message_label = ctk.CTkLabel(popup, text=message, font=ctk.CTkFont(size=16, weight="bold"), wraplength=400)
+            message_label = ctk.CTkLabel(popup, text=message, font=self._font(16, "bold"), wraplength=400)
             message_label.pack(pady=5)
             
-            info_label = ctk.CTkLabel(popup, text="Interface updated automatically", font=ctk.CTkFont(size=12), text_color="gray")
+            info_label = ctk.CTkLabel(popup, text="Interface updated automatically", font=self._font(12), text_color="gray")
             info_label.pack(pady=5)
             
             # Auto-close after 3 seconds
@@ -8572,7 +8806,7 @@ If you encounter issues:
         text_frame = ctk.CTkFrame(guide_window)
         text_frame.pack(fill="both", expand=True, padx=20, pady=20)
         
-        text_widget = ctk.CTkTextbox(text_frame, wrap="word", font=ctk.CTkFont(size=12))
+        text_widget = ctk.CTkTextbox(text_frame, wrap="word", font=self._font(12))
         text_widget.pack(fill="both", expand=True, padx=10, pady=10)
         
         # Insert the guide text
@@ -8624,7 +8858,7 @@ If you encounter issues:
             title_label = ctk.CTkLabel(
                 main_frame,
                 text=f"🔍 {app_name} Not Found",
-                font=ctk.CTkFont(size=20, weight="bold")
+                font=self._font(20, "bold")
             )
             title_label.pack(pady=20)
             
@@ -8672,7 +8906,7 @@ If you encounter issues:
             desc_label = ctk.CTkLabel(
                 scroll_frame,
                 text=desc_text,
-                font=ctk.CTkFont(size=12),
+                font=self._font(12),
                 justify="left",
                 wraplength=550
             )
@@ -8690,7 +8924,7 @@ If you encounter issues:
                     command=lambda: [webbrowser.open_new_tab(download_url), guide_window.destroy()],
                     width=200,
                     height=40,
-                    font=ctk.CTkFont(size=14, weight="bold"),
+                    font=self._font(14, "bold"),
                     fg_color="#00AA00",
                     hover_color="#008800"
                 )
@@ -8704,7 +8938,7 @@ If you encounter issues:
                     command=lambda: [webbrowser.open_new_tab(website_url), guide_window.destroy()],
                     width=200,
                     height=40,
-                    font=ctk.CTkFont(size=14, weight="bold"),
+                    font=self._font(14, "bold"),
                     fg_color="#E74C3C",
                     hover_color="#C0392B"
                 )
@@ -8717,7 +8951,7 @@ If you encounter issues:
                 command=lambda: [self._open_tools_folder(), guide_window.destroy()],
                 width=250,
                 height=40,
-                font=ctk.CTkFont(size=14, weight="bold"),
+                font=self._font(14, "bold"),
                 fg_color="#FF6B35",
                 hover_color="#E55A2B"
             )
@@ -8733,7 +8967,7 @@ If you encounter issues:
                 command=guide_window.destroy,
                 width=200,
                 height=40,
-                font=ctk.CTkFont(size=14)
+                font=self._font(14)
             )
             close_button.pack(pady=10)
             
@@ -8757,6 +8991,7 @@ If you encounter issues:
                 try:
                     # Try to reinitialize the hardware monitor
                     # UniversalHardwareMonitor class is defined inline above
+                    self.hardware_monitor.shutdown()
                     self.hardware_monitor = UniversalHardwareMonitor()
                     self.detected_sensors = self.hardware_monitor.detect_all_sensors()
                     self.log_debug(f"Hardware monitor refreshed. Detected {len(self.detected_sensors)} sensors")
@@ -8769,7 +9004,7 @@ If you encounter issues:
             self.show_info_popup("Hardware Monitor Refreshed", "Hardware monitor has been refreshed. Temperatures should now update correctly.")
             
         except Exception as e:
-            logging.error(f"Error refreshing hardware monitor: {e}")
+            logging.error("Error refreshing hardware monitor: %s", e)
             self.show_error_popup("Refresh Error", f"Failed to refresh hardware monitor: {e}")
 
     def debug_hardware_monitor(self):
@@ -8792,7 +9027,8 @@ If you encounter issues:
             
             # Step 1: Check PATH
             try:
-                subprocess.run(["HWiNFO64", "--version"], capture_output=True, timeout=5)
+                subprocess.run(["HWiNFO64", "--version"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                               timeout=5, creationflags=subprocess.CREATE_NO_WINDOW)
                 detection_steps.append("✅ Found in PATH")
             except (subprocess.TimeoutExpired, FileNotFoundError):
                 detection_steps.append("❌ Not found in PATH")
@@ -8828,7 +9064,7 @@ If you encounter issues:
             status_text = f"""
 🔍 HARDWARE MONITOR DEBUG INFO:
 
-✅ Hardware Monitor Created: {self.hardware_monitor_created}
+✅ Hardware Monitor Created: {"hardware_monitor" in self._frames_built}
 ✅ Hardware Monitor Object: {self.hardware_monitor is not None}
 ✅ Detected Sensors: {len(self.detected_sensors) if hasattr(self, 'detected_sensors') else 'N/A'}
 ✅ Admin Privileges: {self.has_admin_privileges}
@@ -9011,9 +9247,9 @@ If you encounter issues:
         try:
             import ctypes
             self.has_admin_privileges = ctypes.windll.shell32.IsUserAnAdmin()
-            logging.info(f"Admin privileges: {self.has_admin_privileges}")
+            logging.info("Admin privileges: %s", self.has_admin_privileges)
         except Exception as e:
-            logging.error(f"Error checking admin status: {e}")
+            logging.error("Error checking admin status: %s", e)
             self.has_admin_privileges = False
 
     def _request_admin_privileges(self):
@@ -9046,9 +9282,9 @@ If you encounter issues:
             import ctypes
             self.has_admin_privileges = ctypes.windll.shell32.IsUserAnAdmin()
             # Nessun messaggio all'utente - l'app funziona sempre
-            logging.info(f"Admin privileges detected: {self.has_admin_privileges}")
+            logging.info("Admin privileges detected: %s", self.has_admin_privileges)
         except Exception as e:
-            logging.error(f"Error checking admin privileges: {e}")
+            logging.error("Error checking admin privileges: %s", e)
             self.has_admin_privileges = False
 
     def _check_admin_and_warn(self):
@@ -9076,7 +9312,7 @@ If you encounter issues:
                     )
                     
         except Exception as e:
-            logging.error(f"Error checking admin privileges: {e}")
+            logging.error("Error checking admin privileges: %s", e)
 
     def _create_credits_sections(self):
         """Create credit sections for all external applications."""
@@ -9225,7 +9461,7 @@ If you encounter issues:
         thanks_title = ctk.CTkLabel(
             thanks_frame,
             text="🙏 Special Thanks",
-            font=ctk.CTkFont(size=20, weight="bold"),
+            font=self._font(20, "bold"),
             text_color="#FFFFFF"
         )
         thanks_title.pack(pady=(20, 15))
@@ -9234,7 +9470,7 @@ If you encounter issues:
         thanks_message = ctk.CTkLabel(
             thanks_frame,
             text="Special thanks to all developers and the open source community who made this project possible.",
-            font=ctk.CTkFont(size=15),
+            font=self._font(15),
             text_color="#CCCCCC",
             justify="center",
             wraplength=600
@@ -9245,7 +9481,7 @@ If you encounter issues:
         disclaimer = ctk.CTkLabel(
             thanks_frame,
             text="⚠️ Disclaimer: All rights to external applications belong to their respective owners. PC Tool Manager is only an integration interface and does not replace the original software.",
-            font=ctk.CTkFont(size=12),
+            font=self._font(12),
             text_color="#AAAAAA",
             justify="center",
             wraplength=600
@@ -9532,7 +9768,7 @@ ollama pull phi3:latest    # Balanced model
         title_label = ctk.CTkLabel(
             guide_frame,
             text=title,
-            font=ctk.CTkFont(size=20, weight="bold"),
+            font=self._font(20, "bold"),
             text_color=color
         )
         title_label.pack(pady=(15, 5))
@@ -9541,7 +9777,7 @@ ollama pull phi3:latest    # Balanced model
         subtitle_label = ctk.CTkLabel(
             guide_frame,
             text=subtitle,
-            font=ctk.CTkFont(size=16),
+            font=self._font(16),
             text_color="#888888"
         )
         subtitle_label.pack(pady=(0, 15))
@@ -9550,7 +9786,7 @@ ollama pull phi3:latest    # Balanced model
         content_label = ctk.CTkLabel(
             guide_frame,
             text=content,
-            font=ctk.CTkFont(size=14),
+            font=self._font(14),
             text_color="#FFFFFF",
             wraplength=800,
             justify="left"
@@ -9572,7 +9808,7 @@ ollama pull phi3:latest    # Balanced model
         title_label = ctk.CTkLabel(
             credit_frame,
             text=title,
-            font=ctk.CTkFont(size=20, weight="bold"),
+            font=self._font(20, "bold"),
             text_color=color
         )
         title_label.pack(pady=(15, 5))
@@ -9581,7 +9817,7 @@ ollama pull phi3:latest    # Balanced model
         subtitle_label = ctk.CTkLabel(
             credit_frame,
             text=subtitle,
-            font=ctk.CTkFont(size=16),
+            font=self._font(16),
             text_color="#DDDDDD"
         )
         subtitle_label.pack(pady=(0, 10))
@@ -9593,7 +9829,7 @@ ollama pull phi3:latest    # Balanced model
         developer_label = ctk.CTkLabel(
             developer_frame,
             text=f"👨‍💻 Developer: {developer}",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._font(14, "bold"),
             text_color="#FFFFFF"
         )
         developer_label.pack(side="left")
@@ -9605,7 +9841,7 @@ ollama pull phi3:latest    # Balanced model
             command=lambda: self._open_website(website),
             width=140,
             height=30,
-            font=ctk.CTkFont(size=12),
+            font=self._font(12),
             fg_color="#E74C3C",
             hover_color="#C0392B"
         )
@@ -9615,7 +9851,7 @@ ollama pull phi3:latest    # Balanced model
         desc_label = ctk.CTkLabel(
             credit_frame,
             text=description,
-            font=ctk.CTkFont(size=13),
+            font=self._font(13),
             text_color="#CCCCCC",
             wraplength=600,
             justify="left"
@@ -9629,10 +9865,9 @@ ollama pull phi3:latest    # Balanced model
     def _open_website(self, url):
         """Open website in default browser."""
         try:
-            import webbrowser
             webbrowser.open(url)
         except Exception as e:
-            logging.error(f"Error opening website {url}: {e}")
+            logging.error("Error opening website %s: %s", url, e)
 
     def _create_settings_widgets(self):
         """Create all settings widgets"""
@@ -9640,7 +9875,7 @@ ollama pull phi3:latest    # Balanced model
         self.settings_title = ctk.CTkLabel(
             self.settings_scrollable_frame,
             text="⚙️ Settings",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=self._font(24, "bold")
         )
         self.settings_title.pack(pady=(0, 30))
         
@@ -9648,7 +9883,7 @@ ollama pull phi3:latest    # Balanced model
         self.theme_label = ctk.CTkLabel(
             self.settings_scrollable_frame,
             text="Theme:",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._font(16, "bold")
         )
         self.theme_label.pack(pady=(0, 10), anchor="w")
         
@@ -9666,7 +9901,7 @@ ollama pull phi3:latest    # Balanced model
         self.color_label = ctk.CTkLabel(
             self.settings_scrollable_frame,
             text="Accent Color:",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._font(16, "bold")
         )
         self.color_label.pack(pady=(0, 10), anchor="w")
         
@@ -9719,7 +9954,7 @@ ollama pull phi3:latest    # Balanced model
         self.font_label = ctk.CTkLabel(
             self.settings_scrollable_frame,
             text="Font:",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._font(16, "bold")
         )
         self.font_label.pack(pady=(0, 10), anchor="w")
         
@@ -9737,7 +9972,7 @@ ollama pull phi3:latest    # Balanced model
         self.font_size_label = ctk.CTkLabel(
             self.settings_scrollable_frame,
             text="Font Size:",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._font(16, "bold")
         )
         self.font_size_label.pack(pady=(0, 10), anchor="w")
         
@@ -9779,7 +10014,7 @@ ollama pull phi3:latest    # Balanced model
         self.preview_label = ctk.CTkLabel(
             self.settings_scrollable_frame,
             text="Preview:",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._font(16, "bold")
         )
         self.preview_label.pack(pady=(30, 10), anchor="w")
         
@@ -9789,7 +10024,7 @@ ollama pull phi3:latest    # Balanced model
         self.preview_text = ctk.CTkLabel(
             self.preview_frame,
             text="This is how your text will look with the current settings.",
-            font=ctk.CTkFont(family=self.settings['font_family'], size=self.settings['font_size'])
+            font=self._font(self.settings['font_size'], family=self.settings['font_family'])
         )
         self.preview_text.pack(padx=20, pady=20)
 
@@ -9801,7 +10036,7 @@ ollama pull phi3:latest    # Balanced model
             if color[1]:  # If a color was selected
                 self._set_color(color[1])
         except Exception as e:
-            logging.error(f"Error opening color chooser: {e}")
+            logging.error("Error opening color chooser: %s", e)
 
     def _set_color(self, color):
         """Set the accent color"""
@@ -9828,13 +10063,10 @@ ollama pull phi3:latest    # Balanced model
         """Update the preview text with current settings"""
         try:
             self.preview_text.configure(
-                font=ctk.CTkFont(
-                    family=self.settings['font_family'],
-                    size=self.settings['font_size']
-                )
+                font=self._font(self.settings['font_size'], family=self.settings['font_family'])
             )
         except Exception as e:
-            logging.error(f"Error updating preview: {e}")
+            logging.error("Error updating preview: %s", e)
 
     def _apply_settings(self):
         """Apply all settings"""
@@ -9843,6 +10075,8 @@ ollama pull phi3:latest    # Balanced model
             ctk.set_appearance_mode(self.settings['theme'])
             
             # Apply custom colors to existing widgets
+            self._custom_settings_applied = True
+            self._apply_theme()
             self._apply_custom_colors()
             
             # Apply custom fonts to existing widgets
@@ -9859,7 +10093,7 @@ ollama pull phi3:latest    # Balanced model
             self.show_info_popup("Settings Applied", "Settings have been applied successfully!")
             
         except Exception as e:
-            logging.error(f"Error applying settings: {e}")
+            logging.error("Error applying settings: %s", e)
             self.show_error_popup("Error", f"Failed to apply settings: {e}")
 
     def _force_apply_colors(self):
@@ -9893,12 +10127,12 @@ ollama pull phi3:latest    # Balanced model
                             button.configure(fg_color=accent_color)
                             hover_color = self._darken_color(accent_color, 0.1)
                             button.configure(hover_color=hover_color)
-                            logging.debug(f"Applied color to {button_name}")
+                            logging.debug("Applied color to %s", button_name)
                     except Exception as e:
-                        logging.debug(f"Could not force apply color to {button_name}: {e}")
+                        logging.debug("Could not force apply color to %s: %s", button_name, e)
                         
         except Exception as e:
-            logging.error(f"Error in force apply colors: {e}")
+            logging.error("Error in force apply colors: %s", e)
 
     def _force_apply_fonts(self):
         """Force apply fonts with more aggressive approach"""
@@ -9923,7 +10157,7 @@ ollama pull phi3:latest    # Balanced model
                 'guide_title'
             ]
             
-            custom_font_large = ctk.CTkFont(family=font_family, size=font_size + 4, weight="bold")
+            custom_font_large = self._font(font_size + 4, "bold", font_family)
             
             for label_name in important_labels:
                 if hasattr(self, label_name):
@@ -9931,12 +10165,12 @@ ollama pull phi3:latest    # Balanced model
                         label = getattr(self, label_name)
                         if label is not None:
                             label.configure(font=custom_font_large)
-                            logging.debug(f"Applied font to {label_name}")
+                            logging.debug("Applied font to %s", label_name)
                     except Exception as e:
-                        logging.debug(f"Could not force apply font to {label_name}: {e}")
+                        logging.debug("Could not force apply font to %s: %s", label_name, e)
                         
         except Exception as e:
-            logging.error(f"Error in force apply fonts: {e}")
+            logging.error("Error in force apply fonts: %s", e)
 
     def _apply_custom_colors(self):
         """Apply custom accent color to all relevant widgets"""
@@ -9995,20 +10229,25 @@ ollama pull phi3:latest    # Balanced model
                 # Security Sandbox buttons
                 'security_app_button',
                 'security_download_button',
-                'security_guide_button'
+                'security_guide_button',
+                'sandboxie_browse_button',
+                'sandbox_browse_button',
+                'sandbox_run_button',
+                'vt_save_key_button',
+                'vt_scan_button'
             ]
             
+            # Calculate hover color (slightly darker) once for all buttons
+            hover_color = self._darken_color(accent_color, 0.1)
+            
             for button_name in button_attributes:
                 if hasattr(self, button_name):
                     try:
                         button = getattr(self, button_name)
                         if button is not None:
-                            button.configure(fg_color=accent_color)
-                            # Calculate hover color (slightly darker)
-                            hover_color = self._darken_color(accent_color, 0.1)
-                            button.configure(hover_color=hover_color)
+                            button.configure(fg_color=accent_color, hover_color=hover_color)
                     except Exception as e:
-                        logging.debug(f"Could not apply color to {button_name}: {e}")
+                        logging.debug("Could not apply color to %s: %s", button_name, e)
                         pass  # Skip if button doesn't exist or can't be configured
             
             # Apply to other colored elements
@@ -10048,28 +10287,47 @@ ollama pull phi3:latest    # Balanced model
                         pass  # Skip if element doesn't support text_color
             
         except Exception as e:
-            logging.error(f"Error applying custom colors: {e}")
+            logging.error("Error applying custom colors: %s", e)
 
     def _darken_color(self, hex_color, factor):
         """Darken a hex color by a factor (0-1)"""
-        try:
-            # Remove # if present
-            hex_color = hex_color.lstrip('#')
-            
-            # Convert to RGB
-            r = int(hex_color[0:2], 16)
-            g = int(hex_color[2:4], 16)
-            b = int(hex_color[4:6], 16)
-            
-            # Darken
-            r = int(r * (1 - factor))
-            g = int(g * (1 - factor))
-            b = int(b * (1 - factor))
-            
-            # Convert back to hex
-            return f"#{r:02x}{g:02x}{b:02x}"
-        except:
-            return hex_color  # Return original if conversion fails
+        return _darken_color_cached(hex_color, factor)
+
+    def _font(self, size, weight="normal", family=None):
+        """Shared CTkFont for a (size, weight, family) triple, created on first use"""
+        key = (size, weight, family)
+        font = self._font_cache.get(key)
+        if font is None:
+            font = self._font_cache[key] = ctk.CTkFont(family=family, size=size, weight=weight)
+        return font
+
+    def _apply_theme(self):
+        """Apply accent color and fonts to the built widgets listed in THEMED_WIDGETS"""
+        accent_color = self.settings['accent_color']
+        hover_color = self._darken_color(accent_color, 0.1)
+        font_family = self.settings['font_family']
+        font_size = self.settings['font_size']
+        fonts = {
+            "large": self._font(font_size + 4, "bold", font_family),
+            "button": self._font(max(font_size - 1, 10), family=font_family),
+            "normal": self._font(font_size, family=font_family),
+        }
+
+        for name, color_type, font_type in self.THEMED_WIDGETS:
+            widget = getattr(self, name, None)
+            if widget is None:
+                continue  # Frame not built yet
+            try:
+                if color_type == "button":
+                    widget.configure(fg_color=accent_color, hover_color=hover_color)
+                elif color_type == "label":
+                    widget.configure(text_color=accent_color)
+                elif color_type == "progressbar":
+                    widget.configure(progress_color=accent_color)
+                if font_type is not None:
+                    widget.configure(font=fonts[font_type])
+            except Exception as e:
+                logging.debug("Could not apply theme to %s: %s", name, e)
 
     def _apply_color_to_widget(self, widget, widget_type="button"):
         """Apply current accent color to a single widget immediately"""
@@ -10091,7 +10349,7 @@ ollama pull phi3:latest    # Balanced model
                 widget.configure(border_color=accent_color)
                 
         except Exception as e:
-            logging.debug(f"Could not apply color to widget: {e}")
+            logging.debug("Could not apply color to widget: %s", e)
 
     def _apply_font_to_widget(self, widget, font_type="normal"):
         """Apply current font settings to a single widget immediately"""
@@ -10103,18 +10361,18 @@ ollama pull phi3:latest    # Balanced model
             font_size = self.settings['font_size']
             
             if font_type == "title":
-                custom_font = ctk.CTkFont(family=font_family, size=font_size + 8, weight="bold")
+                custom_font = self._font(font_size + 8, "bold", font_family)
             elif font_type == "large":
-                custom_font = ctk.CTkFont(family=font_family, size=font_size + 4, weight="bold")
+                custom_font = self._font(font_size + 4, "bold", font_family)
             elif font_type == "button":
-                custom_font = ctk.CTkFont(family=font_family, size=max(font_size - 1, 10))
+                custom_font = self._font(max(font_size - 1, 10), family=font_family)
             else:  # normal
-                custom_font = ctk.CTkFont(family=font_family, size=font_size)
+                custom_font = self._font(font_size, family=font_family)
                 
             widget.configure(font=custom_font)
                 
         except Exception as e:
-            logging.debug(f"Could not apply font to widget: {e}")
+            logging.debug("Could not apply font to widget: %s", e)
 
     def _apply_custom_fonts(self):
         """Apply custom font settings to all relevant widgets"""
@@ -10123,9 +10381,9 @@ ollama pull phi3:latest    # Balanced model
             font_size = self.settings['font_size']
             
             # Create the custom font
-            custom_font = ctk.CTkFont(family=font_family, size=font_size)
-            custom_font_large = ctk.CTkFont(family=font_family, size=font_size + 4, weight="bold")
-            custom_font_title = ctk.CTkFont(family=font_family, size=font_size + 8, weight="bold")
+            custom_font = self._font(font_size, family=font_family)
+            custom_font_large = self._font(font_size + 4, "bold", font_family)
+            custom_font_title = self._font(font_size + 8, "bold", font_family)
             
             # Apply to labels
             labels_to_update = [
@@ -10170,11 +10428,11 @@ ollama pull phi3:latest    # Balanced model
                             else:
                                 label.configure(font=custom_font_large)
                     except Exception as e:
-                        logging.debug(f"Could not apply font to {label_name}: {e}")
+                        logging.debug("Could not apply font to %s: %s", label_name, e)
                         pass  # Skip if label doesn't exist or can't be configured
             
             # Apply to buttons (smaller font)
-            custom_font_button = ctk.CTkFont(family=font_family, size=max(font_size - 1, 10))
+            custom_font_button = self._font(max(font_size - 1, 10), family=font_family)
             
             buttons_to_update = [
                 'tools_guide_button',
@@ -10237,11 +10495,11 @@ ollama pull phi3:latest    # Balanced model
                         if button is not None:
                             button.configure(font=custom_font_button)
                     except Exception as e:
-                        logging.debug(f"Could not apply font to {button_name}: {e}")
+                        logging.debug("Could not apply font to %s: %s", button_name, e)
                         pass  # Skip if button doesn't exist or can't be configured
             
         except Exception as e:
-            logging.error(f"Error applying custom fonts: {e}")
+            logging.error("Error applying custom fonts: %s", e)
 
     def _reset_settings(self):
         """Reset settings to default"""
@@ -10260,6 +10518,8 @@ ollama pull phi3:latest    # Balanced model
         
         # Apply the reset settings
         ctk.set_appearance_mode(self.settings['theme'])
+        self._custom_settings_applied = True
+        self._apply_theme()
         self._apply_custom_colors()
         self._apply_custom_fonts()
         
@@ -10285,6 +10545,7 @@ ollama pull phi3:latest    # Balanced model
                     
                     # Apply theme immediately
                     ctk.set_appearance_mode(self.settings['theme'])
+                    self._custom_settings_applied = True
                     
                     # Apply custom colors and fonts immediately and with delays
                     self._apply_custom_colors()
@@ -10299,7 +10560,7 @@ ollama pull phi3:latest    # Balanced model
                     self.after(1300, self._force_apply_fonts)
                     
         except Exception as e:
-            logging.error(f"Error loading settings: {e}")
+            logging.error("Error loading settings: %s", e)
 
     def save_settings(self):
         """Save settings to file"""
@@ -10316,21 +10577,31 @@ ollama pull phi3:latest    # Balanced model
                 config.write(configfile)
                 
         except Exception as e:
-            logging.error(f"Error saving settings: {e}")
+            logging.error("Error saving settings: %s", e)
 
     def on_closing(self):
         """Gestisce la chiusura dell'applicazione."""
         try:
+            # Annulla le fasi di avvio non ancora eseguite
+            if self._post_init_job is not None:
+                self.after_cancel(self._post_init_job)
+                self._post_init_job = None
+            if self._pending_frame_switch is not None:
+                self.after_cancel(self._pending_frame_switch)
+                self._pending_frame_switch = None
             # Ferma tutti i thread attivi
             self.stop_all_active_threads()
+            self._pool.shutdown(wait=False)  # cancel_futures richiede Python 3.9
             # Ferma gli aggiornamenti hardware
             self.stop_hardware_updates()
+            if getattr(self, 'hardware_monitor', None):
+                self.hardware_monitor.shutdown()
             # Ferma il monitoraggio degli strumenti
             if hasattr(self, 'tool_monitoring_active'):
                 self.stop_tool_monitoring()
             logging.info("Application closing - all threads stopped")
         except Exception as e:
-            logging.error(f"Error during application shutdown: {e}")
+            logging.error("Error during application shutdown: %s", e)
         
         self.quit()
 
@@ -10375,20 +10646,25 @@ ollama pull phi3:latest    # Balanced model
             # Percorso dell'icona personalizzata - usa app.ico
             icon_path = os.path.join(self.app_path, "app.ico")
             
+            # Icona già trovata a una chiamata precedente: niente nuove ricerche su disco
+            if self._icon_path is not None:
+                self.iconbitmap(self._icon_path)
             # Verifica se il file esiste
-            if os.path.exists(icon_path):
+            elif os.path.exists(icon_path):
                 # Imposta l'icona personalizzata
                 self.iconbitmap(icon_path)
-                logging.info(f"Icona personalizzata impostata: {icon_path}")
+                self._icon_path = icon_path
+                logging.info("Icona personalizzata impostata: %s", icon_path)
                     
             else:
                 # Prova anche nella cartella corrente
                 current_icon_path = "app.ico"
                 if os.path.exists(current_icon_path):
                     self.iconbitmap(current_icon_path)
-                    logging.info(f"Icona personalizzata impostata dalla cartella corrente: {current_icon_path}")
+                    self._icon_path = current_icon_path
+                    logging.info("Icona personalizzata impostata dalla cartella corrente: %s", current_icon_path)
                 else:
-                    logging.warning(f"Icona personalizzata non trovata: {icon_path} o {current_icon_path}")
+                    logging.warning("Icona personalizzata non trovata: %s o %s", icon_path, current_icon_path)
             
             # Forza il refresh dell'icona usando Windows API
             try:
@@ -10403,10 +10679,10 @@ ollama pull phi3:latest    # Balanced model
                 win32gui.UpdateWindow(hwnd)
                 logging.info("Icona forzata con Windows API")
             except Exception as api_error:
-                logging.error(f"Errore Windows API per icona: {api_error}")
+                logging.error("Errore Windows API per icona: %s", api_error)
             
         except Exception as e:
-            logging.error(f"Errore nell'impostazione dell'icona: {e}")
+            logging.error("Errore nell'impostazione dell'icona: %s", e)
 
     def set_window_icon(self, window):
         """Imposta l'icona personalizzata su una finestra specifica."""